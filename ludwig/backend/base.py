@@ -18,6 +18,7 @@
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 
+from ludwig.constants import NAME, NPY, PREPROCESSING
 from ludwig.data.cache.manager import CacheManager
 from ludwig.data.dataframe.pandas import PANDAS
 from ludwig.data.dataset import create_dataset_manager
@@ -89,7 +90,12 @@ class LocalPreprocessingMixin:
         return True
 
     def check_lazy_load_supported(self, feature):
-        pass
+        if self.cache.data_format == NPY and \
+                not feature[PREPROCESSING]['in_memory']:
+            raise ValueError(
+                f'The {NPY} cache format is already memory mapped and does not '
+                f'support lazy loading of data files at train time. '
+                f'Set preprocessing config `in_memory: True` for feature {feature[NAME]}')
 
 
 class LocalTrainingMixin:
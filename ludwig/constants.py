@@ -133,6 +133,7 @@ PROC_COLUMN = "proc_column"
 CHECKSUM = "checksum"
 
 HDF5 = "hdf5"
+NPY = "npy"
 PARQUET = "parquet"
 TFRECORD = "tfrecord"
 
@@ -0,0 +1,138 @@
+#! /usr/bin/env python
+# coding=utf-8
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import contextlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from ludwig.data.batcher.base import Batcher
+
+
+class PrefetchBatcher(Batcher):
+    """Wraps another batcher and assembles up to `queue_size` batches ahead
+    of the consumer using a pool of `num_workers` threads.
+
+    Batches are returned in exactly the order the wrapped batcher would
+    return them. Batchers that expose `next_indices()` and
+    `get_batch(indices)` (like `RandomAccessBatcher`) only reserve their
+    indices sequentially and gather the data in parallel, every other
+    batcher is advanced one batch at a time by the workers.
+    """
+
+    def __init__(self, batcher, queue_size=2, num_workers=1):
+        self.batcher = batcher
+        self.queue_size = max(queue_size, 1)
+        self.num_workers = max(num_workers, 1)
+        self.step = 0
+
+        self._split_gather = (hasattr(batcher, 'next_indices') and
+                              hasattr(batcher, 'get_batch'))
+        self._executor = ThreadPoolExecutor(max_workers=self.num_workers)
+        self._futures = deque()
+        self._cond = threading.Condition()
+        self._submitted = 0
+        self._reserved = 0
+
+    @property
+    def batch_size(self):
+        return self.batcher.batch_size
+
+    @batch_size.setter
+    def batch_size(self, batch_size):
+        # the trainer may change the batch size at the beginning of an epoch,
+        # so make sure no batch has been assembled with the old size
+        self._drain()
+        self.batcher.batch_size = batch_size
+
+    @property
+    def steps_per_epoch(self):
+        return self.batcher.steps_per_epoch
+
+    def next_batch(self):
+        if self.last_batch():
+            raise StopIteration()
+
+        batch = self._futures.popleft().result()
+        self.step += 1
+        self._fill()
+        return batch
+
+    def last_batch(self):
+        self._fill()
+        # a batch is only known to be the last one once every batch
+        # reserved before it has been assembled
+        return self._futures[0].result() is None
+
+    def set_epoch(self, epoch):
+        self._drain()
+        self.step = 0
+        self.batcher.set_epoch(epoch)
+
+    def close(self):
+        self._drain()
+        self._executor.shutdown(wait=True)
+
+    def _fill(self):
+        while len(self._futures) < self.queue_size:
+            if self._futures and self._futures[-1].done() and \
+                    self._futures[-1].result() is None:
+                # the wrapped batcher is exhausted for this epoch
+                break
+            self._futures.append(
+                self._executor.submit(self._load, self._submitted)
+            )
+            self._submitted += 1
+
+    def _load(self, ticket):
+        # Tickets are handed out in submission order, and the executor starts
+        # tasks in the same order, so waiting for our turn cannot deadlock.
+        with self._cond:
+            self._cond.wait_for(lambda: self._reserved == ticket)
+            try:
+                if self.batcher.last_batch():
+                    return None
+                if not self._split_gather:
+                    return self.batcher.next_batch()
+                indices = self.batcher.next_indices()
+            finally:
+                self._reserved += 1
+                self._cond.notify_all()
+        return self.batcher.get_batch(indices)
+
+    def _drain(self):
+        # Pending tasks are not cancelled, as a later ticket may already be
+        # waiting on an earlier one. Waiting is cheap once the wrapped
+        # batcher is exhausted, which is the common case at epoch boundaries.
+        while self._futures:
+            self._futures.popleft().exception()
+
+
+@contextlib.contextmanager
+def prefetch_batches(batcher, queue_size=0, num_workers=1):
+    """Yields `batcher` wrapped in a `PrefetchBatcher` when `queue_size` is
+    greater than zero, and the batcher itself otherwise."""
+    if queue_size <= 0:
+        yield batcher
+        return
+
+    prefetch_batcher = PrefetchBatcher(batcher,
+                                       queue_size=queue_size,
+                                       num_workers=num_workers)
+    try:
+        yield prefetch_batcher
+    finally:
+        prefetch_batcher.close()
@@ -26,7 +26,7 @@ class RandomAccessBatcher(Batcher):
         # store our dataset as well
         self.dataset = dataset
         self.sampler = sampler
-        self.sample_it = iter(self.sampler)
+        self.indices = self.sampler.get_indices()
 
         self.ignore_last = ignore_last
         self.batch_size = batch_size
@@ -40,22 +40,24 @@ class RandomAccessBatcher(Batcher):
         if self.last_batch():
             raise StopIteration()
 
-        indices = []
-        for _ in range(self.batch_size):
-            try:
-                indices.append(next(self.sample_it))
-                self.index += 1
-            except StopIteration:
-                break
+        return self.get_batch(self.next_indices())
 
+    def next_indices(self):
+        """Advances the batcher by one batch and returns the sample indices
+        that make it up, without gathering any data."""
+        indices = self.indices[self.index:self.index + self.batch_size]
+        self.index += len(indices)
+
+        self.step += 1
+        return indices
+
+    def get_batch(self, indices):
         sub_batch = {}
         for features_name in self.dataset.features:
             sub_batch[features_name] = self.dataset.get(
                 features_name,
                 indices
             )
-
-        self.step += 1
         return sub_batch
 
     def last_batch(self):
@@ -67,4 +69,4 @@ class RandomAccessBatcher(Batcher):
         self.index = 0
         self.step = 0
         self.sampler.set_epoch(epoch)
-        self.sample_it = iter(self.sampler)
+        self.indices = self.sampler.get_indices()
@@ -4,13 +4,25 @@ import re
 import uuid
 from pathlib import Path
 
+import numpy as np
+
 from ludwig.constants import CHECKSUM, META, TRAINING, TEST, VALIDATION
-from ludwig.data.cache.util import calculate_checksum
+from ludwig.data.cache.util import calculate_checksum, is_hashable_dataset
+from ludwig.data.dataframe.tensor import column_to_numpy
+from ludwig.globals import LUDWIG_VERSION
 from ludwig.utils import data_utils
-from ludwig.utils.fs_utils import path_exists, delete
+from ludwig.utils.fs_utils import delete, get_fs_and_path, makedirs, \
+    open_file, path_exists, rename
+from ludwig.utils.misc_utils import hash_dict
 
 logger = logging.getLogger(__name__)
 
+FEATURE_CACHE_DIR = 'ludwig_feature_cache'
+FILE_FEATURE_CACHE_DIR = 'ludwig_file_feature_cache'
+PROC_COLUMNS_KEY = 'proc_columns'
+# number of features whose processed columns are kept by a FeatureCache
+FEATURE_CACHE_MAX_ENTRIES = 64
+
 
 def alphanum(v):
     """Filters a string to only its alphanumeric characters."""
@@ -89,10 +101,193 @@ class DatasetCache:
 
         return training_set, test_set, validation_set, training_set_metadata
 
+    def put_chunks(self, chunks, training_set_metadata):
+        """Appends the processed chunks of a dataset to the cache.
+
+        `chunks` is an iterable of (training, test, validation) DataFrames,
+        any of which can be None. Returns the paths of the cached sets, None
+        for the ones without any row, and the metadata.
+        """
+        cache_dir = os.path.dirname(self.cache_map[META])
+        if cache_dir:
+            makedirs(cache_dir, exist_ok=True)
+
+        tags = (TRAINING, TEST, VALIDATION)
+        writers = {
+            tag: self.dataset_manager.create_writer(
+                self.cache_map[tag], training_set_metadata, tag
+            )
+            for tag in tags
+        }
+        written = set()
+        logger.info('Writing preprocessed dataset cache')
+        try:
+            for chunk in chunks:
+                for tag, data in zip(tags, chunk):
+                    if data is not None:
+                        writers[tag].write(data)
+                        written.add(tag)
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+        logger.info('Writing train set metadata')
+        data_utils.save_json(
+            self.cache_map[META],
+            training_set_metadata
+        )
+
+        return tuple(
+            self.cache_map[tag] if tag in written else None for tag in tags
+        ) + (training_set_metadata,)
+
     def delete(self):
         for fname in self.cache_map.values():
             if path_exists(fname):
-                delete(fname)
+                # some cache formats are stored as directories
+                delete(fname, recursive=True)
+
+
+class FeatureCache:
+    """Stores the processed columns and the metadata of single features,
+    keyed by the checksum computed by `calculate_feature_checksum`.
+
+    Only the `max_entries` most recently used entries are kept, so that the
+    cache does not grow with every change of the preprocessing parameters.
+    """
+
+    def __init__(self, cache_dir, max_entries=FEATURE_CACHE_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+
+    def get(self, key):
+        metadata_fp, data_fp = self.get_cache_paths(key)
+        try:
+            feature_metadata = data_utils.load_json(metadata_fp)
+            with open_file(data_fp, 'rb') as f:
+                with np.load(f, allow_pickle=False) as data:
+                    proc_cols = {
+                        column: data[column]
+                        for column in feature_metadata[PROC_COLUMNS_KEY]
+                    }
+        except FileNotFoundError:
+            # missing or evicted in the meantime
+            return None
+        del feature_metadata[PROC_COLUMNS_KEY]
+        self._touch(metadata_fp)
+        return feature_metadata, proc_cols
+
+    def put(self, key, feature_metadata, proc_cols):
+        metadata_fp, data_fp = self.get_cache_paths(key)
+        try:
+            numpy_cols = {
+                column: column_to_numpy(values)
+                for column, values in proc_cols.items()
+            }
+            if any(values.dtype == object for values in numpy_cols.values()):
+                raise ValueError('object columns cannot be cached')
+        except ValueError:
+            # ragged or non numeric data, like rows dropped
+            # by the DROP_ROW missing value strategy
+            logger.debug(f'Processed columns of {key} cannot be cached')
+            return
+
+        makedirs(self.cache_dir, exist_ok=True)
+        # both files are written to temporary files and renamed, so that
+        # concurrent readers never see them partially written, and the
+        # metadata is renamed last, as its presence marks a complete entry
+        tmp_suffix = f'.{uuid.uuid4().hex}.tmp'
+        with open_file(data_fp + tmp_suffix, 'wb') as f:
+            np.savez(f, **numpy_cols)
+        data_utils.save_json(metadata_fp + tmp_suffix, {
+            **feature_metadata,
+            PROC_COLUMNS_KEY: list(numpy_cols.keys()),
+        })
+        rename(data_fp + tmp_suffix, data_fp)
+        rename(metadata_fp + tmp_suffix, metadata_fp)
+        self._evict()
+
+    def get_cache_paths(self, key):
+        stem = os.path.join(self.cache_dir, alphanum(key))
+        return f'{stem}.meta.json', f'{stem}.npz'
+
+    def _touch(self, fp):
+        fs, path = get_fs_and_path(fp)
+        try:
+            fs.touch(path, truncate=False)
+        except (NotImplementedError, ValueError):
+            # the entries of file systems that cannot update modification
+            # times are evicted by age instead
+            pass
+
+    def _evict(self):
+        fs, path = get_fs_and_path(self.cache_dir)
+        entries = [
+            info for info in fs.ls(path, detail=True)
+            if info['name'].endswith('.meta.json')
+        ]
+        if len(entries) <= self.max_entries:
+            return
+
+        # the modification time of the metadata is the time of the last use
+        entries.sort(key=lambda info: info.get(
+            'mtime', info.get('LastModified', 0)
+        ))
+        for info in entries[:len(entries) - self.max_entries]:
+            stem = info['name'][:-len('.meta.json')]
+            for fp in (f'{stem}.meta.json', f'{stem}.npz'):
+                try:
+                    fs.rm(fp)
+                except FileNotFoundError:
+                    # evicted by a concurrent writer
+                    pass
+
+
+class FileFeatureCache:
+    """Stores the arrays computed from single files, like the spectrograms of
+    audio files, keyed by the path, size and modification time of each file
+    and by the parameters of the computation. Entries are reused across
+    datasets and configs for as long as the file does not change."""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def get_key(self, filepath, params):
+        """Returns the key of the arrays computed from the local file at
+        `filepath` with `params`, or None if the file cannot be found."""
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            # remote files have no cheap modification time to check
+            return None
+        return hash_dict({
+            'ludwig_version': LUDWIG_VERSION,
+            'path': os.path.abspath(filepath),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'params': params,
+        }, max_length=None).decode('ascii')
+
+    def get(self, key):
+        try:
+            with open_file(self.get_cache_path(key), 'rb') as f:
+                with np.load(f, allow_pickle=False) as data:
+                    return {name: data[name] for name in data.files}
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, arrays):
+        cache_fp = self.get_cache_path(key)
+        # written to a temporary file and renamed, so concurrent readers and
+        # writers of the same entry never see it partially written
+        tmp_fp = f'{cache_fp}.{uuid.uuid4().hex}.tmp'
+        makedirs(self.cache_dir, exist_ok=True)
+        with open_file(tmp_fp, 'wb') as f:
+            np.savez(f, **arrays)
+        rename(tmp_fp, cache_fp)
+
+    def get_cache_path(self, key):
+        return os.path.join(self.cache_dir, f'{alphanum(key)}.npz')
 
 
 class CacheManager:
@@ -121,11 +316,19 @@ class CacheManager:
             return DatasetCache(config, key, cache_map, self._dataset_manager)
 
     def get_cache_key(self, dataset, config):
-        if not isinstance(dataset, str):
-            # TODO(travis): could try hashing the in-memory dataset, but this is tricky for Dask
+        if not self.can_reuse(dataset):
             return str(uuid.uuid1())
         return calculate_checksum(dataset, config)
 
+    def can_reuse(self, dataset):
+        """Returns True if the caches of `dataset` can be found again by
+        later runs. The caches of files are stored next to them, while the
+        caches of in-memory datasets are only reused when a cache_dir is set,
+        instead of accumulating in the working directory."""
+        if isinstance(dataset, str):
+            return True
+        return self._cache_dir is not None and is_hashable_dataset(dataset)
+
     def get_cache_path(self, dataset, key, tag, ext=None):
         if not isinstance(dataset, str):
             dataset = None
@@ -149,6 +352,20 @@ class CacheManager:
             return '.'
         return self._cache_dir
 
+    def get_feature_cache(self, input_fname=None):
+        if input_fname is None and self._cache_dir is None:
+            return None
+        return FeatureCache(os.path.join(
+            self.get_cache_directory(input_fname), FEATURE_CACHE_DIR
+        ))
+
+    def get_file_feature_cache(self, input_fname=None):
+        if input_fname is None and self._cache_dir is None:
+            return None
+        return FileFeatureCache(os.path.join(
+            self.get_cache_directory(input_fname), FILE_FEATURE_CACHE_DIR
+        ))
+
     def can_cache(self, skip_save_processed_input):
         return self._dataset_manager.can_cache(skip_save_processed_input)
 
@@ -1,17 +1,28 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
 import ludwig
-from ludwig.constants import NAME, TYPE, PREPROCESSING
+from ludwig.constants import COLUMN, NAME, PROC_COLUMN, TYPE, PREPROCESSING
+from ludwig.utils.data_utils import DATAFRAME_FORMATS
 from ludwig.utils.fs_utils import checksum
 from ludwig.utils.misc_utils import hash_dict
 
 
+def is_hashable_dataset(dataset):
+    """Returns True if a stable checksum can be computed for `dataset`."""
+    return isinstance(dataset, str) or type(dataset) in DATAFRAME_FORMATS
+
+
 def calculate_checksum(original_dataset, config):
     features = config.get('input_features', []) + \
                config.get('output_features', []) + \
                config.get('features', [])
     info = {
         'ludwig_version': ludwig.globals.LUDWIG_VERSION,
-        'dataset_checksum': checksum(original_dataset),
-        'global_preprocessing': config['preprocessing'],
+        'dataset_checksum': dataset_checksum(original_dataset),
+        'global_preprocessing': config.get(PREPROCESSING, {}),
         'feature_names': [feature[NAME] for feature in features],
         'feature_types': [feature[TYPE] for feature in features],
         'feature_preprocessing': [
@@ -19,3 +30,82 @@ def calculate_checksum(original_dataset, config):
         ],
     }
     return hash_dict(info, max_length=None).decode('ascii')
+
+
+def calculate_feature_checksum(dataset_df, feature, preprocessing_parameters,
+                               src=None):
+    """Checksum of the processed columns of a single feature.
+
+    It only depends on the content of the feature input column, on the
+    preprocessing parameters resolved for the feature and on the location of
+    the dataset (used to resolve relative paths of image and audio files).
+    """
+    info = {
+        'ludwig_version': ludwig.globals.LUDWIG_VERSION,
+        'column_checksum': dataframe_checksum(dataset_df[[feature[COLUMN]]]),
+        'src': src,
+        'proc_column': feature[PROC_COLUMN],
+        'type': feature[TYPE],
+        'preprocessing': preprocessing_parameters,
+    }
+    return hash_dict(info, max_length=None).decode('ascii')
+
+
+def dataset_checksum(dataset):
+    if isinstance(dataset, str):
+        return checksum(dataset)
+    return dataframe_checksum(dataset)
+
+
+def dataframe_checksum(df):
+    """Fingerprints the content of a pandas or Dask DataFrame.
+
+    The checksum depends on the column names, dtypes, index and values of the
+    DataFrame, so identical DataFrames built in different processes share it.
+    Partitions of a Dask DataFrame are hashed in parallel without being
+    collected on the client.
+    """
+    if isinstance(df, pd.DataFrame):
+        partition_checksums = [_partition_checksum(df)]
+    else:
+        import dask
+        partition_checksums = dask.compute(*[
+            dask.delayed(_partition_checksum)(partition)
+            for partition in df.to_delayed()
+        ])
+
+    info = {
+        'columns': [str(column) for column in df.columns],
+        'dtypes': [str(dtype) for dtype in df.dtypes],
+        'partitions': list(partition_checksums),
+    }
+    return hash_dict(info, max_length=None).decode('ascii')
+
+
+def _partition_checksum(df):
+    h = hashlib.md5()
+    h.update(pd.util.hash_pandas_object(df.index).values.tobytes())
+    for column in df.columns:
+        try:
+            hashes = pd.util.hash_pandas_object(df[column], index=False)
+        except TypeError:
+            # unhashable values, like lists or arrays, are hashed from their
+            # content, as their string representation can be truncated
+            for value in df[column]:
+                _update_value_checksum(h, value)
+            continue
+        h.update(hashes.values.tobytes())
+    return h.hexdigest()
+
+
+def _update_value_checksum(h, value):
+    values = np.asarray(value)
+    h.update(f'{values.dtype}{values.shape}'.encode('utf-8'))
+    if values.dtype != object:
+        h.update(values.tobytes())
+    elif values.ndim == 0:
+        h.update(repr(value).encode('utf-8'))
+    else:
+        # ragged or mixed values
+        for item in values.reshape(-1):
+            _update_value_checksum(h, item)
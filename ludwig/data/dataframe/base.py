@@ -20,7 +20,7 @@ from abc import ABC, abstractmethod
 
 class DataFrameEngine(ABC):
     @abstractmethod
-    def df_like(self, df, proc_cols):
+    def df_like(self, df, proc_cols, drop_row_cols=()):
         raise NotImplementedError()
 
     @abstractmethod
@@ -35,6 +35,10 @@ class DataFrameEngine(ABC):
     def compute(self, data):
         raise NotImplementedError()
 
+    @abstractmethod
+    def compute_all(self, *data):
+        raise NotImplementedError()
+
     @abstractmethod
     def from_pandas(self, df):
         raise NotImplementedError()
@@ -51,6 +55,14 @@ class DataFrameEngine(ABC):
     def reduce_objects(self, series, reduce_fn):
         raise NotImplementedError()
 
+    @abstractmethod
+    def map_partitions(self, df, map_fn, meta=None):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def map_reduce_partitions(self, cols, map_fn, reduce_fn):
+        raise NotImplementedError()
+
     @abstractmethod
     def to_parquet(self, df, path):
         raise NotImplementedError()
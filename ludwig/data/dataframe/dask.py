@@ -21,25 +21,53 @@ import os
 import dask
 import dask.array as da
 import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+from dask.dataframe.extensions import make_array_nonempty
 from dask.diagnostics import ProgressBar
 
 from ludwig.constants import NAME, PROC_COLUMN
 from ludwig.data.dataset.parquet import ParquetDataset
 from ludwig.data.dataset.partitioned import PartitionedDataset
 from ludwig.data.dataframe.base import DataFrameEngine
+from ludwig.data.dataframe.tensor import TensorArray, TensorDtype
 from ludwig.utils.data_utils import DATA_PROCESSED_CACHE_DIR, DATASET_SPLIT_URL, DATA_TRAIN_HDF5_FP
 from ludwig.utils.fs_utils import makedirs, to_url
 from ludwig.utils.misc_utils import get_combined_features, get_proc_features
 from ludwig.data.dataframe.dask_df_utils import dask_to_tfrecords
 
 
-TMP_COLUMN = '__TMP_COLUMN__'
-
-
 def set_scheduler(scheduler):
     dask.config.set(scheduler=scheduler)
 
 
+@make_array_nonempty.register(TensorDtype)
+def _nonempty_tensor_array(dtype):
+    return TensorArray(np.zeros((2, 1), dtype=dtype.subtype))
+
+
+def _concat_proc_cols(df, *cols, names, drop_row_cols):
+    # The rows with missing values in the columns of `drop_row_cols` are
+    # dropped, including the ones already dropped from those columns
+    index = df.index
+    keep = np.ones(len(index), dtype=bool)
+    for name, col in zip(names, cols):
+        if name in drop_row_cols:
+            if col.index.equals(index):
+                keep &= col.notna().to_numpy()
+            else:
+                keep &= index.isin(col.index[col.notna().to_numpy()])
+
+    index = index[keep]
+    data = {}
+    for name, col in zip(names, cols):
+        if col.index.equals(df.index):
+            data[name] = col.array[keep]
+        else:
+            data[name] = col.reindex(index).array
+    return pd.DataFrame(data, index=index)
+
+
 class DaskEngine(DataFrameEngine):
     def __init__(self, parallelism=None, persist=False, **kwargs):
         self._parallelism = parallelism or multiprocessing.cpu_count()
@@ -48,15 +76,29 @@ class DaskEngine(DataFrameEngine):
     def set_parallelism(self, parallelism):
         self._parallelism = parallelism
 
-    def df_like(self, df, proc_cols):
-        # Our goal is to preserve the index of the input dataframe but to drop
-        # all its columns. Because to_frame() creates a column from the index,
-        # we need to drop it immediately following creation.
-        dataset = df.index.to_frame(name=TMP_COLUMN).drop(columns=[TMP_COLUMN])
-        # TODO: address if following results in fragmented DataFrame
-        for k, v in proc_cols.items():
-            dataset[k] = v
-        return dataset
+    def df_like(self, df, proc_cols, drop_row_cols=()):
+        # The processed columns of each partition are put together in a
+        # single task, instead of being assigned one at a time, which would
+        # make the depth of the graph grow with the number of columns.
+        # The processed columns are partitioned like the input dataframe,
+        # whose index is preserved.
+        names = list(proc_cols)
+        cols = [
+            dd.from_dask_array(col, index=df.index)
+            if isinstance(col, da.Array) else col
+            for col in proc_cols.values()
+        ]
+        meta = pd.DataFrame({
+            name: col._meta for name, col in zip(names, cols)
+        }, index=df._meta.index)
+        return dd.map_partitions(
+            _concat_proc_cols,
+            df,
+            *cols,
+            names=names,
+            drop_row_cols=set(drop_row_cols),
+            meta=meta
+        )
 
     def parallelize(self, data):
         return data.repartition(self.parallelism)
@@ -67,6 +109,11 @@ class DaskEngine(DataFrameEngine):
     def compute(self, data):
         return data.compute()
 
+    def compute_all(self, *data):
+        # a single execution of the graph, which shares the tasks the
+        # collections have in common
+        return dask.compute(*data)
+
     def from_pandas(self, df):
         return dd.from_pandas(df, npartitions=self.parallelism)
 
@@ -81,6 +128,27 @@ class DaskEngine(DataFrameEngine):
     def reduce_objects(self, series, reduce_fn):
         return series.reduction(reduce_fn, aggregate=reduce_fn, meta=('data', 'object')).compute()[0]
 
+    def map_partitions(self, df, map_fn, meta=None):
+        # map_fn receives the position of each partition as `partition_info`
+        return df.map_partitions(map_fn, meta=meta)
+
+    def map_reduce_partitions(self, cols, map_fn, reduce_fn):
+        # map_fn receives a dict with the pandas partitions of the series in
+        # `cols`, which must be partitioned alike, and its results are
+        # reduced pairwise, so that nothing else is gathered in one place
+        names = list(cols)
+        results = [
+            dask.delayed(map_fn)(dict(zip(names, partitions)))
+            for partitions in zip(*(cols[name].to_delayed() for name in names))
+        ]
+        while len(results) > 1:
+            pairs = [results[i:i + 2] for i in range(0, len(results), 2)]
+            results = [
+                dask.delayed(reduce_fn)(*pair) if len(pair) == 2 else pair[0]
+                for pair in pairs
+            ]
+        return results[0].compute()
+
     def to_parquet(self, df, path):
         with ProgressBar():
             df.to_parquet(
@@ -30,9 +30,12 @@ class PandasEngine(DataFrameEngine):
     def __init__(self, **kwargs):
         super().__init__()
 
-    def df_like(self, df, proc_cols):
+    def df_like(self, df, proc_cols, drop_row_cols=()):
         # df argument unused for pandas, which can instantiate df directly
-        return pd.DataFrame(proc_cols)
+        dataset = pd.DataFrame(proc_cols)
+        if drop_row_cols:
+            dataset = dataset.dropna(subset=list(drop_row_cols))
+        return dataset
 
     def parallelize(self, data):
         return data
@@ -43,6 +46,9 @@ class PandasEngine(DataFrameEngine):
     def compute(self, data):
         return data
 
+    def compute_all(self, *data):
+        return data
+
     def from_pandas(self, df):
         return df
 
@@ -55,6 +61,12 @@ class PandasEngine(DataFrameEngine):
     def reduce_objects(self, series, reduce_fn):
         return reduce_fn(series)
 
+    def map_partitions(self, df, map_fn, meta=None):
+        return map_fn(df, partition_info={'number': 0, 'division': None})
+
+    def map_reduce_partitions(self, cols, map_fn, reduce_fn):
+        return map_fn(cols)
+
     def to_parquet(self, df, path):
         df.to_parquet(path, engine='pyarrow')
 
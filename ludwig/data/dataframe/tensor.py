@@ -0,0 +1,341 @@
+#! /usr/bin/env python
+# coding=utf-8
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Columns of multi-dimensional values, like padded sequences or images.
+
+A tensor column stores all its rows in a single contiguous array, instead of
+an object column holding an array per row. Selecting rows, like splitting or
+dropping the rows with missing values, only keeps the positions of the rows
+in the array, which are gathered once when the column is converted back to
+an array with `column_to_numpy`. Accessing a single row returns a view of
+it, so the columns can still be mapped row by row like object columns.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (ExtensionArray, ExtensionDtype,
+                                   register_extension_dtype)
+from pandas.api.indexers import check_array_indexer
+from pandas.api.types import is_integer, is_list_like, pandas_dtype
+
+
+@register_extension_dtype
+class TensorDtype(ExtensionDtype):
+    """The dtype of the tensor columns whose values are of `subtype`."""
+
+    type = np.ndarray
+    kind = 'O'
+    na_value = None
+    _metadata = ('subtype',)
+    _match = re.compile(r'^tensor\[(?P<subtype>.+)\]$')
+
+    def __init__(self, subtype=np.float64):
+        self.subtype = np.dtype(subtype)
+
+    @property
+    def name(self):
+        return 'tensor[{}]'.format(self.subtype.name)
+
+    @classmethod
+    def construct_from_string(cls, string):
+        if not isinstance(string, str):
+            raise TypeError(
+                "'construct_from_string' expects a string, got {}".format(
+                    type(string)
+                )
+            )
+        match = cls._match.match(string)
+        if match is None:
+            raise TypeError(
+                "Cannot construct a 'TensorDtype' from '{}'".format(string)
+            )
+        return cls(match.group('subtype'))
+
+    @classmethod
+    def construct_array_type(cls):
+        return TensorArray
+
+
+class TensorArray(ExtensionArray):
+    """The rows of `tensor`, an array of shape (num_rows, ...), in the order
+    of `rows` when given, where -1 marks a missing row."""
+
+    def __init__(self, tensor, rows=None):
+        self._tensor = np.asarray(tensor)
+        self._rows = rows
+        self._dtype = TensorDtype(self._tensor.dtype)
+
+    @classmethod
+    def _from_sequence(cls, scalars, dtype=None, copy=False):
+        if isinstance(scalars, TensorArray):
+            return scalars.copy() if copy else scalars
+
+        subtype = None
+        if dtype is not None:
+            dtype = pandas_dtype(dtype)
+            subtype = dtype.subtype if isinstance(dtype, TensorDtype) \
+                else dtype
+        values = list(scalars)
+        present = [value is not None for value in values]
+        if not any(present):
+            return cls(
+                np.zeros((0, 0), dtype=subtype or np.float64),
+                np.full(len(values), -1, dtype=np.int64) if values else None
+            )
+
+        tensor = np.stack([
+            value for value, is_present in zip(values, present)
+            if is_present
+        ])
+        if subtype is not None:
+            tensor = tensor.astype(subtype, copy=False)
+        if all(present):
+            return cls(tensor)
+        rows = np.full(len(values), -1, dtype=np.int64)
+        rows[present] = np.arange(len(tensor))
+        return cls(tensor, rows)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        subtype = original.dtype.subtype
+        return cls._from_sequence(
+            [
+                np.frombuffer(value, dtype=subtype).reshape(original.row_shape)
+                if value is not None else None
+                for value in values
+            ],
+            dtype=original.dtype
+        )
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        to_concat = list(to_concat)
+        tensor = to_concat[0]._tensor
+        if all(array._tensor is tensor for array in to_concat):
+            return cls(tensor, np.concatenate([
+                array._positions() for array in to_concat
+            ]))
+        if all(array._rows is None for array in to_concat):
+            return cls(np.concatenate([
+                array._tensor for array in to_concat if len(array)
+            ] or [tensor]))
+
+        tensors = []
+        rows = []
+        num_rows = 0
+        for array in to_concat:
+            positions = array._positions()
+            present = positions >= 0
+            tensors.append(array._tensor[positions[present]])
+            array_rows = np.full(len(positions), -1, dtype=np.int64)
+            array_rows[present] = num_rows + np.arange(present.sum())
+            rows.append(array_rows)
+            num_rows += len(tensors[-1])
+        return cls(
+            np.concatenate([t for t in tensors if len(t)] or [tensor[:0]]),
+            np.concatenate(rows)
+        )
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def nbytes(self):
+        nbytes = self._tensor.nbytes
+        if self._rows is not None:
+            nbytes += self._rows.nbytes
+        return nbytes
+
+    @property
+    def row_shape(self):
+        return self._tensor.shape[1:]
+
+    def __len__(self):
+        if self._rows is None:
+            return len(self._tensor)
+        return len(self._rows)
+
+    def __getitem__(self, item):
+        if is_integer(item):
+            if self._rows is None:
+                return self._tensor[item]
+            position = self._rows[item]
+            return self._tensor[position] if position >= 0 else None
+
+        item = check_array_indexer(self, item)
+        if self._rows is None and isinstance(item, slice):
+            return TensorArray(self._tensor[item])
+        return TensorArray(self._tensor, self._positions()[item])
+
+    def __array__(self, dtype=None):
+        # an object array with a view of every row, like the object columns
+        values = np.empty(len(self), dtype=object)
+        for i, position in enumerate(self._positions()):
+            values[i] = self._tensor[position] if position >= 0 else None
+        return values
+
+    def __eq__(self, other):
+        """Compares the column row by row with another column or list of
+        rows of the same length, or with every row when `other` is a single
+        row. Missing rows are never equal."""
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+
+        result = np.zeros(len(self), dtype=bool)
+        positions = self._positions()
+        present = positions >= 0
+        if isinstance(other, np.ndarray) and other.dtype != object and \
+                other.shape == self.row_shape:
+            result[present] = _rows_equal(
+                self._tensor[positions[present]], other
+            )
+            return result
+        if not is_list_like(other):
+            return result
+
+        if len(other) != len(self):
+            raise ValueError('Lengths must match to compare')
+        if isinstance(other, TensorArray) and \
+                other.row_shape == self.row_shape:
+            other_positions = other._positions()
+            both = present & (other_positions >= 0)
+            result[both] = _rows_equal(
+                self._tensor[positions[both]],
+                other._tensor[other_positions[both]]
+            )
+            return result
+        for i, (row, other_row) in enumerate(zip(self, other)):
+            result[i] = row is not None and other_row is not None and \
+                np.array_equal(row, other_row)
+        return result
+
+    def _values_for_factorize(self):
+        # the bytes of the rows, which are hashable unlike the rows
+        values = np.empty(len(self), dtype=object)
+        for i, position in enumerate(self._positions()):
+            if position >= 0:
+                values[i] = self._tensor[position].tobytes()
+        return values, None
+
+    def value_counts(self, dropna=True):
+        codes, uniques = self.factorize()
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        values = np.asarray(uniques)
+        if not dropna and (codes < 0).any():
+            counts = np.append(counts, (codes < 0).sum())
+            values = np.append(values, np.array([None], dtype=object))
+        return pd.Series(counts, index=pd.Index(values, dtype=object))
+
+    def _positions(self):
+        if self._rows is None:
+            return np.arange(len(self._tensor))
+        return self._rows
+
+    def isna(self):
+        if self._rows is None:
+            return np.zeros(len(self), dtype=bool)
+        return self._rows < 0
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        indices = np.asarray(indices, dtype=np.int64)
+        positions = self._positions()
+        if not allow_fill:
+            return TensorArray(self._tensor, positions.take(indices))
+
+        if fill_value is not None and not pd.isna(fill_value):
+            raise ValueError('Tensor columns can only be filled with None')
+        if (indices < -1).any():
+            raise ValueError('Invalid value in indices, must be all >= -1')
+        rows = np.full(len(indices), -1, dtype=np.int64)
+        present = indices >= 0
+        rows[present] = positions.take(indices[present])
+        return TensorArray(self._tensor, rows)
+
+    def copy(self):
+        # the tensor is never modified, so it is shared like the rows of the
+        # copies of object columns
+        rows = self._rows.copy() if self._rows is not None else None
+        return TensorArray(self._tensor, rows)
+
+    def astype(self, dtype, copy=True):
+        dtype = pandas_dtype(dtype)
+        if isinstance(dtype, TensorDtype):
+            if dtype == self.dtype:
+                return self.copy() if copy else self
+            return TensorArray(self._tensor.astype(dtype.subtype), self._rows)
+        return super().astype(dtype, copy=copy)
+
+    def __arrow_array__(self, type=None):
+        import pyarrow as pa
+
+        # the rows are converted to (nested) lists, all at once
+        tensor = self.to_tensor()
+        array = pa.array(tensor.reshape(-1))
+        for size in reversed(tensor.shape[1:]):
+            num_lists = len(array) // size if size else 0
+            offsets = np.arange(num_lists + 1, dtype=np.int32) * size
+            array = pa.ListArray.from_arrays(pa.array(offsets), array)
+        if type is not None and array.type != type:
+            array = array.cast(type)
+        return array
+
+    def to_tensor(self):
+        """Returns the rows as an array of shape (num_rows, ...), which is
+        the array of the column itself when no rows were selected."""
+        if self._rows is None:
+            return self._tensor
+        if len(self._rows) and self._rows.min() < 0:
+            raise ValueError('Tensor column has missing rows')
+        start = self._rows[0] if len(self._rows) else 0
+        if np.array_equal(self._rows,
+                          np.arange(start, start + len(self._rows))):
+            return self._tensor[start:start + len(self._rows)]
+        return self._tensor[self._rows]
+
+    def reshape_rows(self, shape):
+        """Returns the column with every row reshaped to `shape`."""
+        tensor = self.to_tensor()
+        return TensorArray(tensor.reshape((len(tensor),) + tuple(shape)))
+
+
+def _rows_equal(rows, other):
+    equal = rows == other
+    return np.all(equal, axis=tuple(range(1, equal.ndim)))
+
+
+def column_to_numpy(column):
+    """Returns the values of a column, or of an array or list of values, as
+    an array with a row per value: the tensor of a tensor column, the values
+    of a column of scalars, or the stacked rows of an object column."""
+    values = getattr(column, 'array', column)
+    if isinstance(values, TensorArray):
+        return values.to_tensor()
+    values = np.asarray(values)
+    if values.dtype != object:
+        return values
+    return np.stack(values)
+
+
+def flatten_rows(column, partition_info=None):
+    """Returns the column with every row flattened to one dimension. Can be
+    mapped over the partitions of a column with `map_partitions`."""
+    values = column.array
+    if isinstance(values, TensorArray):
+        return pd.Series(values.reshape_rows((-1,)), index=column.index,
+                         name=column.name)
+    return column.map(lambda x: np.asarray(x).reshape(-1))
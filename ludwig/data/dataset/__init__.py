@@ -15,6 +15,7 @@
 # limitations under the License.
 # ==============================================================================
 
+from ludwig.data.dataset.npy import NpyDatasetManager
 from ludwig.data.dataset.pandas import PandasDatasetManager
 from ludwig.data.dataset.parquet import ParquetDatasetManager
 from ludwig.data.dataset.tfrecord import TFRecordDatasetManager
@@ -22,6 +23,7 @@ from ludwig.data.dataset.tfrecord import TFRecordDatasetManager
 dataset_registry = {
     'parquet': ParquetDatasetManager,
     'hdf5': PandasDatasetManager,
+    'npy': NpyDatasetManager,
     'tfrecord': TFRecordDatasetManager,
     None: PandasDatasetManager,
 }
@@ -0,0 +1,157 @@
+#! /usr/bin/env python
+# coding=utf-8
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import threading
+from collections import OrderedDict
+
+import fsspec
+import h5py
+import numpy as np
+from fsspec.core import split_protocol
+
+from ludwig.utils.fs_utils import get_fs_and_path
+
+DEFAULT_CACHE_SIZE_MB = 256
+
+# block size used when streaming an HDF5 file from a remote filesystem
+REMOTE_BLOCK_SIZE = 16 * 1024 * 1024
+
+
+class HDF5ChunkReader:
+    """Reads rows of datasets stored in an HDF5 file, keeping the file open
+    across calls.
+
+    Reads are aligned to the chunks of the HDF5 dataset (or to single rows
+    for contiguous datasets), and the most recently used chunks are kept in
+    an LRU cache bounded by `cache_size_mb`. The file is opened lazily in
+    each process that uses the reader, so the reader can be pickled and
+    sent to (or forked into) other workers, like horovod ranks. Files on a
+    remote filesystem are streamed in blocks instead of being downloaded.
+    """
+
+    def __init__(self, url, cache_size_mb=DEFAULT_CACHE_SIZE_MB):
+        self.url = url
+        self.cache_size = int(cache_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pid = None
+        self._remote_file = None
+        self._h5_file = None
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+
+    def read(self, dataset_name, idx):
+        """Returns the rows at positions `idx` of dataset `dataset_name`, in
+        the order given by `idx`."""
+        idx = np.asarray(idx, dtype=np.int64)
+        with self._lock:
+            dataset = self._get_file()[dataset_name]
+            chunk_rows = self._chunk_rows(dataset)
+
+            data = np.empty((len(idx),) + dataset.shape[1:],
+                            dtype=dataset.dtype)
+            chunk_ids = idx // chunk_rows
+            unique_chunk_ids = np.unique(chunk_ids)
+            chunks = self._get_chunks(dataset_name, dataset, chunk_rows,
+                                      unique_chunk_ids)
+            for chunk_id, chunk in zip(unique_chunk_ids, chunks):
+                mask = chunk_ids == chunk_id
+                data[mask] = chunk[idx[mask] - chunk_id * chunk_rows]
+            return data
+
+    def close(self):
+        with self._lock:
+            if self._h5_file is not None:
+                self._h5_file.close()
+            if self._remote_file is not None:
+                self._remote_file.close()
+            self._reset()
+
+    def _get_file(self):
+        if self._pid != os.getpid():
+            # handles inherited from a parent process cannot be reused
+            self._reset()
+            self._pid = os.getpid()
+
+        if self._h5_file is None:
+            protocol, _ = split_protocol(self.url)
+            if protocol is None or protocol == 'file':
+                self._h5_file = h5py.File(fsspec.open_local(self.url), 'r')
+            else:
+                fs, path = get_fs_and_path(self.url)
+                self._remote_file = fs.open(path, 'rb',
+                                            block_size=REMOTE_BLOCK_SIZE)
+                self._h5_file = h5py.File(self._remote_file, 'r')
+        return self._h5_file
+
+    @staticmethod
+    def _chunk_rows(dataset):
+        if dataset.chunks is None:
+            # contiguous datasets can be read one row at a time at no
+            # extra cost, so avoid reading rows that were not requested
+            return 1
+        return dataset.chunks[0]
+
+    def _get_chunks(self, dataset_name, dataset, chunk_rows, chunk_ids):
+        chunks = [self._cache.get((dataset_name, chunk_id))
+                  for chunk_id in chunk_ids]
+        missing = [chunk_id for chunk_id, chunk in zip(chunk_ids, chunks)
+                   if chunk is None]
+
+        if missing:
+            if chunk_rows == 1:
+                # one selection for all the missing rows,
+                # h5py requires the row indices to be increasing
+                rows = dataset[np.asarray(missing)]
+                loaded = [rows[i:i + 1].copy() for i in range(len(rows))]
+            else:
+                loaded = [
+                    dataset[chunk_id * chunk_rows:
+                            (chunk_id + 1) * chunk_rows]
+                    for chunk_id in missing
+                ]
+            loaded = dict(zip(missing, loaded))
+            chunks = [loaded[chunk_id] if chunk is None else chunk
+                      for chunk_id, chunk in zip(chunk_ids, chunks)]
+
+        for chunk_id, chunk in zip(chunk_ids, chunks):
+            self._put(dataset_name, chunk_id, chunk)
+        return chunks
+
+    def _put(self, dataset_name, chunk_id, chunk):
+        key = (dataset_name, chunk_id)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return
+        if chunk.nbytes > self.cache_size:
+            return
+
+        self._cache[key] = chunk
+        self._cache_bytes += chunk.nbytes
+        while self._cache_bytes > self.cache_size:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= evicted.nbytes
+
+    def __getstate__(self):
+        return {'url': self.url, 'cache_size': self.cache_size}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._reset()
@@ -0,0 +1,62 @@
+#! /usr/bin/env python
+# coding=utf-8
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from ludwig.constants import NPY
+from ludwig.data.dataset.pandas import PandasDataset, PandasDatasetManager
+from ludwig.utils import data_utils
+from ludwig.utils.data_utils import DATA_TRAIN_HDF5_FP
+from ludwig.utils.misc_utils import get_proc_features
+
+
+class NpyDataset(PandasDataset):
+    """Dataset backed by the memory-mapped columns of an npy cache directory.
+
+    Rows are only read from disk when a batch is gathered, and the pages
+    of the cache are shared by every process that maps the same files.
+    """
+
+    def __init__(self, data_dir, features, data_hdf5_fp):
+        self.features = features
+        self.data_hdf5_fp = data_hdf5_fp
+        self.data_dir = data_dir
+        self.dataset = data_utils.load_npy(data_dir)
+        self.size = len(next(iter(self.dataset.values()))) \
+            if self.dataset else 0
+        self._hdf5_reader = None
+
+
+class NpyDatasetManager(PandasDatasetManager):
+    def create(self, dataset, config, training_set_metadata):
+        if not isinstance(dataset, str):
+            # the dataset has not been written to the cache
+            return super().create(dataset, config, training_set_metadata)
+
+        return NpyDataset(
+            dataset,
+            get_proc_features(config),
+            training_set_metadata.get(DATA_TRAIN_HDF5_FP)
+        )
+
+    def save(self, cache_path, dataset, config, training_set_metadata, tag):
+        data_utils.save_npy(cache_path, dataset)
+        return cache_path
+
+    def create_writer(self, cache_path, training_set_metadata, tag):
+        return data_utils.NpyWriter(cache_path)
+
+    @property
+    def data_format(self):
+        return NPY
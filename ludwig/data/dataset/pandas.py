@@ -21,10 +21,11 @@ import numpy as np
 from ludwig.constants import PREPROCESSING, TRAINING
 from ludwig.data.batcher.random_access import RandomAccessBatcher
 from ludwig.data.dataset.base import Dataset
+from ludwig.data.dataset.hdf5_reader import (DEFAULT_CACHE_SIZE_MB,
+                                             HDF5ChunkReader)
 from ludwig.data.sampler import DistributedSampler
 from ludwig.utils import data_utils
 from ludwig.utils.data_utils import to_numpy_dataset, DATA_TRAIN_HDF5_FP
-from ludwig.utils.fs_utils import download_h5
 from ludwig.utils.misc_utils import get_proc_features
 
 
@@ -34,6 +35,7 @@ class PandasDataset(Dataset):
         self.data_hdf5_fp = data_hdf5_fp
         self.size = len(dataset)
         self.dataset = to_numpy_dataset(dataset)
+        self._hdf5_reader = None
 
     def get(self, proc_column, idx=None):
         if idx is None:
@@ -46,18 +48,26 @@ class PandasDataset(Dataset):
         if self.features[proc_column][PREPROCESSING]['in_memory']:
             return self.dataset[proc_column][idx]
 
-        sub_batch = self.dataset[proc_column][idx]
-
-        indices = np.empty((3, len(sub_batch)), dtype=np.int64)
-        indices[0, :] = sub_batch
-        indices[1, :] = np.arange(len(sub_batch))
-        indices = indices[:, np.argsort(indices[0])]
+        return self.hdf5_reader.read(
+            proc_column + '_data',
+            self.dataset[proc_column][idx]
+        )
 
-        with download_h5(self.data_hdf5_fp) as h5_file:
-            im_data = h5_file[proc_column + '_data'][indices[0, :], :, :]
-        indices[2, :] = np.arange(len(sub_batch))
-        indices = indices[:, np.argsort(indices[1])]
-        return im_data[indices[2, :]]
+    @property
+    def hdf5_reader(self):
+        if self._hdf5_reader is None:
+            cache_size_mb = max(
+                feature[PREPROCESSING].get(
+                    'lazy_load_cache_mb', DEFAULT_CACHE_SIZE_MB
+                )
+                for feature in self.features.values()
+                if not feature.get(PREPROCESSING, {}).get('in_memory', True)
+            )
+            self._hdf5_reader = HDF5ChunkReader(
+                self.data_hdf5_fp,
+                cache_size_mb=cache_size_mb
+            )
+        return self._hdf5_reader
 
     def get_dataset(self):
         return self.dataset
@@ -105,6 +115,11 @@ class PandasDatasetManager(object):
             training_set_metadata[DATA_TRAIN_HDF5_FP] = cache_path
         return dataset
 
+    def create_writer(self, cache_path, training_set_metadata, tag):
+        if tag == TRAINING:
+            training_set_metadata[DATA_TRAIN_HDF5_FP] = cache_path
+        return data_utils.HDF5Writer(cache_path)
+
     def can_cache(self, skip_save_processed_input):
         return self.backend.is_coordinator() and \
                not skip_save_processed_input
@@ -27,6 +27,7 @@ from petastorm.tf_utils import make_petastorm_dataset
 
 from ludwig.constants import NAME, PROC_COLUMN
 from ludwig.data.batcher.iterable import IterableBatcher
+from ludwig.data.dataframe.tensor import flatten_rows
 from ludwig.data.dataset.base import Dataset
 from ludwig.utils.fs_utils import to_url
 from ludwig.utils.misc_utils import get_combined_features, get_proc_features
@@ -134,9 +135,10 @@ class ParquetDatasetManager(object):
             proc_column = feature[PROC_COLUMN]
             reshape = training_set_metadata[name].get('reshape')
             if reshape is not None:
-                dataset[proc_column] = self.backend.df_engine.map_objects(
+                dataset[proc_column] = self.backend.df_engine.map_partitions(
                     dataset[proc_column],
-                    lambda x: x.reshape(-1)
+                    flatten_rows,
+                    meta=(proc_column, dataset[proc_column].dtype)
                 )
 
         self.backend.df_engine.to_parquet(dataset, dataset_parquet_fp)
@@ -8,6 +8,7 @@ from distutils.version import LooseVersion
 import tensorflow as tf
 from ludwig.constants import NAME, PROC_COLUMN
 from ludwig.data.batcher.iterable import IterableBatcher
+from ludwig.data.dataframe.tensor import flatten_rows
 from ludwig.data.dataset.base import Dataset
 from ludwig.data.dataset.pandas import PandasDataset
 from ludwig.data.dataset.partitioned import PartitionedDataset
@@ -213,9 +214,11 @@ class TFRecordDatasetManager(object):
             proc_column = feature[PROC_COLUMN]
             reshape = training_set_metadata[name].get('reshape')
             if reshape:
-                dataset[proc_column] = self.backend.df_engine.map_objects(
+                dataset[proc_column] = self.backend.df_engine.map_partitions(
                     dataset[proc_column],
-                    lambda x: x.reshape(-1))
+                    flatten_rows,
+                    meta=(proc_column, dataset[proc_column].dtype)
+                )
         self.backend.df_engine.to_tfrecord(dataset, dataset_tfrecord_fp)
         return dataset_tfrecord_fp
 
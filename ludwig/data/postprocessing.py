@@ -21,6 +21,7 @@ import pandas as pd
 
 from ludwig.backend import LOCAL_BACKEND
 from ludwig.constants import BINARY
+from ludwig.data.dataframe.tensor import column_to_numpy
 from ludwig.features.feature_utils import SEQUENCE_TYPES
 from ludwig.utils.data_utils import DICT_FORMATS, DATAFRAME_FORMATS, \
     normalize_numpy, to_numpy_dataset
@@ -97,7 +98,7 @@ def convert_to_dict(
 
             values = predictions[key]
             try:
-                values = np.stack(values.to_numpy())
+                values = column_to_numpy(values)
             except ValueError:
                 values = values.to_list()
 
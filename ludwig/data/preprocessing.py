@@ -16,6 +16,8 @@
 # ==============================================================================
 import logging
 from abc import ABC, abstractmethod
+from collections import Counter
+from functools import partial
 
 import numpy as np
 import pandas as pd
@@ -23,11 +25,15 @@ import pandas as pd
 from ludwig.backend import LOCAL_BACKEND
 from ludwig.constants import *
 from ludwig.constants import TEXT
+from ludwig.data.cache.util import calculate_feature_checksum
 from ludwig.data.concatenate_datasets import concatenate_files, concatenate_df
+from ludwig.data.dataframe.tensor import TensorArray
 from ludwig.data.dataset.base import Dataset
 from ludwig.features.feature_registries import (base_type_registry,
                                                 input_type_registry)
 from ludwig.features.feature_utils import compute_feature_hash
+from ludwig.features.meta_accumulators import (NumericStatsAccumulator,
+                                               compute_numeric_stats)
 from ludwig.utils import data_utils
 from ludwig.utils.data_utils import (CACHEABLE_FORMATS, CSV_FORMATS,
                                      DATA_TRAIN_HDF5_FP,
@@ -35,7 +41,7 @@ from ludwig.utils.data_utils import (CACHEABLE_FORMATS, CSV_FORMATS,
                                      DICT_FORMATS, EXCEL_FORMATS,
                                      FEATHER_FORMATS, FWF_FORMATS,
                                      HDF5_FORMATS, HTML_FORMATS, JSON_FORMATS,
-                                     JSONL_FORMATS, ORC_FORMATS,
+                                     JSONL_FORMATS, NPY_FORMATS, ORC_FORMATS,
                                      PARQUET_FORMATS, PICKLE_FORMATS,
                                      SAS_FORMATS, SPSS_FORMATS, STATA_FORMATS,
                                      TFRECORD_FORMATS, TSV_FORMATS, figure_data_format,
@@ -48,9 +54,9 @@ from ludwig.utils.data_utils import (CACHEABLE_FORMATS, CSV_FORMATS,
 from ludwig.utils.data_utils import save_array, get_split_path
 from ludwig.utils.defaults import (default_preprocessing_parameters,
                                    default_random_seed)
-from ludwig.utils.fs_utils import path_exists
+from ludwig.utils.fs_utils import open_file, path_exists
 from ludwig.utils.misc_utils import (get_from_registry, merge_dict,
-                                     resolve_pointers, set_random_seed,
+                                     resolve_pointers,
                                      get_proc_features_from_lists)
 
 logger = logging.getLogger(__name__)
@@ -141,6 +147,7 @@ class DictPreprocessor(DataFormatPreprocessor):
             validation_set,
             test_set,
             training_set_metadata=training_set_metadata,
+            skip_save_processed_input=skip_save_processed_input,
             preprocessing_params=preprocessing_params,
             backend=backend,
             random_seed=random_seed
@@ -192,6 +199,7 @@ class DataFramePreprocessor(DataFormatPreprocessor):
             validation_set,
             test_set,
             training_set_metadata=training_set_metadata,
+            skip_save_processed_input=skip_save_processed_input,
             preprocessing_params=preprocessing_params,
             backend=backend,
             random_seed=random_seed
@@ -1019,6 +1027,61 @@ class HDF5Preprocessor(DataFormatPreprocessor):
         return training_set, test_set, validation_set, training_set_metadata
 
 
+class NpyPreprocessor(DataFormatPreprocessor):
+    @staticmethod
+    def preprocess_for_training(
+            features,
+            dataset=None,
+            training_set=None,
+            validation_set=None,
+            test_set=None,
+            training_set_metadata=None,
+            skip_save_processed_input=False,
+            preprocessing_params=default_preprocessing_parameters,
+            backend=LOCAL_BACKEND,
+            random_seed=default_random_seed
+    ):
+        return NpyPreprocessor.prepare_processed_data(
+            features,
+            dataset,
+            training_set,
+            validation_set,
+            test_set,
+            training_set_metadata,
+            skip_save_processed_input,
+            preprocessing_params,
+            backend,
+            random_seed
+        )
+
+    @staticmethod
+    def preprocess_for_prediction(
+            dataset,
+            features,
+            preprocessing_params,
+            training_set_metadata,
+            backend
+    ):
+        return dataset, training_set_metadata, None
+
+    @staticmethod
+    def prepare_processed_data(
+            features,
+            dataset=None,
+            training_set=None,
+            validation_set=None,
+            test_set=None,
+            training_set_metadata=None,
+            skip_save_processed_input=False,
+            preprocessing_params=default_preprocessing_parameters,
+            backend=LOCAL_BACKEND,
+            random_seed=default_random_seed
+    ):
+        test_set = test_set if test_set and path_exists(test_set) else None
+        validation_set = validation_set if validation_set and path_exists(validation_set) else None
+        return training_set, test_set, validation_set, training_set_metadata
+
+
 class TFRecordPreprocessor(DataFormatPreprocessor):
     @staticmethod
     def preprocess_for_training(
@@ -1092,9 +1155,17 @@ data_format_preprocessor_registry = {
     **{fmt: SPSSPreprocessor for fmt in SPSS_FORMATS},
     **{fmt: StataPreprocessor for fmt in STATA_FORMATS},
     **{fmt: HDF5Preprocessor for fmt in HDF5_FORMATS},
+    **{fmt: NpyPreprocessor for fmt in NPY_FORMATS},
     **{fmt: TFRecordPreprocessor for fmt in TFRECORD_FORMATS},
 }
 
+# readers of the formats that can be preprocessed in chunks
+chunked_read_fn_registry = {
+    **{fmt: read_csv for fmt in CSV_FORMATS},
+    **{fmt: read_tsv for fmt in TSV_FORMATS},
+    **{fmt: read_jsonl for fmt in JSONL_FORMATS},
+}
+
 
 def build_dataset(
         dataset_df,
@@ -1118,37 +1189,95 @@ def build_dataset(
     )
 
     # Get all the unique preprocessing features to compute
-    proc_features = []
-    feature_hashes = set()
-    for feature in features:
-        if PROC_COLUMN not in feature:
-            feature[PROC_COLUMN] = compute_feature_hash(feature)
-        if feature[PROC_COLUMN] not in feature_hashes:
-            proc_features.append(feature)
-            feature_hashes.add(feature[PROC_COLUMN])
+    proc_features = get_unique_proc_features(features)
+
+    # Features whose metadata is not provided can be loaded from the
+    # per-feature cache, which is keyed on the definition of each feature
+    feature_keys = {}
+    feature_cache = backend.cache.get_feature_cache(metadata.get(SRC))
+    if feature_cache is not None and not backend.df_engine.partitioned and \
+            backend.cache.can_cache(skip_save_processed_input):
+        feature_keys = get_feature_cache_keys(
+            dataset_df,
+            proc_features,
+            metadata,
+            global_preprocessing_parameters
+        )
+
+    proc_cols = {}
+    drop_row_cols = []
+    features_to_build = []
+    for feature in proc_features:
+        cached = None
+        if feature[PROC_COLUMN] in feature_keys:
+            cached = feature_cache.get(feature_keys[feature[PROC_COLUMN]])
+
+        if cached is not None:
+            logger.info(f'Using cached preprocessing for {feature[NAME]}')
+            metadata[feature[NAME]], feature_cols = cached
+            for column, values in feature_cols.items():
+                proc_cols[column] = pd.Series(
+                    TensorArray(values) if values.ndim > 1 else values,
+                    index=dataset_df.index
+                )
+            if drops_missing_rows(metadata[feature[NAME]]):
+                drop_row_cols.extend(feature_cols)
+        else:
+            features_to_build.append(feature)
 
     dataset_cols = cast_columns(
         dataset_df,
-        proc_features,
+        features_to_build,
         global_preprocessing_parameters,
         backend
     )
 
-    metadata = build_metadata(
-        metadata,
-        dataset_cols,
-        proc_features,
-        global_preprocessing_parameters,
-        backend
-    )
+    if backend.df_engine.partitioned:
+        # the metadata of all the features is built in a single scan
+        metadata = build_metadata(
+            metadata,
+            dataset_cols,
+            features_to_build,
+            global_preprocessing_parameters,
+            backend
+        )
+    else:
+        metadata = build_numeric_metadata(
+            metadata,
+            dataset_cols,
+            features_to_build,
+            global_preprocessing_parameters,
+            backend
+        )
 
-    proc_cols = build_data(
-        dataset_cols,
-        proc_features,
-        metadata,
-        backend,
-        skip_save_processed_input
-    )
+    for feature in features_to_build:
+        # The metadata of the other features is built right before their
+        # data: text, sequence, set and bag features keep the tokens of their
+        # column in their metadata for add_feature_data, which frees them
+        # before the next feature is tokenized.
+        metadata = build_metadata(
+            metadata,
+            dataset_cols,
+            [feature],
+            global_preprocessing_parameters,
+            backend
+        )
+        feature_cols = build_data(
+            dataset_cols,
+            [feature],
+            metadata,
+            backend,
+            skip_save_processed_input
+        )
+        if feature[PROC_COLUMN] in feature_keys:
+            feature_cache.put(
+                feature_keys[feature[PROC_COLUMN]],
+                metadata[feature[NAME]],
+                feature_cols
+            )
+        proc_cols.update(feature_cols)
+        if drops_missing_rows(metadata[feature[NAME]]):
+            drop_row_cols.extend(feature_cols)
 
     proc_cols[SPLIT] = get_split(
         dataset_df,
@@ -1161,16 +1290,60 @@ def build_dataset(
         random_seed=random_seed
     )
 
-    dataset = backend.df_engine.df_like(dataset_df, proc_cols)
-
-    # At this point, there should be no missing values left in the dataframe, unless
-    # the DROP_ROW preprocessing option was selected, in which case we need to drop those
-    # rows.
-    dataset = dataset.dropna()
+    # At this point, there should be no missing values left in the processed
+    # columns, except in the ones of the features whose missing value strategy
+    # drops the rows, which are dropped along with the processed dataframe.
+    dataset = backend.df_engine.df_like(dataset_df, proc_cols, drop_row_cols)
 
     return dataset, metadata
 
 
+def get_unique_proc_features(features):
+    """Returns the features with distinct processed columns, assigning
+    their processed column to the features that do not have one."""
+    proc_features = []
+    feature_hashes = set()
+    for feature in features:
+        if PROC_COLUMN not in feature:
+            feature[PROC_COLUMN] = compute_feature_hash(feature)
+        if feature[PROC_COLUMN] not in feature_hashes:
+            proc_features.append(feature)
+            feature_hashes.add(feature[PROC_COLUMN])
+    return proc_features
+
+
+def get_feature_cache_keys(dataset_df, features, metadata,
+                           global_preprocessing_parameters):
+    """Returns the per-feature cache keys of the features that can be cached,
+    indexed by their processed column."""
+    column_counts = Counter(feature[COLUMN] for feature in features)
+
+    feature_keys = {}
+    for feature in features:
+        if feature[NAME] in metadata:
+            # the metadata is provided by the caller
+            continue
+        if column_counts[feature[COLUMN]] > 1:
+            # features sharing an input column modify it for one another
+            continue
+
+        preprocessing_parameters = get_preprocessing_parameters(
+            feature,
+            global_preprocessing_parameters
+        )
+        if not preprocessing_parameters.get('in_memory', True):
+            # the data is stored in an external HDF5 file
+            continue
+
+        feature_keys[feature[PROC_COLUMN]] = calculate_feature_checksum(
+            dataset_df,
+            feature,
+            preprocessing_parameters,
+            metadata.get(SRC)
+        )
+    return feature_keys
+
+
 def cast_columns(dataset_df, features, global_preprocessing_parameters,
                  backend):
     # todo figure out if global_preprocessing_parameters is needed
@@ -1193,34 +1366,31 @@ def cast_columns(dataset_df, features, global_preprocessing_parameters,
 def build_metadata(
         metadata, dataset_cols, features, global_preprocessing_parameters, backend
 ):
+    if backend.df_engine.partitioned:
+        return build_metadata_in_partitions(
+            metadata,
+            dataset_cols,
+            features,
+            global_preprocessing_parameters,
+            backend
+        )
+
+    metadata = build_numeric_metadata(
+        metadata,
+        dataset_cols,
+        features,
+        global_preprocessing_parameters,
+        backend
+    )
+
     for feature in features:
         if feature[NAME] in metadata:
             continue
 
-        if PREPROCESSING in feature:
-            preprocessing_parameters = merge_dict(
-                global_preprocessing_parameters[feature[TYPE]],
-                feature[PREPROCESSING]
-            )
-        else:
-            preprocessing_parameters = global_preprocessing_parameters[
-                feature[TYPE]
-            ]
-
-        # deal with encoders that have fixed preprocessing
-        if 'encoder' in feature:
-            encoders_registry = get_from_registry(
-                feature[TYPE],
-                input_type_registry
-            ).encoder_registry
-            encoder_class = encoders_registry[feature['encoder']]
-            if hasattr(encoder_class, 'fixed_preprocessing_parameters'):
-                encoder_fpp = encoder_class.fixed_preprocessing_parameters
-
-                preprocessing_parameters = merge_dict(
-                    preprocessing_parameters,
-                    resolve_pointers(encoder_fpp, feature, 'feature.')
-                )
+        preprocessing_parameters = get_preprocessing_parameters(
+            feature,
+            global_preprocessing_parameters
+        )
 
         fill_value = precompute_fill_value(
             dataset_cols,
@@ -1260,6 +1430,327 @@ def build_metadata(
     return metadata
 
 
+def build_numeric_metadata(
+        metadata, dataset_cols, features, global_preprocessing_parameters, backend
+):
+    """Builds the metadata of the numerical features of `features` whose
+    metadata only depends on the statistics of their column, which are
+    computed for all of them at once. The metadata of the other features is
+    left to `build_metadata`."""
+    builders = {}
+    for feature in features:
+        if feature[NAME] in metadata:
+            continue
+        builders[feature[NAME]] = _FeatureMetaBuilder(
+            feature,
+            get_preprocessing_parameters(
+                feature,
+                global_preprocessing_parameters
+            ),
+            backend
+        )
+    stats_features = _get_stats_features(builders)
+    if not stats_features:
+        return metadata
+
+    builders = {name: builders[name] for name in stats_features}
+    _update_meta_builders(builders, dataset_cols, stats_features)
+    features_with_stats = [
+        feature for feature in features if feature[NAME] in builders
+    ]
+    _finalize_metadata(metadata, features_with_stats, builders)
+    for feature in features_with_stats:
+        handle_missing_values(
+            dataset_cols,
+            feature,
+            metadata[feature[NAME]][PREPROCESSING]
+        )
+    return metadata
+
+
+def build_metadata_in_chunks(
+        metadata, chunks, features, global_preprocessing_parameters, backend
+):
+    """Builds the metadata of the features like `build_metadata`, but
+    accumulating it over the chunks of the dataset, so that the whole
+    dataset never needs to be in memory."""
+    builders = {}
+    for feature in features:
+        if feature[NAME] in metadata:
+            continue
+        builders[feature[NAME]] = _FeatureMetaBuilder(
+            feature,
+            get_preprocessing_parameters(
+                feature,
+                global_preprocessing_parameters
+            ),
+            backend
+        )
+    features = [feature for feature in features if feature[NAME] in builders]
+    if not features:
+        return metadata
+
+    stats_features = _get_stats_features(builders)
+    for chunk in chunks:
+        dataset_cols = cast_columns(
+            chunk,
+            features,
+            global_preprocessing_parameters,
+            backend
+        )
+        _update_meta_builders(builders, dataset_cols, stats_features)
+
+    return _finalize_metadata(
+        metadata,
+        features,
+        builders,
+        global_preprocessing_parameters['chunk_size']
+    )
+
+
+def build_metadata_in_partitions(
+        metadata, dataset_cols, features, global_preprocessing_parameters, backend
+):
+    """Builds the metadata of the features like `build_metadata`, for
+    partitioned DataFrames: the metadata of all the features is accumulated
+    over every partition in a single scan of the dataset, and the
+    accumulators of the partitions are then merged together."""
+    features = [feature for feature in features if feature[NAME] not in metadata]
+    if not features:
+        return metadata
+
+    preprocessing_parameters = {}
+    for feature in features:
+        preprocessing_parameters[feature[NAME]] = get_preprocessing_parameters(
+            feature,
+            global_preprocessing_parameters
+        )
+        if preprocessing_parameters[feature[NAME]][
+            'missing_value_strategy'
+        ] in [BACKFILL, BFILL, PAD, FFILL]:
+            # the values are propagated across partitions before the scan
+            handle_missing_values(
+                dataset_cols,
+                feature,
+                preprocessing_parameters[feature[NAME]]
+            )
+
+    def build_partition_metadata(partition_cols):
+        builders = {
+            feature[NAME]: _FeatureMetaBuilder(
+                feature,
+                preprocessing_parameters[feature[NAME]],
+                LOCAL_BACKEND
+            )
+            for feature in features
+        }
+        _update_meta_builders(
+            builders,
+            partition_cols,
+            _get_stats_features(builders)
+        )
+        return builders
+
+    def merge_partition_metadata(builders, other_builders):
+        for name, builder in builders.items():
+            builder.merge(other_builders[name])
+        return builders
+
+    builders = backend.df_engine.map_reduce_partitions(
+        {feature[COLUMN]: dataset_cols[feature[COLUMN]] for feature in features},
+        build_partition_metadata,
+        merge_partition_metadata
+    )
+    return _finalize_metadata(metadata, features, builders)
+
+
+def _get_stats_features(builders):
+    """Returns the names of the numerical features whose metadata can be
+    built from the statistics of their column, which are computed for all
+    of them at once by `_update_meta_builders`."""
+    column_counts = Counter(
+        builder.feature[COLUMN] for builder in builders.values()
+    )
+    return {
+        name for name, builder in builders.items()
+        if builder.feature[TYPE] == NUMERICAL and
+        builder.missing_value_strategy in _STATS_MISSING_VALUE_STRATEGIES and
+        # features sharing an input column modify it for one another
+        column_counts[builder.feature[COLUMN]] == 1
+    }
+
+
+def _update_meta_builders(builders, dataset_cols, stats_features):
+    numeric_stats = compute_numeric_stats({
+        builders[name].feature[COLUMN]:
+            dataset_cols[builders[name].feature[COLUMN]]
+        for name in stats_features
+    })
+    for name, builder in builders.items():
+        column = dataset_cols[builder.feature[COLUMN]]
+        if name in stats_features:
+            builder.update_stats(
+                len(column),
+                numeric_stats[builder.feature[COLUMN]]
+            )
+        else:
+            builder.update(column)
+
+
+def _finalize_metadata(metadata, features, builders, chunk_size=None):
+    for feature in features:
+        builder = builders[feature[NAME]]
+        fill_value, feature_meta = builder.finalize(chunk_size)
+        preprocessing_parameters = builder.preprocessing_parameters
+        if fill_value is not None:
+            preprocessing_parameters = {
+                'computed_fill_value': fill_value,
+                **preprocessing_parameters
+            }
+        metadata[feature[NAME]] = feature_meta
+        metadata[feature[NAME]][PREPROCESSING] = preprocessing_parameters
+
+    return metadata
+
+
+_STATS_MISSING_VALUE_STRATEGIES = {FILL_WITH_CONST, FILL_WITH_MEAN, DROP_ROW}
+
+
+class _FeatureMetaBuilder:
+    """Accumulates the metadata of a feature over the chunks of its column.
+
+    Missing values are handled like `precompute_fill_value` and
+    `handle_missing_values` do for whole columns: the rows with missing
+    values are counted, and once all the chunks have been seen and the fill
+    value is known, as many fill values are added to the metadata. Builders
+    of different chunks can be merged, and a builder can keep being updated
+    with new chunks after being finalized.
+    """
+
+    def __init__(self, feature, preprocessing_parameters, backend):
+        self.feature = feature
+        self.preprocessing_parameters = preprocessing_parameters
+        self.backend = backend
+        self.missing_value_strategy = preprocessing_parameters[
+            'missing_value_strategy'
+        ]
+        if self.missing_value_strategy == FILL_WITH_MEAN and \
+                feature[TYPE] != NUMERICAL:
+            raise ValueError(
+                'Filling missing values with mean is supported '
+                'only for numerical types',
+            )
+        self.accumulator = self._create_accumulator()
+        self.num_missing = 0
+        self.value_counts = Counter()
+        self.stats = NumericStatsAccumulator(backend.df_engine)
+        self.updated_with_stats = False
+
+    def _create_accumulator(self):
+        return get_from_registry(
+            self.feature[TYPE],
+            base_type_registry
+        ).get_meta_accumulator(self.preprocessing_parameters, self.backend)
+
+    def update(self, column):
+        if self.missing_value_strategy == FILL_WITH_CONST:
+            column = column.fillna(self.preprocessing_parameters['fill_value'])
+        elif self.missing_value_strategy in [
+            FILL_WITH_MODE, FILL_WITH_MEAN, DROP_ROW
+        ]:
+            missing = column.isna()
+            self.num_missing += int(missing.sum())
+            column = column[~missing]
+            if self.missing_value_strategy == FILL_WITH_MODE:
+                self.value_counts.update(column.value_counts().to_dict())
+            elif self.missing_value_strategy == FILL_WITH_MEAN:
+                self.stats.update(column)
+        # the missing values of the other strategies are filled beforehand
+        self._update(self.accumulator, column)
+
+    def update_stats(self, num_rows, stats):
+        """Updates the builder of a numerical feature with the statistics of
+        the non missing values of a chunk of `num_rows` rows of its column,
+        computed beforehand. The missing values are filled when finalizing,
+        whatever the strategy."""
+        self.num_missing += num_rows - stats.count
+        if self.missing_value_strategy == FILL_WITH_MEAN:
+            self.stats.merge(stats)
+        self.accumulator.update_stats(stats=stats)
+        self.updated_with_stats = True
+
+    @staticmethod
+    def _update(accumulator, column):
+        if column.dtype == object:
+            column = column.astype(str)
+        accumulator.update(column)
+
+    def merge(self, other):
+        self.accumulator.merge(other.accumulator)
+        self.num_missing += other.num_missing
+        self.value_counts.update(other.value_counts)
+        self.stats.merge(other.stats)
+        self.updated_with_stats |= other.updated_with_stats
+        return self
+
+    def finalize(self, chunk_size=None):
+        fill_value = None
+        if self.missing_value_strategy == FILL_WITH_CONST:
+            fill_value = self.preprocessing_parameters['fill_value']
+        elif self.missing_value_strategy == FILL_WITH_MODE:
+            fill_value = self.value_counts.most_common(1)[0][0]
+        elif self.missing_value_strategy == FILL_WITH_MEAN:
+            fill_value = self.stats.finalize()['mean']
+
+        accumulator = self.accumulator
+        if fill_value is not None and self.num_missing > 0:
+            # the fill values are added to a copy of the accumulator, which
+            # only holds the values actually seen
+            accumulator = self._create_accumulator().merge(self.accumulator)
+            if self.updated_with_stats:
+                accumulator.update_stats(
+                    stats=NumericStatsAccumulator.of_constant(
+                        fill_value, self.num_missing
+                    )
+                )
+            else:
+                chunk_size = chunk_size or self.num_missing
+                for start in range(0, self.num_missing, chunk_size):
+                    size = min(chunk_size, self.num_missing - start)
+                    self._update(accumulator, pd.Series([fill_value] * size))
+
+        return fill_value, accumulator.finalize()
+
+
+def get_preprocessing_parameters(feature, global_preprocessing_parameters):
+    if PREPROCESSING in feature:
+        preprocessing_parameters = merge_dict(
+            global_preprocessing_parameters[feature[TYPE]],
+            feature[PREPROCESSING]
+        )
+    else:
+        preprocessing_parameters = global_preprocessing_parameters[
+            feature[TYPE]
+        ]
+
+    # deal with encoders that have fixed preprocessing
+    if 'encoder' in feature:
+        encoders_registry = get_from_registry(
+            feature[TYPE],
+            input_type_registry
+        ).encoder_registry
+        encoder_class = encoders_registry[feature['encoder']]
+        if hasattr(encoder_class, 'fixed_preprocessing_parameters'):
+            encoder_fpp = encoder_class.fixed_preprocessing_parameters
+
+            preprocessing_parameters = merge_dict(
+                preprocessing_parameters,
+                resolve_pointers(encoder_fpp, feature, 'feature.')
+            )
+
+    return preprocessing_parameters
+
+
 def build_data(
         input_cols,
         features,
@@ -1311,6 +1802,19 @@ def precompute_fill_value(dataset_cols, feature, preprocessing_parameters, backe
     return None
 
 
+# Filling with the previous or next values leaves the missing values at the
+# ends of the column, whose rows are dropped as well
+_ROW_DROPPING_MISSING_VALUE_STRATEGIES = {DROP_ROW, BACKFILL, BFILL, PAD, FFILL}
+
+
+def drops_missing_rows(feature_metadata):
+    """Returns whether the rows with missing values of the feature are
+    dropped from the processed dataset."""
+    return feature_metadata[PREPROCESSING][
+        'missing_value_strategy'
+    ] in _ROW_DROPPING_MISSING_VALUE_STRATEGIES
+
+
 def handle_missing_values(dataset_cols, feature, preprocessing_parameters):
     missing_value_strategy = preprocessing_parameters['missing_value_strategy']
 
@@ -1341,33 +1845,77 @@ def get_split(
         stratify=None,
         backend=LOCAL_BACKEND,
         random_seed=default_random_seed,
+        chunk_number=None,
 ):
+    """Returns the split of every row of `dataset_df`. When `dataset_df` is
+    a chunk of a larger dataset, its `chunk_number` takes the place of the
+    partition number in the seed of the split."""
     if SPLIT in dataset_df and not force_split:
         split = dataset_df[SPLIT]
     else:
-        set_random_seed(random_seed)
+        if stratify is not None and stratify not in dataset_df:
+            stratify = None
 
-        if stratify is None or stratify not in dataset_df:
-            split = dataset_df.index.to_series().map(
-                lambda x: np.random.choice(3, 1, p=split_probabilities)
-            ).astype(np.int8)
+        split_partition = partial(
+            _split_partition,
+            split_probabilities=split_probabilities,
+            stratify=stratify,
+            random_seed=random_seed
+        )
+        if chunk_number is not None:
+            split = split_partition(
+                dataset_df, partition_info={'number': chunk_number}
+            )
         else:
-            split = np.zeros(len(dataset_df))
-            for val in dataset_df[stratify].unique():
-                # TODO dask: find a way to better parallelize this operation
-                idx_list = (
-                    dataset_df.index[dataset_df[stratify] == val].tolist()
-                )
-                array_lib = backend.df_engine.array_lib
-                val_list = array_lib.random.choice(
-                    3,
-                    len(idx_list),
-                    p=split_probabilities,
-                ).astype(np.int8)
-                split[idx_list] = val_list
+            split = backend.df_engine.map_partitions(
+                dataset_df,
+                split_partition,
+                meta=(SPLIT, np.int8)
+            )
     return split
 
 
+def _split_partition(
+        df,
+        split_probabilities,
+        stratify,
+        random_seed,
+        partition_info=None
+):
+    # every partition draws from its own generator, so the splits only
+    # depend on the random seed and on how the dataset is partitioned
+    partition_number = partition_info['number'] if partition_info else 0
+    rng = np.random.RandomState([random_seed, partition_number])
+
+    if stratify is None:
+        split = rng.choice(3, len(df), p=split_probabilities)
+    else:
+        # Shuffle the rows of each class, then assign the first rows of every
+        # class to training, the next ones to validation and the rest to test,
+        # according to the split probabilities. The boundaries are shifted by
+        # a random offset per class, so that the rows of rare classes are
+        # assigned to every split with the split probabilities, instead of
+        # always being rounded down to training.
+        codes, _ = pd.factorize(df[stratify])
+        counts = np.bincount(codes + 1)
+        order = rng.permutation(len(df))
+        order = order[np.argsort(codes[order], kind='stable')]
+        class_starts = np.cumsum(counts) - counts
+        ordered_classes = codes[order] + 1
+        positions = np.arange(len(df)) - class_starts[ordered_classes]
+        offsets = rng.random_sample(len(counts))
+        fractions = (positions + offsets[ordered_classes]) / \
+            counts[ordered_classes]
+
+        split = np.empty(len(df), dtype=np.int8)
+        split[order] = np.minimum(
+            np.searchsorted(np.cumsum(split_probabilities), fractions,
+                            side='right'),
+            2
+        )
+    return pd.Series(split, index=df.index, name=SPLIT).astype(np.int8)
+
+
 def load_hdf5(
         hdf5_file_path,
         features,
@@ -1438,7 +1986,7 @@ def preprocess_for_training(
     cache = backend.cache.get_dataset_cache(
         config, dataset, training_set, test_set, validation_set
     )
-    if data_format in CACHEABLE_FORMATS:
+    if data_format in CACHEABLE_FORMATS or data_format in DATAFRAME_FORMATS:
         cache_results = cache.get()
         if cache_results is not None:
             valid, *cache_values = cache_results
@@ -1462,6 +2010,36 @@ def preprocess_for_training(
                 cache.delete()
 
     training_set_metadata[CHECKSUM] = cache.checksum
+
+    if not cached and can_preprocess_in_chunks(
+            features,
+            data_format,
+            dataset if dataset is not None else training_set,
+            skip_save_processed_input,
+            preprocessing_params,
+            backend
+    ):
+        # the processed dataset is written to the cache chunk by chunk
+        # and then read back from it
+        processed = _preprocess_file_in_chunks(
+            features,
+            dataset=dataset,
+            training_set=training_set,
+            validation_set=validation_set,
+            test_set=test_set,
+            training_set_metadata=training_set_metadata,
+            read_fn=chunked_read_fn_registry[data_format],
+            cache=cache,
+            preprocessing_params=preprocessing_params,
+            backend=backend,
+            random_seed=random_seed
+        )
+        training_set, test_set, validation_set, training_set_metadata = processed
+        config['data_hdf5_fp'] = training_set
+        data_format = backend.cache.data_format
+        cached = True
+        dataset = None
+
     data_format_processor = get_from_registry(
         data_format,
         data_format_preprocessor_registry
@@ -1623,7 +2201,8 @@ def _preprocess_file_for_training(
             preprocessing_params,
             metadata=training_set_metadata,
             backend=backend,
-            random_seed=random_seed
+            random_seed=random_seed,
+            skip_save_processed_input=skip_save_processed_input
         )
 
         training_data, test_data, validation_data = split_dataset_ttv(
@@ -1637,6 +2216,169 @@ def _preprocess_file_for_training(
     return training_data, test_data, validation_data, training_set_metadata
 
 
+def can_preprocess_in_chunks(
+        features,
+        data_format,
+        data_fp,
+        skip_save_processed_input,
+        preprocessing_params,
+        backend
+):
+    """Returns whether the dataset at `data_fp` should be preprocessed in
+    chunks of `chunk_size` rows, which needs a local backend caching the
+    processed dataset to HDF5 or npy."""
+    global_preprocessing_parameters = merge_dict(
+        default_preprocessing_parameters,
+        preprocessing_params
+    )
+    if not global_preprocessing_parameters['chunk_size']:
+        return False
+
+    reason = None
+    if data_format not in chunked_read_fn_registry:
+        reason = f'{data_format} files cannot be read in chunks'
+    elif not isinstance(data_fp, str):
+        reason = 'the dataset is not a file'
+    elif backend.df_engine.partitioned:
+        reason = 'the backend already partitions the dataset'
+    elif not backend.cache.can_cache(skip_save_processed_input) or \
+            not hasattr(backend.dataset_manager, 'create_writer'):
+        reason = 'the processed dataset cannot be cached chunk by chunk'
+    else:
+        for feature in features:
+            preprocessing_parameters = get_preprocessing_parameters(
+                feature,
+                global_preprocessing_parameters
+            )
+            if preprocessing_parameters['missing_value_strategy'] in [
+                BACKFILL, BFILL, PAD, FFILL
+            ]:
+                reason = (f'feature {feature[NAME]} fills missing values '
+                          f'from the neighbouring rows')
+                break
+            if not preprocessing_parameters.get('in_memory', True):
+                reason = f'feature {feature[NAME]} is not kept in memory'
+                break
+
+    if reason is not None:
+        logger.warning(f'Ignoring chunk_size: {reason}')
+        return False
+    return True
+
+
+def _preprocess_file_in_chunks(
+        features,
+        dataset=None,
+        training_set=None,
+        validation_set=None,
+        test_set=None,
+        training_set_metadata=None,
+        read_fn=read_csv,
+        cache=None,
+        preprocessing_params=default_preprocessing_parameters,
+        backend=LOCAL_BACKEND,
+        random_seed=default_random_seed
+):
+    """
+    Method to pre-process data files too large to fit in memory, in two passes
+    over chunks of `chunk_size` rows: the first one accumulates the metadata
+    of the features, the second one processes every chunk with it and appends
+    it to the cache.
+    :return: paths of the cached training, test and validation sets (None if
+             they have no rows), training metadata
+    """
+    global_preprocessing_parameters = merge_dict(
+        default_preprocessing_parameters,
+        preprocessing_params
+    )
+    chunk_size = global_preprocessing_parameters['chunk_size']
+
+    if dataset is not None:
+        data_fps = [(dataset, None)]
+        training_set_metadata[SRC] = dataset
+    else:
+        data_fps = [
+            (data_fp, split)
+            for data_fp, split in [
+                (training_set, 0), (validation_set, 1), (test_set, 2)
+            ] if data_fp is not None
+        ]
+        training_set_metadata[SRC] = training_set
+
+    def read_chunks():
+        offset = 0
+        for data_fp, split in data_fps:
+            for chunk in read_fn(data_fp, backend.df_engine.df_lib,
+                                 chunksize=chunk_size):
+                # rows are numbered across files like concatenate_df does
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                offset += len(chunk)
+                if split is not None:
+                    chunk[SPLIT] = np.int8(split)
+                yield chunk
+
+    proc_features = get_unique_proc_features(features)
+
+    logger.info('Building metadata in chunks (it may take a while)')
+    training_set_metadata = build_metadata_in_chunks(
+        training_set_metadata,
+        read_chunks(),
+        proc_features,
+        global_preprocessing_parameters,
+        backend
+    )
+
+    def build_chunks(split_file):
+        for chunk_number, chunk in enumerate(read_chunks()):
+            dataset_cols = cast_columns(
+                chunk,
+                proc_features,
+                global_preprocessing_parameters,
+                backend
+            )
+            proc_cols = {}
+            drop_row_cols = []
+            for feature in proc_features:
+                feature_cols = build_data(
+                    dataset_cols,
+                    [feature],
+                    training_set_metadata,
+                    backend,
+                    skip_save_processed_input=False
+                )
+                proc_cols.update(feature_cols)
+                if drops_missing_rows(training_set_metadata[feature[NAME]]):
+                    drop_row_cols.extend(feature_cols)
+            proc_cols[SPLIT] = get_split(
+                chunk,
+                force_split=global_preprocessing_parameters['force_split'],
+                split_probabilities=global_preprocessing_parameters[
+                    'split_probabilities'
+                ],
+                stratify=global_preprocessing_parameters['stratify'],
+                backend=backend,
+                random_seed=random_seed,
+                chunk_number=chunk_number
+            )
+
+            data = backend.df_engine.df_like(chunk, proc_cols, drop_row_cols)
+            replace_text_feature_level(features, [data])
+            if split_file is not None:
+                np.savetxt(split_file, data[SPLIT].to_numpy(), fmt='%d')
+
+            yield split_dataset_ttv(data, SPLIT)
+
+    logger.info('Building dataset in chunks (it may take a while)')
+    if dataset is not None:
+        # save split values for use by visualization routines
+        with open_file(get_split_path(dataset), 'w') as split_file:
+            return cache.put_chunks(
+                build_chunks(split_file),
+                training_set_metadata
+            )
+    return cache.put_chunks(build_chunks(None), training_set_metadata)
+
+
 def _preprocess_df_for_training(
         features,
         dataset=None,
@@ -1644,6 +2386,7 @@ def _preprocess_df_for_training(
         validation_set=None,
         test_set=None,
         training_set_metadata=None,
+        skip_save_processed_input=False,
         preprocessing_params=default_preprocessing_parameters,
         backend=LOCAL_BACKEND,
         random_seed=default_random_seed
@@ -1674,7 +2417,8 @@ def _preprocess_df_for_training(
         preprocessing_params,
         metadata=training_set_metadata,
         random_seed=random_seed,
-        backend=backend
+        backend=backend,
+        skip_save_processed_input=skip_save_processed_input
     )
 
     training_set, test_set, validation_set = split_dataset_ttv(
@@ -1749,9 +2493,10 @@ def preprocess_for_prediction(
     # because the cached data is stored in its split form, and would be
     # expensive to recombine, requiring further caching.
     cached = False
-    cache = backend.cache.get_dataset_cache(config, dataset)
     training_set = test_set = validation_set = None
-    if data_format in CACHEABLE_FORMATS and split != FULL:
+    if (data_format in CACHEABLE_FORMATS or
+            data_format in DATAFRAME_FORMATS) and split != FULL:
+        cache = backend.cache.get_dataset_cache(config, dataset)
         cache_results = cache.get()
         if cache_results is not None:
             valid, *cache_values = cache_results
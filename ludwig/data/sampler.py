@@ -33,22 +33,28 @@ class DistributedSampler:
         self.seed = seed
 
     def __iter__(self):
+        return iter(self.get_indices())
+
+    def get_indices(self):
+        """Returns the sample indices of this replica for the current epoch
+        as a numpy array."""
         if self.shuffle:
             # deterministically shuffle based on epoch and seed
             indices = np.random.RandomState(seed=self.seed + self.epoch)\
-                .permutation(self.dataset_size).tolist()
+                .permutation(self.dataset_size)
         else:
-            indices = list(range(self.dataset_size))
+            indices = np.arange(self.dataset_size)
 
         # add extra samples to make it evenly divisible
-        indices += indices[:(self.total_size - len(indices))]
+        if self.total_size > len(indices):
+            indices = np.resize(indices, self.total_size)
         assert len(indices) == self.total_size
 
         # subsample
         indices = indices[self.rank:self.total_size:self.num_replicas]
         assert len(indices) == self.num_samples
 
-        return iter(indices)
+        return indices
 
     def __len__(self):
         return self.num_samples
@@ -17,15 +17,21 @@
 import logging
 import os
 import sys
+from functools import partial
+from multiprocessing import Pool
+from operator import itemgetter
 
 import numpy as np
+import pandas as pd
 import tensorflow as tf
 
 from ludwig.constants import *
 from ludwig.encoders.sequence_encoders import StackedCNN, ParallelCNN, \
     StackedParallelCNN, StackedRNN, SequencePassthroughEncoder, StackedCNNRNN
+from ludwig.features.meta_accumulators import FirstChunkAccumulator
 from ludwig.features.sequence_feature import SequenceInputFeature
 from ludwig.utils.audio_utils import calculate_mean, calculate_var
+from ludwig.utils.audio_utils import get_batch_features
 from ludwig.utils.audio_utils import get_fbank
 from ludwig.utils.audio_utils import get_group_delay
 from ludwig.utils.audio_utils import get_length_in_samp
@@ -39,6 +45,8 @@ from ludwig.utils.misc_utils import set_default_values
 
 logger = logging.getLogger(__name__)
 
+AUDIO_BATCH_SIZE = 32
+
 
 class AudioFeatureMixin:
     type = AUDIO
@@ -49,6 +57,7 @@ class AudioFeatureMixin:
         'in_memory': True,
         'padding_value': 0,
         'norm': None,
+        'num_processes': 1,
         'audio_feature': {
             TYPE: 'raw',
         }
@@ -60,6 +69,7 @@ class AudioFeatureMixin:
         'in_memory': {'type': 'boolean'},
         'padding_value': {'type': 'number', 'minimum': 0},
         'norm': {'type': ['string', 'null'], 'enum': [None, 'per_file', 'global']},
+        'num_processes': {'type': 'integer', 'minimum': 0},
         'audio_feature': {
             'type': 'object',
             'properties': {
@@ -107,6 +117,12 @@ class AudioFeatureMixin:
             'reshape': (max_length, feature_dim)
         }
 
+    @staticmethod
+    def get_meta_accumulator(preprocessing_parameters, backend):
+        return FirstChunkAccumulator(
+            AudioFeatureMixin.get_feature_meta, preprocessing_parameters, backend
+        )
+
     @staticmethod
     def _get_feature_dim(audio_feature_dict, sampling_rate_in_hz):
         feature_type = audio_feature_dict[TYPE]
@@ -138,8 +154,154 @@ class AudioFeatureMixin:
             padding_value,
             normalization_type,
             audio_file_length_limit_in_s,
-            backend
+            backend,
+            num_processes=1,
+            feature_cache=None
+    ):
+        process_audio_batch = partial(
+            AudioFeatureMixin._read_and_transform_batch,
+            src_path=src_path,
+            audio_feature_dict=audio_feature_dict,
+            feature_dim=feature_dim,
+            max_length=max_length,
+            padding_value=padding_value,
+            normalization_type=normalization_type,
+            audio_file_length_limit_in_s=audio_file_length_limit_in_s,
+            feature_cache=feature_cache
+        )
+
+        df_engine = backend.df_engine
+        if backend.supports_multiprocessing and num_processes > 1:
+            paths = column.tolist()
+            batches = [
+                paths[start:start + AUDIO_BATCH_SIZE]
+                for start in range(0, len(paths), AUDIO_BATCH_SIZE)
+            ]
+            with Pool(num_processes) as pool:
+                logger.debug(
+                    'Using {} processes for preprocessing audio'.format(
+                        num_processes
+                    )
+                )
+                processed = [
+                    processed_item
+                    for processed_batch in pool.map(process_audio_batch,
+                                                    batches)
+                    for processed_item in processed_batch
+                ]
+            processed_audio = pd.Series(
+                [audio_feature for audio_feature, _ in processed],
+                index=column.index
+            )
+            audio_stats = [audio_stats for _, audio_stats in processed]
+            merged_stats = AudioFeatureMixin._reduce_stats(audio_stats)
+        else:
+            def process_partition(partition, partition_info=None):
+                paths = partition.tolist()
+                processed = []
+                for start in range(0, len(paths), AUDIO_BATCH_SIZE):
+                    processed.extend(process_audio_batch(
+                        paths[start:start + AUDIO_BATCH_SIZE]
+                    ))
+                return pd.Series(
+                    processed,
+                    index=partition.index,
+                    name=partition.name,
+                    dtype=object
+                )
+
+            processed = df_engine.map_partitions(
+                column, process_partition, meta=(column.name, 'object')
+            )
+            processed_audio = df_engine.map_objects(
+                processed, itemgetter(0)
+            )
+            audio_stats = df_engine.map_objects(processed, itemgetter(1))
+            merged_stats = df_engine.reduce_objects(
+                audio_stats, AudioFeatureMixin._reduce_stats
+            )
+
+        merged_stats['mean'] = calculate_mean(merged_stats['sum'], merged_stats['count'])
+        merged_stats['var'] = calculate_var(merged_stats['sum'], merged_stats['sum2'], merged_stats['count'])
+        return processed_audio, merged_stats
+
+    @staticmethod
+    def _read_and_transform_batch(
+            paths,
+            src_path,
+            audio_feature_dict,
+            feature_dim,
+            max_length,
+            padding_value,
+            normalization_type,
+            audio_file_length_limit_in_s,
+            feature_cache=None
     ):
+        """Returns the padded feature and the length statistics of each audio
+        file in paths. The 2D features, which are expensive to compute, are
+        looked up in and stored into feature_cache when provided, and the
+        ones missing from it are computed together for all the files sampled
+        at the same rate."""
+        audio_features = [None] * len(paths)
+        audio_lengths_in_s = [None] * len(paths)
+        cache_keys = [None] * len(paths)
+        uncached = {}
+
+        for i, path in enumerate(paths):
+            filepath = get_abs_path(src_path, path)
+            if feature_cache is not None and audio_feature_dict[TYPE] != 'raw':
+                cache_keys[i] = feature_cache.get_key(
+                    filepath, audio_feature_dict
+                )
+            cached = feature_cache.get(cache_keys[i]) if cache_keys[i] else None
+
+            if cached is not None:
+                audio_features[i] = cached['audio_feature']
+                audio_lengths_in_s[i] = float(cached['audio_length_in_s'])
+            else:
+                audio, sampling_rate_in_hz = AudioFeatureMixin._read_audio(
+                    filepath
+                )
+                audio_lengths_in_s[i] = (
+                        audio.shape[-1] / float(sampling_rate_in_hz)
+                )
+                uncached.setdefault(sampling_rate_in_hz, []).append(
+                    (i, audio)
+                )
+
+        for sampling_rate_in_hz, indexed_audios in uncached.items():
+            batch_features = AudioFeatureMixin._get_batch_feature(
+                [audio for _, audio in indexed_audios],
+                sampling_rate_in_hz,
+                audio_feature_dict
+            )
+            for (i, _), audio_feature in zip(indexed_audios, batch_features):
+                audio_features[i] = audio_feature
+                if cache_keys[i] is not None:
+                    feature_cache.put(cache_keys[i], {
+                        'audio_feature': audio_feature,
+                        'audio_length_in_s': np.array(audio_lengths_in_s[i]),
+                    })
+
+        return [
+            (
+                AudioFeatureMixin._normalize_and_pad(
+                    audio_feature,
+                    feature_dim,
+                    max_length,
+                    padding_value,
+                    normalization_type
+                ),
+                AudioFeatureMixin._get_stats(
+                    audio_length_in_s, audio_file_length_limit_in_s
+                )
+            )
+            for audio_feature, audio_length_in_s in zip(audio_features,
+                                                         audio_lengths_in_s)
+        ]
+
+    @staticmethod
+    def _read_audio(filepath):
         try:
             import soundfile
         except ImportError:
@@ -150,47 +312,17 @@ class AudioFeatureMixin:
             )
             sys.exit(-1)
 
-        def read_audio(path):
-            filepath = get_abs_path(src_path, path)
-            return soundfile.read(filepath)
-
-        df_engine = backend.df_engine
-        raw_audio = df_engine.map_objects(column, read_audio)
-        processed_audio = df_engine.map_objects(
-            raw_audio,
-            lambda row: AudioFeatureMixin._transform_to_feature(
-                audio=row[0],
-                sampling_rate_in_hz=row[1],
-                audio_feature_dict=audio_feature_dict,
-                feature_dim=feature_dim,
-                max_length=max_length,
-                padding_value=padding_value,
-                normalization_type=normalization_type
-            )
-        )
-
-        audio_stats = df_engine.map_objects(
-            raw_audio,
-            lambda row: AudioFeatureMixin._get_stats(
-                audio=row[0],
-                sampling_rate_in_hz=row[1],
-                max_length_in_s=audio_file_length_limit_in_s,
-            )
-        )
-
-        def reduce(series):
-            merged_stats = None
-            for audio_stats in series:
-                if merged_stats is None:
-                    merged_stats = audio_stats.copy()
-                else:
-                    AudioFeatureMixin._merge_stats(merged_stats, audio_stats)
-            return merged_stats
+        return soundfile.read(filepath)
 
-        merged_stats = df_engine.reduce_objects(audio_stats, reduce)
-        merged_stats['mean'] = calculate_mean(merged_stats['sum'], merged_stats['count'])
-        merged_stats['var'] = calculate_var(merged_stats['sum'], merged_stats['sum2'], merged_stats['count'])
-        return processed_audio, merged_stats
+    @staticmethod
+    def _reduce_stats(series):
+        merged_stats = None
+        for audio_stats in series:
+            if merged_stats is None:
+                merged_stats = audio_stats.copy()
+            else:
+                AudioFeatureMixin._merge_stats(merged_stats, audio_stats)
+        return merged_stats
 
     @staticmethod
     def _transform_to_feature(
@@ -202,17 +334,61 @@ class AudioFeatureMixin:
             padding_value,
             normalization_type
     ):
+        audio_feature = AudioFeatureMixin._get_feature(
+            audio, sampling_rate_in_hz, audio_feature_dict
+        )
+        return AudioFeatureMixin._normalize_and_pad(
+            audio_feature,
+            feature_dim,
+            max_length,
+            padding_value,
+            normalization_type
+        )
+
+    @staticmethod
+    def _get_feature(audio, sampling_rate_in_hz, audio_feature_dict):
         feature_type = audio_feature_dict[TYPE]
         if feature_type == 'raw':
-            audio_feature = np.expand_dims(audio, axis=-1)
+            return np.expand_dims(audio, axis=-1)
         elif feature_type in ['stft', 'stft_phase', 'group_delay', 'fbank']:
-            audio_feature = np.transpose(
+            return np.transpose(
                 AudioFeatureMixin._get_2D_feature(audio, feature_type,
                                                   audio_feature_dict,
                                                   sampling_rate_in_hz))
         else:
             raise ValueError('{} is not recognized.'.format(feature_type))
 
+    @staticmethod
+    def _get_batch_feature(audios, sampling_rate_in_hz, audio_feature_dict):
+        """Returns the same features as _get_feature for each of the audios,
+        all sampled at sampling_rate_in_hz, computing the 2D ones in a single
+        batch."""
+        feature_type = audio_feature_dict[TYPE]
+        if feature_type == 'raw':
+            return [np.expand_dims(audio, axis=-1) for audio in audios]
+        elif feature_type in ['stft', 'stft_phase', 'group_delay', 'fbank']:
+            batch_features, lengths = get_batch_features(
+                audios,
+                feature_type,
+                sampling_rate_in_hz,
+                **AudioFeatureMixin._get_2D_feature_parameters(
+                    feature_type, audio_feature_dict, sampling_rate_in_hz
+                )
+            )
+            return [
+                batch_features[i, :length] for i, length in enumerate(lengths)
+            ]
+        else:
+            raise ValueError('{} is not recognized.'.format(feature_type))
+
+    @staticmethod
+    def _normalize_and_pad(
+            audio_feature,
+            feature_dim,
+            max_length,
+            padding_value,
+            normalization_type
+    ):
         if normalization_type == 'per_file':
             mean = np.mean(audio_feature, axis=0)
             std = np.std(audio_feature, axis=0)
@@ -232,8 +408,7 @@ class AudioFeatureMixin:
         return audio_feature_padded
 
     @staticmethod
-    def _get_stats(audio, sampling_rate_in_hz, max_length_in_s):
-        audio_length_in_s = audio.shape[-1] / float(sampling_rate_in_hz)
+    def _get_stats(audio_length_in_s, max_length_in_s):
         return {
             'count': 1,
             'sum': audio_length_in_s,
@@ -255,6 +430,36 @@ class AudioFeatureMixin:
     @staticmethod
     def _get_2D_feature(audio, feature_type, audio_feature_dict,
                         sampling_rate_in_hz):
+        parameters = AudioFeatureMixin._get_2D_feature_parameters(
+            feature_type, audio_feature_dict, sampling_rate_in_hz
+        )
+        window_length_in_s = parameters['window_length_in_s']
+        window_shift_in_s = parameters['window_shift_in_s']
+        num_fft_points = parameters['num_fft_points']
+        window_type = parameters['window_type']
+
+        if feature_type == 'stft_phase':
+            return get_phase_stft_magnitude(audio, sampling_rate_in_hz,
+                                            window_length_in_s,
+                                            window_shift_in_s, num_fft_points,
+                                            window_type)
+        if feature_type == 'stft':
+            return get_stft_magnitude(audio, sampling_rate_in_hz,
+                                      window_length_in_s, window_shift_in_s,
+                                      num_fft_points, window_type)
+        if feature_type == 'group_delay':
+            return get_group_delay(audio, sampling_rate_in_hz,
+                                   window_length_in_s, window_shift_in_s,
+                                   num_fft_points, window_type)
+        if feature_type == 'fbank':
+            return get_fbank(audio, sampling_rate_in_hz,
+                             window_length_in_s, window_shift_in_s,
+                             num_fft_points, window_type,
+                             parameters['num_filter_bands'])
+
+    @staticmethod
+    def _get_2D_feature_parameters(feature_type, audio_feature_dict,
+                                   sampling_rate_in_hz):
         window_length_in_s = audio_feature_dict['window_length_in_s']
         window_shift_in_s = audio_feature_dict['window_shift_in_s']
         window_length_in_samp = get_length_in_samp(window_length_in_s,
@@ -276,24 +481,16 @@ class AudioFeatureMixin:
         else:
             window_type = 'hamming'
 
-        if feature_type == 'stft_phase':
-            return get_phase_stft_magnitude(audio, sampling_rate_in_hz,
-                                            window_length_in_s,
-                                            window_shift_in_s, num_fft_points,
-                                            window_type)
-        if feature_type == 'stft':
-            return get_stft_magnitude(audio, sampling_rate_in_hz,
-                                      window_length_in_s, window_shift_in_s,
-                                      num_fft_points, window_type)
-        if feature_type == 'group_delay':
-            return get_group_delay(audio, sampling_rate_in_hz,
-                                   window_length_in_s, window_shift_in_s,
-                                   num_fft_points, window_type)
+        parameters = {
+            'window_length_in_s': window_length_in_s,
+            'window_shift_in_s': window_shift_in_s,
+            'num_fft_points': num_fft_points,
+            'window_type': window_type,
+        }
         if feature_type == 'fbank':
-            num_filter_bands = audio_feature_dict['num_filter_bands']
-            return get_fbank(audio, sampling_rate_in_hz,
-                             window_length_in_s, window_shift_in_s,
-                             num_fft_points, window_type, num_filter_bands)
+            parameters['num_filter_bands'] = audio_feature_dict[
+                'num_filter_bands']
+        return parameters
 
     @staticmethod
     def add_feature_data(
@@ -349,6 +546,14 @@ class AudioFeatureMixin:
                 'There are no audio files in the dataset provided.')
 
         if feature[PREPROCESSING]['in_memory']:
+            # the features computed from each audio file are cached next to
+            # the dataset and reused as long as the files do not change
+            feature_cache = None
+            if backend.cache.can_cache(skip_save_processed_input):
+                feature_cache = backend.cache.get_file_feature_cache(
+                    metadata.get(SRC)
+                )
+
             audio_features, audio_stats = AudioFeatureMixin._process_in_memory(
                 input_df[feature[NAME]],
                 src_path,
@@ -358,7 +563,9 @@ class AudioFeatureMixin:
                 padding_value,
                 normalization_type,
                 audio_file_length_limit_in_s,
-                backend
+                backend,
+                num_processes=preprocessing_parameters['num_processes'],
+                feature_cache=feature_cache
             )
             proc_df[proc_column] = audio_features
 
@@ -15,7 +15,6 @@
 # limitations under the License.
 # ==============================================================================
 import logging
-from collections import Counter
 
 import numpy as np
 import tensorflow as tf
@@ -23,9 +22,12 @@ import tensorflow as tf
 from ludwig.constants import *
 from ludwig.encoders.bag_encoders import ENCODER_REGISTRY
 from ludwig.features.base_feature import InputFeature
-from ludwig.features.feature_utils import set_str_to_idx
+from ludwig.features.feature_utils import pad_indices, set_units_to_idx
+from ludwig.features.meta_accumulators import FeatureMetaAccumulator, \
+    VocabularyAccumulator
+from ludwig.utils.math_utils import int_type
 from ludwig.utils.misc_utils import set_default_value
-from ludwig.utils.strings_utils import create_vocabulary, tokenizer_registry, UNKNOWN_SYMBOL
+from ludwig.utils.strings_utils import tokenize, tokenizer_registry, UNKNOWN_SYMBOL
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +39,7 @@ class BagFeatureMixin:
         'tokenizer': 'space',
         'most_common': 10000,
         'lowercase': False,
+        'num_processes': 1,
         'missing_value_strategy': FILL_WITH_CONST,
         'fill_value': UNKNOWN_SYMBOL
     }
@@ -45,6 +48,7 @@ class BagFeatureMixin:
         'tokenizer': {'type': 'string', 'enum': sorted(list(tokenizer_registry.keys()))},
         'most_common': {'type': 'integer', 'minimum': 0},
         'lowercase': {'type': 'boolean'},
+        'num_processes': {'type': 'integer', 'minimum': 0},
         'missing_value_strategy': {'type': 'string', 'enum': MISSING_VALUE_STRATEGY_OPTIONS},
         'fill_value': {'type': 'string'},
         'computed_fill_value': {'type': 'string'},
@@ -56,36 +60,74 @@ class BagFeatureMixin:
 
     @staticmethod
     def get_feature_meta(column, preprocessing_parameters, backend):
-        column = column.astype(str)
-        idx2str, str2idx, str2freq, max_size, _, _, _ = create_vocabulary(
-            column,
-            preprocessing_parameters['tokenizer'],
-            num_most_frequent=preprocessing_parameters['most_common'],
-            lowercase=preprocessing_parameters['lowercase'],
-            processor=backend.df_engine,
+        tokens = BagFeatureMixin.tokenize(
+            column.astype(str), preprocessing_parameters, backend
+        )
+        accumulator = BagFeatureMixin.get_meta_accumulator(
+            preprocessing_parameters, backend
         )
+        accumulator.update_tokens(vocabulary=tokens)
         return {
-            'idx2str': idx2str,
-            'str2idx': str2idx,
-            'str2freq': str2freq,
-            'vocab_size': len(str2idx),
-            'max_set_size': max_size
+            **accumulator.finalize(),
+            # the tokens are reused by add_feature_data, which removes them
+            'tokens': tokens,
         }
 
     @staticmethod
-    def feature_data(column, metadata, preprocessing_parameters, backend):
-        def to_vector(set_str):
-            bag_vector = np.zeros((len(metadata['str2idx']),), dtype=np.float32)
-            col_counter = Counter(set_str_to_idx(
-                set_str,
-                metadata['str2idx'],
-                preprocessing_parameters['tokenizer'])
+    def get_meta_accumulator(preprocessing_parameters, backend):
+        def build_meta(vocabulary):
+            idx2str, str2idx, str2freq, max_size, _, _, _ = vocabulary
+            return {
+                'idx2str': idx2str,
+                'str2idx': str2idx,
+                'str2freq': str2freq,
+                'vocab_size': len(str2idx),
+                'max_set_size': max_size,
+            }
+
+        return FeatureMetaAccumulator(
+            build_meta,
+            vocabulary=VocabularyAccumulator(
+                lambda column: BagFeatureMixin.tokenize(
+                    column, preprocessing_parameters, backend
+                ),
+                backend.df_engine,
+                tokenizer_type=preprocessing_parameters['tokenizer'],
+                num_most_frequent=preprocessing_parameters['most_common']
             )
+        )
 
-            bag_vector[list(col_counter.keys())] = list(col_counter.values())
-            return bag_vector
+    @staticmethod
+    def tokenize(column, preprocessing_parameters, backend):
+        return tokenize(
+            column,
+            tokenizer_type=preprocessing_parameters['tokenizer'],
+            lowercase=preprocessing_parameters['lowercase'],
+            processor=backend.df_engine,
+            num_processes=(preprocessing_parameters['num_processes']
+                           if backend.supports_multiprocessing else 1)
+        )
 
-        return backend.df_engine.map_objects(column, to_vector)
+    @staticmethod
+    def feature_data(column, metadata, preprocessing_parameters, backend,
+                     tokens=None):
+        if tokens is None:
+            tokens = BagFeatureMixin.tokenize(
+                column, preprocessing_parameters, backend
+            )
+
+        def to_indices(set_units):
+            # the indices of the units of the bag, repeated as many times as
+            # they appear
+            return np.sort(set_units_to_idx(set_units, metadata['str2idx']))
+
+        # padded to max_set_size, or to the size of the largest bag if larger
+        return pad_indices(
+            backend.df_engine.map_objects(tokens, to_indices),
+            metadata['max_set_size'],
+            int_type(metadata['vocab_size']),
+            backend.df_engine
+        )
 
     @staticmethod
     def add_feature_data(
@@ -101,7 +143,8 @@ class BagFeatureMixin:
             input_df[feature[COLUMN]].astype(str),
             metadata[feature[NAME]],
             preprocessing_parameters,
-            backend
+            backend,
+            tokens=metadata[feature[NAME]].pop('tokens', None)
         )
         return proc_df
 
@@ -120,7 +163,9 @@ class BagInputFeature(BagFeatureMixin, InputFeature):
 
     def call(self, inputs, training=None, mask=None):
         assert isinstance(inputs, tf.Tensor)
-        # assert inputs.dtype == tf.bool # this fails
+        assert inputs.dtype == tf.int8 or inputs.dtype == tf.int16 or \
+               inputs.dtype == tf.int32 or inputs.dtype == tf.int64
+        assert len(inputs.shape) == 2
 
         encoder_output = self.encoder_obj(inputs, training=training, mask=mask)
 
@@ -128,10 +173,10 @@ class BagInputFeature(BagFeatureMixin, InputFeature):
 
     @classmethod
     def get_input_dtype(cls):
-        return tf.float32
+        return tf.int32
 
     def get_input_shape(self):
-        return len(self.vocab),
+        return None,
 
     @staticmethod
     def update_config_with_metadata(
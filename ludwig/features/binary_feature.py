@@ -25,6 +25,8 @@ from ludwig.decoders.generic_decoders import Regressor
 from ludwig.encoders.binary_encoders import ENCODER_REGISTRY
 from ludwig.features.base_feature import InputFeature
 from ludwig.features.base_feature import OutputFeature
+from ludwig.features.meta_accumulators import DistinctValuesAccumulator, \
+    FeatureMetaAccumulator
 from ludwig.modules.loss_modules import BWCEWLoss
 from ludwig.modules.metric_modules import BWCEWLMetric, ROCAUCMetric
 from ludwig.utils.metrics_utils import ConfusionMatrix
@@ -73,22 +75,39 @@ class BinaryFeatureMixin:
         if column.dtype != object:
             return {}
 
-        distinct_values = backend.df_engine.compute(column.drop_duplicates())
-        if len(distinct_values) > 2:
-            raise ValueError(
-                f"Binary feature column {column.name} expects 2 distinct values, "
-                f"found: {distinct_values.values.tolist()}"
-            )
+        accumulator = BinaryFeatureMixin.get_meta_accumulator(
+            preprocessing_parameters, backend
+        )
+        accumulator.update(column)
+        return accumulator.finalize()
 
-        str2bool = {v: strings_utils.str2bool(v) for v in distinct_values}
-        bool2str = [
-            k for k, v in sorted(str2bool.items(), key=lambda item: item[1])
-        ]
+    @staticmethod
+    def get_meta_accumulator(preprocessing_parameters, backend):
+        def build_meta(distinct_values):
+            if not any(isinstance(v, str) for v in distinct_values):
+                # only chunks of booleans or numbers
+                return {}
+            distinct_values = list(dict.fromkeys(map(str, distinct_values)))
+            if len(distinct_values) > 2:
+                raise ValueError(
+                    f"Binary feature column expects 2 distinct values, "
+                    f"found: {distinct_values}"
+                )
 
-        return {
-            "str2bool": str2bool,
-            "bool2str": bool2str,
-        }
+            str2bool = {v: strings_utils.str2bool(v) for v in distinct_values}
+            bool2str = [
+                k for k, v in sorted(str2bool.items(), key=lambda item: item[1])
+            ]
+
+            return {
+                "str2bool": str2bool,
+                "bool2str": bool2str,
+            }
+
+        return FeatureMetaAccumulator(
+            build_meta,
+            distinct_values=DistinctValuesAccumulator(backend.df_engine)
+        )
 
     @staticmethod
     def add_feature_data(
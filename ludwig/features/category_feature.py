@@ -16,15 +16,20 @@
 # ==============================================================================
 import logging
 import os
+from functools import partial
 
 import numpy as np
+import pandas as pd
 import tensorflow as tf
 
 from ludwig.constants import *
+from ludwig.data.dataframe.tensor import column_to_numpy
 from ludwig.decoders.generic_decoders import Classifier
 from ludwig.encoders.category_encoders import ENCODER_REGISTRY
 from ludwig.features.base_feature import InputFeature
 from ludwig.features.base_feature import OutputFeature
+from ludwig.features.meta_accumulators import FeatureMetaAccumulator, \
+    VocabularyAccumulator
 from ludwig.modules.loss_modules import SampledSoftmaxCrossEntropyLoss
 from ludwig.modules.loss_modules import SoftmaxCrossEntropyLoss
 from ludwig.modules.metric_modules import CategoryAccuracy
@@ -37,7 +42,7 @@ from ludwig.utils.metrics_utils import ConfusionMatrix
 from ludwig.utils.misc_utils import set_default_value
 from ludwig.utils.misc_utils import set_default_values
 from ludwig.utils.strings_utils import UNKNOWN_SYMBOL
-from ludwig.utils.strings_utils import create_vocabulary
+from ludwig.utils.strings_utils import tokenize
 
 logger = logging.getLogger(__name__)
 
@@ -65,30 +70,52 @@ class CategoryFeatureMixin:
 
     @staticmethod
     def get_feature_meta(column, preprocessing_parameters, backend):
-        column = column.astype(str)
-        idx2str, str2idx, str2freq, _, _, _, _ = create_vocabulary(
-            column, 'stripped',
-            num_most_frequent=preprocessing_parameters['most_common'],
-            lowercase=preprocessing_parameters['lowercase'],
-            add_padding=False,
-            processor=backend.df_engine
+        accumulator = CategoryFeatureMixin.get_meta_accumulator(
+            preprocessing_parameters, backend
         )
-        return {
-            'idx2str': idx2str,
-            'str2idx': str2idx,
-            'str2freq': str2freq,
-            'vocab_size': len(str2idx)
-        }
+        accumulator.update(column)
+        return accumulator.finalize()
 
     @staticmethod
-    def feature_data(column, metadata):
-        return column.map(
-            lambda x: (
-                metadata['str2idx'][x.strip()]
-                if x.strip() in metadata['str2idx']
-                else metadata['str2idx'][UNKNOWN_SYMBOL]
+    def get_meta_accumulator(preprocessing_parameters, backend):
+        def build_meta(vocabulary):
+            idx2str, str2idx, str2freq, _, _, _, _ = vocabulary
+            return {
+                'idx2str': idx2str,
+                'str2idx': str2idx,
+                'str2freq': str2freq,
+                'vocab_size': len(str2idx)
+            }
+
+        return FeatureMetaAccumulator(
+            build_meta,
+            vocabulary=VocabularyAccumulator(
+                partial(
+                    tokenize,
+                    tokenizer_type='stripped',
+                    lowercase=preprocessing_parameters['lowercase'],
+                    processor=backend.df_engine
+                ),
+                backend.df_engine,
+                tokenizer_type='stripped',
+                num_most_frequent=preprocessing_parameters['most_common'],
+                add_padding=False
             )
-        ).astype(int_type(metadata['vocab_size']))
+        )
+
+    @staticmethod
+    def feature_data(column, metadata, backend):
+        dtype = int_type(metadata['vocab_size'])
+        return backend.df_engine.map_partitions(
+            column,
+            partial(
+                _encode_categories,
+                idx2str=metadata['idx2str'],
+                unknown_idx=metadata['str2idx'][UNKNOWN_SYMBOL],
+                dtype=dtype
+            ),
+            meta=(column.name, dtype)
+        )
 
     @staticmethod
     def add_feature_data(
@@ -103,6 +130,7 @@ class CategoryFeatureMixin:
         proc_df[feature[PROC_COLUMN]] = CategoryFeatureMixin.feature_data(
             input_df[feature[COLUMN]].astype(str),
             metadata[feature[NAME]],
+            backend
         )
         return proc_df
 
@@ -421,43 +449,35 @@ class CategoryOutputFeature(CategoryFeatureMixin, OutputFeature):
             backend,
     ):
         predictions_col = f'{self.feature_name}_{PREDICTIONS}'
-        if predictions_col in predictions:
-            if 'idx2str' in metadata:
-                predictions[predictions_col] = backend.df_engine.map_objects(
-                    predictions[predictions_col],
-                    lambda pred: metadata['idx2str'][pred]
-                )
-
         probabilities_col = f'{self.feature_name}_{PROBABILITIES}'
-        if probabilities_col in predictions:
-            prob_col = f'{self.feature_name}_{PROBABILITY}'
-            predictions[prob_col] = predictions[probabilities_col].map(max)
-            predictions[probabilities_col] = backend.df_engine.map_objects(
-                predictions[probabilities_col],
-                lambda pred: pred.tolist()
-            )
-            if 'idx2str' in metadata:
-                for i, label in enumerate(metadata['idx2str']):
-                    key = f'{probabilities_col}_{label}'
-
-                    # Use default param to force a capture before the loop completes, see:
-                    # https://stackoverflow.com/questions/2295290/what-do-lambda-function-closures-capture
-                    predictions[key] = backend.df_engine.map_objects(
-                        predictions[probabilities_col],
-                        lambda prob, i=i: prob[i],
-                    )
-
+        prob_col = f'{self.feature_name}_{PROBABILITY}'
         top_k_col = f'{self.feature_name}_predictions_top_k'
-        if top_k_col in predictions:
-            if 'idx2str' in metadata:
-                predictions[top_k_col] = backend.df_engine.map_objects(
-                    predictions[top_k_col],
-                    lambda pred_top_k: [
-                        metadata['idx2str'][pred] for pred in pred_top_k
-                    ]
-                )
 
-        return predictions
+        idx2str = metadata.get('idx2str')
+        dtypes = dict(predictions.dtypes)
+        if predictions_col in predictions and idx2str is not None:
+            dtypes[predictions_col] = np.object_
+        if probabilities_col in predictions:
+            dtypes[probabilities_col] = np.object_
+            dtypes[prob_col] = np.float64
+            if idx2str is not None:
+                for label in idx2str:
+                    dtypes[f'{probabilities_col}_{label}'] = np.float64
+        if top_k_col in predictions and idx2str is not None:
+            dtypes[top_k_col] = np.object_
+
+        return backend.df_engine.map_partitions(
+            predictions,
+            partial(
+                _decode_predictions,
+                idx2str=idx2str,
+                predictions_col=predictions_col,
+                probabilities_col=probabilities_col,
+                prob_col=prob_col,
+                top_k_col=top_k_col
+            ),
+            meta=list(dtypes.items())
+        )
 
     @staticmethod
     def populate_defaults(output_feature):
@@ -506,3 +526,57 @@ class CategoryOutputFeature(CategoryFeatureMixin, OutputFeature):
         'None': Classifier,
         None: Classifier
     }
+
+
+def _encode_categories(column, idx2str, unknown_idx, dtype,
+                       partition_info=None):
+    # values that are not in the vocabulary get the code -1
+    codes = pd.Categorical(column.str.strip(), categories=idx2str).codes
+    codes = np.where(codes < 0, unknown_idx, codes).astype(dtype)
+    return pd.Series(codes, index=column.index, name=column.name)
+
+
+def _stack_rows(column, num_columns):
+    if len(column) == 0:
+        return np.zeros((0, num_columns))
+    return column_to_numpy(column)
+
+
+def _decode_predictions(predictions, idx2str, predictions_col,
+                        probabilities_col, prob_col, top_k_col,
+                        partition_info=None):
+    predictions = predictions.copy()
+    num_classes = len(idx2str) if idx2str is not None else 0
+    if idx2str is not None:
+        idx2str = np.asarray(idx2str, dtype=np.object_)
+
+    if predictions_col in predictions and idx2str is not None:
+        predictions[predictions_col] = idx2str[
+            predictions[predictions_col].to_numpy().astype(np.int64)
+        ]
+
+    if probabilities_col in predictions:
+        probabilities = _stack_rows(
+            predictions[probabilities_col], num_classes
+        )
+        # probabilities are not negative, initial only matters when
+        # there are no classes to reduce over
+        predictions[prob_col] = probabilities.max(axis=1, initial=0)
+        predictions[probabilities_col] = pd.Series(
+            probabilities.tolist(), index=predictions.index, dtype=np.object_
+        )
+        if idx2str is not None:
+            probabilities = pd.DataFrame(
+                probabilities,
+                index=predictions.index,
+                columns=[f'{probabilities_col}_{label}' for label in idx2str]
+            )
+            predictions = pd.concat([predictions, probabilities], axis=1)
+
+    if top_k_col in predictions and idx2str is not None:
+        top_k = _stack_rows(predictions[top_k_col], 0).astype(np.int64)
+        predictions[top_k_col] = pd.Series(
+            idx2str[top_k].tolist(), index=predictions.index, dtype=np.object_
+        )
+
+    return predictions
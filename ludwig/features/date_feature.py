@@ -19,12 +19,16 @@ from datetime import date
 from datetime import datetime
 
 import numpy as np
+import pandas as pd
 import tensorflow as tf
 from dateutil.parser import parse
+from pandas.api.types import is_datetime64_any_dtype
 
 from ludwig.constants import *
+from ludwig.data.dataframe.tensor import TensorArray, TensorDtype
 from ludwig.encoders.date_encoders import ENCODER_REGISTRY
 from ludwig.features.base_feature import InputFeature
+from ludwig.features.meta_accumulators import FirstChunkAccumulator
 from ludwig.utils.misc_utils import set_default_value
 
 logger = logging.getLogger(__name__)
@@ -57,6 +61,12 @@ class DateFeatureMixin:
             'preprocessing': preprocessing_parameters
         }
 
+    @staticmethod
+    def get_meta_accumulator(preprocessing_parameters, backend):
+        return FirstChunkAccumulator(
+            DateFeatureMixin.get_feature_meta, preprocessing_parameters, backend
+        )
+
     @staticmethod
     def date_to_list(date_str, datetime_format, preprocessing_parameters):
         try:
@@ -75,12 +85,21 @@ class DateFeatureMixin:
                 'https://ludwig.ai/user_guide/#date-features-preprocessing'
                     .format(date_str)
             )
-            fill_value = preprocessing_parameters['fill_value']
-            if fill_value != '':
-                datetime_obj = parse(fill_value)
-            else:
-                datetime_obj = datetime.now()
+            datetime_obj = DateFeatureMixin.get_fill_datetime(
+                preprocessing_parameters
+            )
+
+        return DateFeatureMixin.datetime_to_list(datetime_obj)
+
+    @staticmethod
+    def get_fill_datetime(preprocessing_parameters):
+        fill_value = preprocessing_parameters['fill_value']
+        if fill_value != '':
+            return parse(fill_value)
+        return datetime.now()
 
+    @staticmethod
+    def datetime_to_list(datetime_obj):
         yearday = (
                 datetime_obj.toordinal() -
                 date(datetime_obj.year, 1, 1).toordinal() + 1
@@ -103,6 +122,55 @@ class DateFeatureMixin:
             second_of_day
         ]
 
+    @staticmethod
+    def dates_to_matrix(column, datetime_format, preprocessing_parameters):
+        """Returns the [len(column) x DATE_VECTOR_LENGTH] matrix of the
+        components of the dates in `column`, parsed all at once."""
+        datetimes = pd.to_datetime(
+            column, format=datetime_format, errors='coerce'
+        )
+        if not is_datetime64_any_dtype(datetimes):
+            # like dates with different timezone offsets,
+            # which can only be parsed one by one
+            return np.array([
+                DateFeatureMixin.date_to_list(
+                    date_str, datetime_format, preprocessing_parameters
+                )
+                for date_str in column
+            ], dtype=np.int16).reshape(-1, DATE_VECTOR_LENGTH)
+
+        datetimes = datetimes.dt
+        components = [
+            datetimes.year,
+            datetimes.month,
+            datetimes.day,
+            datetimes.weekday,
+            datetimes.dayofyear,
+            datetimes.hour,
+            datetimes.minute,
+            datetimes.second,
+            datetimes.hour * 3600 + datetimes.minute * 60 + datetimes.second
+        ]
+        # components of dates that could not be parsed are NaN
+        matrix = np.stack(
+            [component.fillna(0).to_numpy() for component in components],
+            axis=1
+        ).astype(np.int16).reshape(-1, DATE_VECTOR_LENGTH)
+
+        # dates outside of the range of pandas timestamps (years 1677 to
+        # 2262) cannot be parsed all at once, so the dates that could not be
+        # parsed are parsed again one by one, and only the ones that cannot
+        # be parsed at all get the fill value
+        invalid = components[0].isna().to_numpy()
+        if invalid.any():
+            matrix[invalid] = np.array([
+                DateFeatureMixin.date_to_list(
+                    date_str, datetime_format, preprocessing_parameters
+                )
+                for date_str in column[invalid]
+            ], dtype=np.int16).reshape(-1, DATE_VECTOR_LENGTH)
+        return matrix
+
     @staticmethod
     def add_feature_data(
             feature,
@@ -114,11 +182,17 @@ class DateFeatureMixin:
             skip_save_processed_input
     ):
         datetime_format = preprocessing_parameters['datetime_format']
-        proc_df[feature[PROC_COLUMN]] = backend.df_engine.map_objects(
-            input_df[feature[COLUMN]],
-            lambda x: np.array(DateFeatureMixin.date_to_list(
-                x, datetime_format, preprocessing_parameters
-            ), dtype=np.int16)
+
+        def parse_partition(column, partition_info=None):
+            matrix = DateFeatureMixin.dates_to_matrix(
+                column, datetime_format, preprocessing_parameters
+            )
+            return pd.Series(TensorArray(matrix), index=column.index,
+                             name=column.name)
+
+        column = input_df[feature[COLUMN]]
+        proc_df[feature[PROC_COLUMN]] = backend.df_engine.map_partitions(
+            column, parse_partition, meta=(column.name, TensorDtype(np.int16))
         )
         return proc_df
 
@@ -17,12 +17,13 @@
 import re
 
 import numpy as np
+import pandas as pd
 
 from ludwig.constants import SEQUENCE, PREPROCESSING, NAME
 from ludwig.constants import TEXT
 from ludwig.constants import TIMESERIES
 from ludwig.utils.misc_utils import hash_dict
-from ludwig.utils.strings_utils import UNKNOWN_SYMBOL
+from ludwig.utils.strings_utils import PADDING_IDX, UNKNOWN_SYMBOL
 from ludwig.utils.strings_utils import tokenizer_registry
 
 SEQUENCE_TYPES = {SEQUENCE, TEXT, TIMESERIES}
@@ -44,12 +45,36 @@ def set_str_to_idx(set_string, feature_dict, tokenizer_name):
     except ValueError:
         raise Exception('Tokenizer {} not supported'.format(tokenizer_name))
 
+    return set_units_to_idx(tokenizer(set_string), feature_dict)
+
+
+def set_units_to_idx(units, feature_dict):
     out = [feature_dict.get(item, feature_dict[UNKNOWN_SYMBOL]) for item in
-           tokenizer(set_string)]
+           units]
 
     return np.array(out, dtype=np.int32)
 
 
+def pad_indices(indices, min_length, dtype, processor):
+    """Pads the arrays of indices of every row of `indices` with PADDING_IDX
+    to the same length, the length of the longest one or `min_length`, like
+    the max_set_size of set and bag features, whichever is larger. Rows of
+    datasets other than the one the metadata was built from can be longer,
+    and their indices are kept rather than truncated."""
+    indices = processor.persist(indices)
+    max_length = processor.compute(processor.map_objects(indices, len).max())
+    length = min_length if pd.isna(max_length) else max(
+        min_length, int(max_length)
+    )
+
+    def pad(row_indices):
+        vector = np.full(length, PADDING_IDX, dtype=dtype)
+        vector[:len(row_indices)] = row_indices
+        return vector
+
+    return processor.map_objects(indices, pad)
+
+
 def sanitize(name):
     """Replaces invalid id characters."""
     return re.sub('\W|^(?=\d)', '_', name)
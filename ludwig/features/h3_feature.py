@@ -17,12 +17,15 @@
 import logging
 
 import numpy as np
+import pandas as pd
 import tensorflow as tf
 
 from ludwig.constants import *
+from ludwig.data.dataframe.tensor import TensorArray, TensorDtype
 from ludwig.encoders.h3_encoders import ENCODER_REGISTRY
 from ludwig.features.base_feature import InputFeature
-from ludwig.utils.h3_util import h3_to_components
+from ludwig.features.meta_accumulators import FirstChunkAccumulator
+from ludwig.utils.h3_util import h3_to_components, h3_to_components_matrix
 from ludwig.utils.misc_utils import set_default_value
 
 logger = logging.getLogger(__name__)
@@ -55,6 +58,12 @@ class H3FeatureMixin:
     def get_feature_meta(column, preprocessing_parameters, backend):
         return {}
 
+    @staticmethod
+    def get_meta_accumulator(preprocessing_parameters, backend):
+        return FirstChunkAccumulator(
+            H3FeatureMixin.get_feature_meta, preprocessing_parameters, backend
+        )
+
     @staticmethod
     def h3_to_list(h3_int):
         components = h3_to_components(h3_int)
@@ -79,14 +88,20 @@ class H3FeatureMixin:
             backend,
             skip_save_processed_input
     ):
-        column = input_df[feature[COLUMN]]
-        if column.dtype == object:
-            column = column.map(int)
-        column = column.map(H3FeatureMixin.h3_to_list)
+        def decode_partition(column, partition_info=None):
+            if column.dtype == object:
+                column = column.map(int)
+            matrix = h3_to_components_matrix(
+                column.to_numpy(),
+                max_resolution=MAX_H3_RESOLUTION,
+                padding_value=H3_PADDING_VALUE
+            )
+            return pd.Series(TensorArray(matrix), index=column.index,
+                             name=column.name)
 
-        proc_df[feature[PROC_COLUMN]] = backend.df_engine.map_objects(
-            column,
-            lambda x: np.array(x, dtype=np.uint8)
+        column = input_df[feature[COLUMN]]
+        proc_df[feature[PROC_COLUMN]] = backend.df_engine.map_partitions(
+            column, decode_partition, meta=(column.name, TensorDtype(np.uint8))
         )
         return proc_df
 
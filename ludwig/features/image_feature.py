@@ -25,18 +25,26 @@ import numpy as np
 import tensorflow as tf
 
 from ludwig.constants import *
+from ludwig.data.dataframe.tensor import TensorArray
 from ludwig.encoders.image_encoders import ENCODER_REGISTRY
 from ludwig.features.base_feature import InputFeature
+from ludwig.features.meta_accumulators import FirstChunkAccumulator
 from ludwig.utils.data_utils import get_abs_path
 from ludwig.utils.fs_utils import upload_h5
 from ludwig.utils.image_utils import greyscale
 from ludwig.utils.image_utils import num_channels_in_image
 from ludwig.utils.image_utils import resize_image
 from ludwig.utils.image_utils import get_image_from_path, read_image
+from ludwig.utils.image_utils import read_images
 from ludwig.utils.misc_utils import set_default_value
 
 logger = logging.getLogger(__name__)
 
+# number of images each worker process reads at a time
+IMAGE_READ_CHUNK_SIZE = 64
+# size of the blocks of images written at once into the hdf5 cache
+IMAGE_WRITE_BLOCK_BYTES = 64 * 1024 * 1024
+
 
 image_scaling_registry = {
     'pixel_normalization': lambda x: x * 1.0 / 255,
@@ -50,6 +58,7 @@ class ImageFeatureMixin:
     preprocessing_defaults = {
         'missing_value_strategy': BACKFILL,
         'in_memory': True,
+        'lazy_load_cache_mb': 256,
         'resize_method': 'interpolate',
         'scaling': 'pixel_normalization',
         'num_processes': 1,
@@ -62,6 +71,7 @@ class ImageFeatureMixin:
     preprocessing_schema = {
         'missing_value_strategy': {'type': 'string', 'enum': MISSING_VALUE_STRATEGY_OPTIONS},
         'in_memory': {'type': 'boolean'},
+        'lazy_load_cache_mb': {'type': 'number', 'minimum': 0},
         'resize_method': {'type': 'string', 'enum': RESIZE_METHODS},
         'scaling': {'type': 'string', 'enum': list(image_scaling_registry.keys())},
         'num_processes': {'type': 'integer', 'minimum': 0},
@@ -84,6 +94,12 @@ class ImageFeatureMixin:
             PREPROCESSING: preprocessing_parameters
         }
 
+    @staticmethod
+    def get_meta_accumulator(preprocessing_parameters, backend):
+        return FirstChunkAccumulator(
+            ImageFeatureMixin.get_feature_meta, preprocessing_parameters, backend
+        )
+
     @staticmethod
     def _read_image_and_resize(
             img_entry: Union[str, 'numpy.array'],
@@ -114,7 +130,12 @@ class ImageFeatureMixin:
         If the user specifies a number of channels, we try to convert all the
         images to the specifications by dropping channels/padding 0 channels
         """
-        img = read_image(img_entry)
+        # decoding at a reduced scale is only equivalent to decoding at full
+        # scale when the image is then interpolated, not cropped or padded
+        draft_size = None
+        if should_resize and resize_method == INTERPOLATE:
+            draft_size = (img_height, img_width)
+        img = read_image(img_entry, draft_size)
         img_num_channels = num_channels_in_image(img)
         if img_num_channels == 1:
             img = img.reshape((img.shape[0], img.shape[1], 1))
@@ -250,6 +271,33 @@ class ImageFeatureMixin:
             first_image
         )
 
+    @staticmethod
+    def _write_images_to_h5(image_dataset, images):
+        """
+        Writes the images, in order, into the [num_images x height x width x
+        num_channels] HDF5 dataset, buffering them to write blocks of about
+        IMAGE_WRITE_BLOCK_BYTES at once instead of one image at a time.
+        """
+        num_images = image_dataset.shape[0]
+        image_shape = image_dataset.shape[1:]
+        block_size = max(1, min(
+            num_images,
+            IMAGE_WRITE_BLOCK_BYTES // max(1, int(np.prod(image_shape)))
+        ))
+        block = np.empty((block_size,) + image_shape, dtype=np.uint8)
+
+        start = 0
+        block_len = 0
+        for img in images:
+            block[block_len] = img
+            block_len += 1
+            if block_len == block_size:
+                image_dataset[start:start + block_len] = block
+                start += block_len
+                block_len = 0
+        if block_len > 0:
+            image_dataset[start:start + block_len] = block[:block_len]
+
     @staticmethod
     def add_feature_data(
             feature,
@@ -328,29 +376,32 @@ class ImageFeatureMixin:
                 'num_processes'] = num_processes
             metadata[feature[NAME]]['reshape'] = (height, width, num_channels)
 
-            # Split the dataset into pools only if we have an explicit request to use
-            # multiple processes. In case we have multiple input images use the
-            # standard code anyway.
+            # Read the images with a pool of num_processes threads directly
+            # into a single array. In case we have a single input image use
+            # the standard code.
             if backend.supports_multiprocessing and (
                     num_processes > 1 or num_images > 1):
                 all_img_entries = [get_abs_path(src_path, img_entry)
                                    if isinstance(img_entry, str) else img_entry
                                    for img_entry in input_df[feature[COLUMN]]]
 
-                with Pool(num_processes) as pool:
-                    logger.debug(
-                        'Using {} processes for preprocessing images'.format(
-                            num_processes
-                        )
-                    )
-                    proc_df[feature[PROC_COLUMN]] = pool.map(
-                        read_image_and_resize, all_img_entries
+                logger.debug(
+                    'Using {} threads for preprocessing images'.format(
+                        num_processes
                     )
+                )
+                images = read_images(
+                    all_img_entries,
+                    read_image_and_resize,
+                    (height, width, num_channels),
+                    num_threads=num_processes
+                )
+                proc_df[feature[PROC_COLUMN]] = TensorArray(images)
             else:
-                # If we're not running multiple processes and we are only processing one
-                # image just use this faster shortcut, bypassing multiprocessing.Pool.map
+                # If we are only processing one image or the backend does not
+                # support it, just use this shortcut, bypassing the thread pool
                 logger.debug(
-                    'No process pool initialized. Using internal process for preprocessing images'
+                    'No thread pool initialized. Using internal process for preprocessing images'
                 )
 
                 # helper function for handling single image
@@ -376,15 +427,34 @@ class ImageFeatureMixin:
                 metadata.get(SRC), metadata.get(CHECKSUM), TRAINING
             )
             with upload_h5(data_fp) as h5_file:
-                # todo future add multiprocessing/multithreading
                 image_dataset = h5_file.create_dataset(
                     feature[PROC_COLUMN] + '_data',
                     (num_images, height, width, num_channels),
                     dtype=np.uint8
                 )
-                for i, img_entry in enumerate(all_img_entries):
-                    image_dataset[i, :height, :width, :] = (
-                        read_image_and_resize(img_entry)
+                if backend.supports_multiprocessing and num_processes > 1:
+                    with Pool(num_processes) as pool:
+                        logger.debug(
+                            'Using {} processes for preprocessing images'
+                            .format(num_processes)
+                        )
+                        # the images are read in parallel and returned in
+                        # order to this process, which is the only writer
+                        ImageFeatureMixin._write_images_to_h5(
+                            image_dataset,
+                            pool.imap(
+                                read_image_and_resize,
+                                all_img_entries,
+                                chunksize=max(1, min(
+                                    IMAGE_READ_CHUNK_SIZE,
+                                    num_images // (num_processes * 4)
+                                ))
+                            )
+                        )
+                else:
+                    ImageFeatureMixin._write_images_to_h5(
+                        image_dataset,
+                        map(read_image_and_resize, all_img_entries)
                     )
                 h5_file.flush()
 
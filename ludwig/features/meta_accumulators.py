@@ -0,0 +1,302 @@
+#! /usr/bin/env python
+# coding=utf-8
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Accumulators of the statistics the metadata of the features is built from.
+
+An accumulator is updated with the chunks of a column one at a time and
+only keeps what is needed to build the metadata (unit counts, running
+moments, maximum lengths), so the metadata of a dataset can be computed
+without holding all of it in memory. Accumulators updated with different
+parts of a column, like the partitions of a distributed DataFrame, can be
+merged together, and can keep being updated after being finalized. Every
+feature mixin returns its own accumulator from `get_meta_accumulator`.
+"""
+from abc import ABC, abstractmethod
+from collections import Counter
+
+import numpy as np
+
+from ludwig.data.dataframe.pandas import PANDAS
+from ludwig.utils.strings_utils import build_vocabulary, count_units
+
+
+class MetaAccumulator(ABC):
+
+    @abstractmethod
+    def update(self, column):
+        """Accumulates the statistics of a chunk of the column."""
+        pass
+
+    @abstractmethod
+    def merge(self, other):
+        """Adds the statistics accumulated by `other`, an accumulator of the
+        same kind, to this one and returns it."""
+        pass
+
+    @abstractmethod
+    def finalize(self):
+        """Returns the result computed from all the chunks seen so far."""
+        pass
+
+
+class FeatureMetaAccumulator(MetaAccumulator):
+    """Builds the metadata of a feature with `build_meta`, called with the
+    results of the named accumulators, which are all updated with the same
+    chunks of the column."""
+
+    def __init__(self, build_meta, **accumulators):
+        self.build_meta = build_meta
+        self.accumulators = accumulators
+
+    def update(self, column):
+        for accumulator in self.accumulators.values():
+            accumulator.update(column)
+
+    def update_tokens(self, **tokens):
+        """Updates the named vocabulary accumulators with chunks of the
+        column that have already been tokenized."""
+        for name, chunk_tokens in tokens.items():
+            self.accumulators[name].update_tokens(chunk_tokens)
+
+    def update_stats(self, **stats):
+        """Updates the named numeric statistics accumulators with the
+        statistics of chunks of the column that have already been computed,
+        like the ones of `compute_numeric_stats`."""
+        for name, chunk_stats in stats.items():
+            self.accumulators[name].merge(chunk_stats)
+
+    def merge(self, other):
+        for name, accumulator in self.accumulators.items():
+            accumulator.merge(other.accumulators[name])
+        return self
+
+    def finalize(self):
+        return self.build_meta(**{
+            name: accumulator.finalize()
+            for name, accumulator in self.accumulators.items()
+        })
+
+
+class VocabularyAccumulator(MetaAccumulator):
+    """Counts the units of the chunks tokenized by `tokenize_fn`, and builds
+    the vocabulary of `build_vocabulary` with `vocabulary_kwargs`."""
+
+    def __init__(self, tokenize_fn, processor=PANDAS, **vocabulary_kwargs):
+        self.tokenize_fn = tokenize_fn
+        self.processor = processor
+        self.vocabulary_kwargs = vocabulary_kwargs
+        self.unit_counts = Counter()
+        self.max_line_length = 0
+
+    def update(self, column):
+        self.update_tokens(self.tokenize_fn(column.astype(str)))
+
+    def update_tokens(self, tokens):
+        if len(tokens) == 0:
+            return
+        unit_counts, max_line_length = count_units(tokens, self.processor)
+        self.unit_counts.update(unit_counts)
+        self.max_line_length = max(self.max_line_length, max_line_length)
+
+    def merge(self, other):
+        self.unit_counts.update(other.unit_counts)
+        self.max_line_length = max(self.max_line_length, other.max_line_length)
+        return self
+
+    def finalize(self):
+        return build_vocabulary(
+            self.unit_counts,
+            self.max_line_length,
+            **self.vocabulary_kwargs
+        )
+
+
+class NumericStatsAccumulator(MetaAccumulator):
+    """Accumulates the count, mean, standard deviation, minimum and maximum
+    of the non missing values of a numeric column. The moments of the chunks
+    are combined pairwise, which is numerically stable."""
+
+    def __init__(self, processor=PANDAS):
+        self.processor = processor
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def update(self, column):
+        compute = self.processor.compute
+        column = column.astype(np.float64)
+        count = int(compute(column.count()))
+        if count == 0:
+            return
+        mean = float(compute(column.mean()))
+        self._combine(
+            count,
+            mean,
+            float(compute(((column - mean) ** 2).sum())),
+            float(compute(column.min())),
+            float(compute(column.max()))
+        )
+
+    @classmethod
+    def of_constant(cls, value, count):
+        """Returns the statistics of `count` values all equal to `value`."""
+        stats = cls()
+        if count > 0:
+            value = float(value)
+            stats._combine(count, value, 0.0, value, value)
+        return stats
+
+    def merge(self, other):
+        if other.count > 0:
+            self._combine(other.count, other.mean, other.m2,
+                          other.min, other.max)
+        return self
+
+    def _combine(self, count, mean, m2, min_value, max_value):
+        total = self.count + count
+        delta = mean - self.mean
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.mean += delta * count / total
+        self.count = total
+        self.min = min_value if self.min is None else min(self.min, min_value)
+        self.max = max_value if self.max is None else max(self.max, max_value)
+
+    def finalize(self):
+        return {
+            'count': self.count,
+            'mean': self.mean if self.count else np.nan,
+            # sample standard deviation, like pandas
+            'std': np.sqrt(self.m2 / (self.count - 1))
+            if self.count > 1 else np.nan,
+            'min': self.min if self.count else np.nan,
+            'max': self.max if self.count else np.nan,
+        }
+
+
+def compute_numeric_stats(columns, block_size=2 ** 24):
+    """Returns the NumericStatsAccumulators of the named pandas numeric
+    columns, computed with vectorized reductions over the matrix of the
+    values of many columns at once, instead of several passes per column.
+    The values are float32 like the processed numerical columns, while the
+    sums are accumulated in double precision. The columns are stacked in
+    blocks of about `block_size` values, which bounds the memory used."""
+    names = list(columns)
+    num_rows = len(columns[names[0]]) if names else 0
+    columns_per_block = max(1, block_size // max(num_rows, 1))
+
+    stats = {}
+    for start in range(0, len(names), columns_per_block):
+        block_names = names[start:start + columns_per_block]
+        values = np.stack([
+            columns[name].to_numpy(dtype=np.float32) for name in block_names
+        ])
+        # fmin and fmax ignore missing values
+        mins = np.fmin.reduce(values, axis=1)
+        maxs = np.fmax.reduce(values, axis=1)
+
+        missing = np.isnan(values)
+        counts = num_rows - np.count_nonzero(missing, axis=1)
+        has_missing = counts.sum() < values.size
+        if has_missing:
+            values[missing] = 0
+        means = values.sum(axis=1, dtype=np.float64) / np.maximum(counts, 1)
+
+        # the stacked values are replaced by their squared deviations
+        values -= means.astype(np.float32)[:, np.newaxis]
+        if has_missing:
+            values[missing] = 0
+        np.square(values, out=values)
+        m2s = values.sum(axis=1, dtype=np.float64)
+
+        for i, name in enumerate(block_names):
+            stats[name] = NumericStatsAccumulator()
+            if counts[i] > 0:
+                stats[name]._combine(int(counts[i]), float(means[i]),
+                                     float(m2s[i]), float(mins[i]),
+                                     float(maxs[i]))
+    return stats
+
+
+class DistinctValuesAccumulator(MetaAccumulator):
+    """Collects the distinct values of a column, in order of appearance."""
+
+    def __init__(self, processor=PANDAS):
+        self.processor = processor
+        self.values = {}
+
+    def update(self, column):
+        distinct_values = self.processor.compute(column.drop_duplicates())
+        self.values.update(dict.fromkeys(distinct_values))
+
+    def merge(self, other):
+        self.values.update(other.values)
+        return self
+
+    def finalize(self):
+        return list(self.values)
+
+
+class MaxLengthAccumulator(MetaAccumulator):
+    """Keeps the maximum of the lengths `length_fn` returns for every row."""
+
+    def __init__(self, length_fn, processor=PANDAS):
+        self.length_fn = length_fn
+        self.processor = processor
+        self.max_length = 0
+
+    def update(self, column):
+        if len(column) == 0:
+            return
+        max_length = self.processor.compute(self.length_fn(column).max())
+        self.max_length = max(self.max_length, int(max_length or 0))
+
+    def merge(self, other):
+        self.max_length = max(self.max_length, other.max_length)
+        return self
+
+    def finalize(self):
+        return self.max_length
+
+
+class FirstChunkAccumulator(MetaAccumulator):
+    """For features whose metadata only depends on the preprocessing
+    parameters or on their first value: calls `get_feature_meta` on the
+    first non empty chunk of the column. When merging, the metadata of the
+    accumulator of the earlier chunks is kept."""
+
+    def __init__(self, get_feature_meta, preprocessing_parameters, backend):
+        self.get_feature_meta = get_feature_meta
+        self.preprocessing_parameters = preprocessing_parameters
+        self.backend = backend
+        self.meta = None
+
+    def update(self, column):
+        if self.meta is None and len(column) > 0:
+            self.meta = self.get_feature_meta(
+                column.reset_index(drop=True),
+                self.preprocessing_parameters,
+                self.backend
+            )
+
+    def merge(self, other):
+        if self.meta is None:
+            self.meta = other.meta
+        return self
+
+    def finalize(self):
+        return dict(self.meta) if self.meta is not None else {}
@@ -32,6 +32,8 @@ from ludwig.decoders.generic_decoders import Regressor
 from ludwig.encoders.generic_encoders import PassthroughEncoder, DenseEncoder
 from ludwig.features.base_feature import InputFeature
 from ludwig.features.base_feature import OutputFeature
+from ludwig.features.meta_accumulators import FeatureMetaAccumulator, \
+    NumericStatsAccumulator
 from ludwig.modules.loss_modules import MSELoss, MAELoss, RMSELoss, RMSPELoss
 from ludwig.modules.metric_modules import (
     MAEMetric,
@@ -67,6 +69,10 @@ class ZScoreTransformer:
             "std": compute(column.astype(np.float32).std()),
         }
 
+    @staticmethod
+    def transform_params_from_stats(stats: dict) -> dict:
+        return {"mean": stats["mean"], "std": stats["std"]}
+
 
 class MinMaxTransformer:
     def __init__(self, min: float = None, max: float = None, **kwargs: dict):
@@ -93,6 +99,10 @@ class MinMaxTransformer:
             "max": compute(column.astype(np.float32).max()),
         }
 
+    @staticmethod
+    def transform_params_from_stats(stats: dict) -> dict:
+        return {"min": stats["min"], "max": stats["max"]}
+
 
 class Log1pTransformer:
     def __init__(self, **kwargs: dict):
@@ -113,6 +123,10 @@ class Log1pTransformer:
     def fit_transform_params(column: np.ndarray, backend: "Backend") -> dict:
         return {}
 
+    @staticmethod
+    def transform_params_from_stats(stats: dict) -> dict:
+        return {}
+
 
 class IdentityTransformer:
     def __init__(self, **kwargs):
@@ -128,6 +142,10 @@ class IdentityTransformer:
     def fit_transform_params(column: np.ndarray, backend: "Backend") -> dict:
         return {}
 
+    @staticmethod
+    def transform_params_from_stats(stats: dict) -> dict:
+        return {}
+
 
 numeric_transformation_registry = {
     "minmax": MinMaxTransformer,
@@ -173,6 +191,18 @@ class NumericalFeatureMixin:
 
         return numeric_transformer.fit_transform_params(column, backend)
 
+    @staticmethod
+    def get_meta_accumulator(preprocessing_parameters, backend):
+        numeric_transformer = get_from_registry(
+            preprocessing_parameters.get("normalization", None),
+            numeric_transformation_registry,
+        )
+
+        return FeatureMetaAccumulator(
+            numeric_transformer.transform_params_from_stats,
+            stats=NumericStatsAccumulator(backend.df_engine),
+        )
+
     @staticmethod
     def add_feature_data(
             feature,
@@ -25,6 +25,8 @@ from ludwig.encoders.sequence_encoders import \
 from ludwig.encoders.text_encoders import *
 from ludwig.features.base_feature import InputFeature
 from ludwig.features.base_feature import OutputFeature
+from ludwig.features.meta_accumulators import FeatureMetaAccumulator, \
+    VocabularyAccumulator
 from ludwig.modules.loss_modules import SequenceSampledSoftmaxCrossEntropyLoss
 from ludwig.modules.loss_modules import SequenceSoftmaxCrossEntropyLoss
 from ludwig.modules.metric_modules import EditDistanceMetric, \
@@ -40,7 +42,7 @@ from ludwig.utils.misc_utils import set_default_value
 from ludwig.utils.strings_utils import PADDING_SYMBOL
 from ludwig.utils.strings_utils import UNKNOWN_SYMBOL
 from ludwig.utils.strings_utils import build_sequence_matrix
-from ludwig.utils.strings_utils import create_vocabulary
+from ludwig.utils.strings_utils import tokenize
 from ludwig.utils.strings_utils import tokenizer_registry
 
 logger = logging.getLogger(__name__)
@@ -58,6 +60,7 @@ class SequenceFeatureMixin:
         'tokenizer': 'space',
         'lowercase': False,
         'vocab_file': None,
+        'num_processes': 1,
         'missing_value_strategy': FILL_WITH_CONST,
         'fill_value': UNKNOWN_SYMBOL
     }
@@ -70,6 +73,7 @@ class SequenceFeatureMixin:
         'padding': {'type': 'string', 'enum': ['right', 'left']},
         'tokenizer': {'type': 'string', 'enum': sorted(list(tokenizer_registry.keys()))},
         'lowercase': {'type': 'boolean'},
+        'num_processes': {'type': 'integer', 'minimum': 0},
         'missing_value_strategy': {'type': 'string', 'enum': MISSING_VALUE_STRATEGY_OPTIONS},
         'fill_value': {'type': 'string'},
         'computed_fill_value': {'type': 'string'},
@@ -81,30 +85,65 @@ class SequenceFeatureMixin:
 
     @staticmethod
     def get_feature_meta(column, preprocessing_parameters, backend):
-        column = column.astype(str)
-        idx2str, str2idx, str2freq, max_length, _, _, _ = create_vocabulary(
-            column, preprocessing_parameters['tokenizer'],
-            lowercase=preprocessing_parameters['lowercase'],
-            num_most_frequent=preprocessing_parameters['most_common'],
-            vocab_file=preprocessing_parameters['vocab_file'],
-            unknown_symbol=preprocessing_parameters['unknown_symbol'],
-            padding_symbol=preprocessing_parameters['padding_symbol'],
-            processor=backend.df_engine
+        tokens = SequenceFeatureMixin.tokenize(
+            column.astype(str), preprocessing_parameters, backend
         )
-        max_length = min(
-            preprocessing_parameters['sequence_length_limit'],
-            max_length
+        accumulator = SequenceFeatureMixin.get_meta_accumulator(
+            preprocessing_parameters, backend
         )
+        accumulator.update_tokens(vocabulary=tokens)
         return {
-            'idx2str': idx2str,
-            'str2idx': str2idx,
-            'str2freq': str2freq,
-            'vocab_size': len(idx2str),
-            'max_sequence_length': max_length
+            **accumulator.finalize(),
+            # the tokens are reused by add_feature_data, which removes them
+            'tokens': tokens,
         }
 
     @staticmethod
-    def feature_data(column, metadata, preprocessing_parameters, backend):
+    def get_meta_accumulator(preprocessing_parameters, backend):
+        def build_meta(vocabulary):
+            idx2str, str2idx, str2freq, max_length, _, _, _ = vocabulary
+            max_length = min(
+                preprocessing_parameters['sequence_length_limit'],
+                max_length
+            )
+            return {
+                'idx2str': idx2str,
+                'str2idx': str2idx,
+                'str2freq': str2freq,
+                'vocab_size': len(idx2str),
+                'max_sequence_length': max_length,
+            }
+
+        return FeatureMetaAccumulator(
+            build_meta,
+            vocabulary=VocabularyAccumulator(
+                lambda column: SequenceFeatureMixin.tokenize(
+                    column, preprocessing_parameters, backend
+                ),
+                backend.df_engine,
+                tokenizer_type=preprocessing_parameters['tokenizer'],
+                num_most_frequent=preprocessing_parameters['most_common'],
+                vocab_file=preprocessing_parameters['vocab_file'],
+                unknown_symbol=preprocessing_parameters['unknown_symbol'],
+                padding_symbol=preprocessing_parameters['padding_symbol']
+            )
+        )
+
+    @staticmethod
+    def tokenize(column, preprocessing_parameters, backend):
+        return tokenize(
+            column,
+            tokenizer_type=preprocessing_parameters['tokenizer'],
+            lowercase=preprocessing_parameters['lowercase'],
+            vocab_file=preprocessing_parameters['vocab_file'],
+            processor=backend.df_engine,
+            num_processes=(preprocessing_parameters['num_processes']
+                           if backend.supports_multiprocessing else 1)
+        )
+
+    @staticmethod
+    def feature_data(column, metadata, preprocessing_parameters, backend,
+                     tokens=None):
         sequence_data = build_sequence_matrix(
             sequences=column,
             inverse_vocabulary=metadata['str2idx'],
@@ -117,7 +156,10 @@ class SequenceFeatureMixin:
             tokenizer_vocab_file=preprocessing_parameters[
                 'vocab_file'
             ],
-            processor=backend.df_engine
+            processor=backend.df_engine,
+            num_processes=(preprocessing_parameters['num_processes']
+                           if backend.supports_multiprocessing else 1),
+            tokens=tokens
         )
         return sequence_data
 
@@ -134,7 +176,8 @@ class SequenceFeatureMixin:
         sequence_data = SequenceInputFeature.feature_data(
             input_df[feature[COLUMN]].astype(str),
             metadata[feature[NAME]], preprocessing_parameters,
-            backend
+            backend,
+            tokens=metadata[feature[NAME]].pop('tokens', None)
         )
         proc_df[feature[PROC_COLUMN]] = sequence_data
         return proc_df
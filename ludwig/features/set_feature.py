@@ -25,12 +25,16 @@ from ludwig.decoders.generic_decoders import Classifier
 from ludwig.encoders.set_encoders import ENCODER_REGISTRY
 from ludwig.features.base_feature import InputFeature
 from ludwig.features.base_feature import OutputFeature
-from ludwig.features.feature_utils import set_str_to_idx
+from ludwig.features.feature_utils import pad_indices, set_units_to_idx
+from ludwig.features.meta_accumulators import FeatureMetaAccumulator, \
+    VocabularyAccumulator
 from ludwig.modules.loss_modules import SigmoidCrossEntropyLoss
 from ludwig.modules.metric_modules import JaccardMetric
 from ludwig.modules.metric_modules import SigmoidCrossEntropyMetric
+from ludwig.utils.math_utils import int_type
 from ludwig.utils.misc_utils import set_default_value
-from ludwig.utils.strings_utils import create_vocabulary, tokenizer_registry, UNKNOWN_SYMBOL
+from ludwig.utils.strings_utils import tokenize, tokenizer_registry, UNKNOWN_SYMBOL
+from ludwig.utils.tf_utils import padded_indices_to_multi_hot
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +45,7 @@ class SetFeatureMixin:
         'tokenizer': 'space',
         'most_common': 10000,
         'lowercase': False,
+        'num_processes': 1,
         'missing_value_strategy': FILL_WITH_CONST,
         'fill_value': UNKNOWN_SYMBOL
     }
@@ -49,6 +54,7 @@ class SetFeatureMixin:
         'tokenizer': {'type': 'string', 'enum': sorted(list(tokenizer_registry.keys()))},
         'most_common': {'type': 'integer', 'minimum': 0},
         'lowercase': {'type': 'boolean'},
+        'num_processes': {'type': 'integer', 'minimum': 0},
         'missing_value_strategy': {'type': 'string', 'enum': MISSING_VALUE_STRATEGY_OPTIONS},
         'fill_value': {'type': 'string'},
         'computed_fill_value': {'type': 'string'},
@@ -60,36 +66,73 @@ class SetFeatureMixin:
 
     @staticmethod
     def get_feature_meta(column, preprocessing_parameters, backend):
-        column = column.astype(str)
-        idx2str, str2idx, str2freq, max_size, _, _, _ = create_vocabulary(
-            column,
-            preprocessing_parameters['tokenizer'],
-            num_most_frequent=preprocessing_parameters['most_common'],
-            lowercase=preprocessing_parameters['lowercase'],
-            processor=backend.df_engine
+        tokens = SetFeatureMixin.tokenize(
+            column.astype(str), preprocessing_parameters, backend
+        )
+        accumulator = SetFeatureMixin.get_meta_accumulator(
+            preprocessing_parameters, backend
         )
+        accumulator.update_tokens(vocabulary=tokens)
         return {
-            'idx2str': idx2str,
-            'str2idx': str2idx,
-            'str2freq': str2freq,
-            'vocab_size': len(str2idx),
-            'max_set_size': max_size
+            **accumulator.finalize(),
+            # the tokens are reused by add_feature_data, which removes them
+            'tokens': tokens,
         }
 
     @staticmethod
-    def feature_data(column, metadata, preprocessing_parameters, backend):
-        def to_dense(x):
-            feature_vector = set_str_to_idx(
-                x,
-                metadata['str2idx'],
-                preprocessing_parameters['tokenizer']
+    def get_meta_accumulator(preprocessing_parameters, backend):
+        def build_meta(vocabulary):
+            idx2str, str2idx, str2freq, max_size, _, _, _ = vocabulary
+            return {
+                'idx2str': idx2str,
+                'str2idx': str2idx,
+                'str2freq': str2freq,
+                'vocab_size': len(str2idx),
+                'max_set_size': max_size,
+            }
+
+        return FeatureMetaAccumulator(
+            build_meta,
+            vocabulary=VocabularyAccumulator(
+                lambda column: SetFeatureMixin.tokenize(
+                    column, preprocessing_parameters, backend
+                ),
+                backend.df_engine,
+                tokenizer_type=preprocessing_parameters['tokenizer'],
+                num_most_frequent=preprocessing_parameters['most_common']
+            )
+        )
+
+    @staticmethod
+    def tokenize(column, preprocessing_parameters, backend):
+        return tokenize(
+            column,
+            tokenizer_type=preprocessing_parameters['tokenizer'],
+            lowercase=preprocessing_parameters['lowercase'],
+            processor=backend.df_engine,
+            num_processes=(preprocessing_parameters['num_processes']
+                           if backend.supports_multiprocessing else 1)
+        )
+
+    @staticmethod
+    def feature_data(column, metadata, preprocessing_parameters, backend,
+                     tokens=None):
+        if tokens is None:
+            tokens = SetFeatureMixin.tokenize(
+                column, preprocessing_parameters, backend
             )
 
-            set_vector = np.zeros((len(metadata['str2idx']),))
-            set_vector[feature_vector] = 1
-            return set_vector.astype(np.bool)
+        def to_indices(set_units):
+            # the indices of the elements of the set
+            return np.unique(set_units_to_idx(set_units, metadata['str2idx']))
 
-        return backend.df_engine.map_objects(column, to_dense)
+        # padded to max_set_size, or to the size of the largest set if larger
+        return pad_indices(
+            backend.df_engine.map_objects(tokens, to_indices),
+            metadata['max_set_size'],
+            int_type(metadata['vocab_size']),
+            backend.df_engine
+        )
 
     @staticmethod
     def add_feature_data(
@@ -105,7 +148,8 @@ class SetFeatureMixin:
             input_df[feature[COLUMN]].astype(str),
             metadata[feature[NAME]],
             preprocessing_parameters,
-            backend
+            backend,
+            tokens=metadata[feature[NAME]].pop('tokens', None)
         )
         return proc_df
 
@@ -124,7 +168,9 @@ class SetInputFeature(SetFeatureMixin, InputFeature):
 
     def call(self, inputs, training=None, mask=None):
         assert isinstance(inputs, tf.Tensor)
-        assert inputs.dtype in [tf.bool, tf.int64]
+        assert inputs.dtype == tf.int8 or inputs.dtype == tf.int16 or \
+               inputs.dtype == tf.int32 or inputs.dtype == tf.int64
+        assert len(inputs.shape) == 2
 
         encoder_output = self.encoder_obj(
             inputs, training=training, mask=mask
@@ -134,10 +180,10 @@ class SetInputFeature(SetFeatureMixin, InputFeature):
 
     @classmethod
     def get_input_dtype(cls):
-        return tf.bool
+        return tf.int32
 
     def get_input_shape(self):
-        return len(self.vocab),
+        return None,
 
     @staticmethod
     def update_config_with_metadata(
@@ -227,12 +273,32 @@ class SetOutputFeature(SetFeatureMixin, OutputFeature):
             PREDICTIONS, PROBABILITIES, LOGITS
         }
 
+    # targets are the padded indices of the elements of the sets,
+    # the loss and the metrics compare them as multi-hot vectors
+    def train_loss(self, targets, predictions):
+        return super().train_loss(
+            padded_indices_to_multi_hot(targets, self.num_classes),
+            predictions
+        )
+
+    def eval_loss(self, targets, predictions):
+        return super().eval_loss(
+            padded_indices_to_multi_hot(targets, self.num_classes),
+            predictions
+        )
+
+    def update_metrics(self, targets, predictions):
+        super().update_metrics(
+            padded_indices_to_multi_hot(targets, self.num_classes),
+            predictions
+        )
+
     @classmethod
     def get_output_dtype(cls):
-        return tf.bool
+        return tf.int32
 
     def get_output_shape(self):
-        return self.num_classes,
+        return None,
 
     @staticmethod
     def update_config_with_metadata(
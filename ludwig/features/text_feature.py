@@ -22,6 +22,8 @@ import tensorflow as tf
 
 from ludwig.constants import *
 from ludwig.encoders.text_encoders import ENCODER_REGISTRY
+from ludwig.features.meta_accumulators import FeatureMetaAccumulator, \
+    VocabularyAccumulator
 from ludwig.features.sequence_feature import SequenceInputFeature
 from ludwig.features.sequence_feature import SequenceOutputFeature
 from ludwig.utils.math_utils import softmax
@@ -32,7 +34,7 @@ from ludwig.utils.misc_utils import set_default_values
 from ludwig.utils.strings_utils import PADDING_SYMBOL
 from ludwig.utils.strings_utils import UNKNOWN_SYMBOL
 from ludwig.utils.strings_utils import build_sequence_matrix
-from ludwig.utils.strings_utils import create_vocabulary
+from ludwig.utils.strings_utils import tokenize
 from ludwig.utils.strings_utils import tokenizer_registry
 
 
@@ -56,6 +58,7 @@ class TextFeatureMixin:
         'unknown_symbol': UNKNOWN_SYMBOL,
         'padding': 'right',
         'lowercase': True,
+        'num_processes': 1,
         'missing_value_strategy': FILL_WITH_CONST,
         'fill_value': UNKNOWN_SYMBOL
     }
@@ -74,6 +77,7 @@ class TextFeatureMixin:
         'unknown_symbol': {'type': 'string'},
         'padding': {'type': 'string', 'enum': ['right', 'left']},
         'lowercase': {'type': 'boolean'},
+        'num_processes': {'type': 'integer', 'minimum': 0},
         'missing_value_strategy': {'type': 'string', 'enum': MISSING_VALUE_STRATEGY_OPTIONS},
         'fill_value': {'type': 'string'},
         'computed_fill_value': {'type': 'string'},
@@ -84,114 +88,125 @@ class TextFeatureMixin:
         return column
 
     @staticmethod
-    def feature_meta(column, preprocessing_parameters, backend):
-        (
-            char_idx2str,
-            char_str2idx,
-            char_str2freq,
-            char_max_len,
-            char_pad_idx,
-            char_pad_symbol,
-            char_unk_symbol,
-        ) = create_vocabulary(
-            column,
-            tokenizer_type='characters',
-            num_most_frequent=preprocessing_parameters['char_most_common'],
-            lowercase=preprocessing_parameters['lowercase'],
-            unknown_symbol=preprocessing_parameters['unknown_symbol'],
-            padding_symbol=preprocessing_parameters['padding_symbol'],
-            pretrained_model_name_or_path=preprocessing_parameters[
-                'pretrained_model_name_or_path'],
-            processor=backend.df_engine
+    def get_feature_meta(column, preprocessing_parameters, backend):
+        char_tokens, word_tokens = TextFeatureMixin.tokenize(
+            column.astype(str), preprocessing_parameters, backend
         )
-        (
-            word_idx2str,
-            word_str2idx,
-            word_str2freq,
-            word_max_len,
-            word_pad_idx,
-            word_pad_symbol,
-            word_unk_symbol,
-        ) = create_vocabulary(
-            column,
-            tokenizer_type=preprocessing_parameters['word_tokenizer'],
-            num_most_frequent=preprocessing_parameters['word_most_common'],
-            lowercase=preprocessing_parameters['lowercase'],
-            vocab_file=preprocessing_parameters['word_vocab_file'],
-            unknown_symbol=preprocessing_parameters['unknown_symbol'],
-            padding_symbol=preprocessing_parameters['padding_symbol'],
-            pretrained_model_name_or_path=preprocessing_parameters[
-                'pretrained_model_name_or_path'],
-            processor=backend.df_engine
+        accumulator = TextFeatureMixin.get_meta_accumulator(
+            preprocessing_parameters, backend
         )
-        return (
-            char_idx2str,
-            char_str2idx,
-            char_str2freq,
-            char_max_len,
-            char_pad_idx,
-            char_pad_symbol,
-            char_unk_symbol,
-            word_idx2str,
-            word_str2idx,
-            word_str2freq,
-            word_max_len,
-            word_pad_idx,
-            word_pad_symbol,
-            word_unk_symbol,
+        accumulator.update_tokens(char=char_tokens, word=word_tokens)
+        return {
+            **accumulator.finalize(),
+            # the tokens are reused by add_feature_data, which removes them
+            'char_tokens': char_tokens,
+            'word_tokens': word_tokens,
+        }
+
+    @staticmethod
+    def get_meta_accumulator(preprocessing_parameters, backend):
+        def build_meta(char, word):
+            (
+                char_idx2str,
+                char_str2idx,
+                char_str2freq,
+                char_max_len,
+                char_pad_idx,
+                char_pad_symbol,
+                char_unk_symbol,
+            ) = char
+            (
+                word_idx2str,
+                word_str2idx,
+                word_str2freq,
+                word_max_len,
+                word_pad_idx,
+                word_pad_symbol,
+                word_unk_symbol,
+            ) = word
+            char_max_len = min(
+                preprocessing_parameters['char_sequence_length_limit'],
+                char_max_len
+            )
+            word_max_len = min(
+                preprocessing_parameters['word_sequence_length_limit'],
+                word_max_len
+            )
+            return {
+                'char_idx2str': char_idx2str,
+                'char_str2idx': char_str2idx,
+                'char_str2freq': char_str2freq,
+                'char_vocab_size': len(char_idx2str),
+                'char_max_sequence_length': char_max_len,
+                'char_pad_idx': char_pad_idx,
+                'char_pad_symbol': char_pad_symbol,
+                'char_unk_symbol': char_unk_symbol,
+                'word_idx2str': word_idx2str,
+                'word_str2idx': word_str2idx,
+                'word_str2freq': word_str2freq,
+                'word_vocab_size': len(word_idx2str),
+                'word_max_sequence_length': word_max_len,
+                'word_pad_idx': word_pad_idx,
+                'word_pad_symbol': word_pad_symbol,
+                'word_unk_symbol': word_unk_symbol,
+            }
+
+        return FeatureMetaAccumulator(
+            build_meta,
+            char=VocabularyAccumulator(
+                lambda column: TextFeatureMixin.tokenize_level(
+                    column, 'char', preprocessing_parameters, backend
+                ),
+                backend.df_engine,
+                tokenizer_type=preprocessing_parameters['char_tokenizer'],
+                num_most_frequent=preprocessing_parameters['char_most_common'],
+                unknown_symbol=preprocessing_parameters['unknown_symbol'],
+                padding_symbol=preprocessing_parameters['padding_symbol'],
+                pretrained_model_name_or_path=preprocessing_parameters[
+                    'pretrained_model_name_or_path'],
+            ),
+            word=VocabularyAccumulator(
+                lambda column: TextFeatureMixin.tokenize_level(
+                    column, 'word', preprocessing_parameters, backend
+                ),
+                backend.df_engine,
+                tokenizer_type=preprocessing_parameters['word_tokenizer'],
+                num_most_frequent=preprocessing_parameters['word_most_common'],
+                vocab_file=preprocessing_parameters['word_vocab_file'],
+                unknown_symbol=preprocessing_parameters['unknown_symbol'],
+                padding_symbol=preprocessing_parameters['padding_symbol'],
+                pretrained_model_name_or_path=preprocessing_parameters[
+                    'pretrained_model_name_or_path'],
+            )
         )
 
     @staticmethod
-    def get_feature_meta(column, preprocessing_parameters, backend):
-        column = column.astype(str)
-        tf_meta = TextFeatureMixin.feature_meta(
-            column, preprocessing_parameters, backend
+    def tokenize(column, preprocessing_parameters, backend):
+        char_tokens = TextFeatureMixin.tokenize_level(
+            column, 'char', preprocessing_parameters, backend
         )
-        (
-            char_idx2str,
-            char_str2idx,
-            char_str2freq,
-            char_max_len,
-            char_pad_idx,
-            char_pad_symbol,
-            char_unk_symbol,
-            word_idx2str,
-            word_str2idx,
-            word_str2freq,
-            word_max_len,
-            word_pad_idx,
-            word_pad_symbol,
-            word_unk_symbol,
-        ) = tf_meta
-        char_max_len = min(
-            preprocessing_parameters['char_sequence_length_limit'],
-            char_max_len
+        word_tokens = TextFeatureMixin.tokenize_level(
+            column, 'word', preprocessing_parameters, backend
         )
-        word_max_len = min(
-            preprocessing_parameters['word_sequence_length_limit'],
-            word_max_len
+        return char_tokens, word_tokens
+
+    @staticmethod
+    def tokenize_level(column, level, preprocessing_parameters, backend):
+        return tokenize(
+            column,
+            tokenizer_type=preprocessing_parameters[f'{level}_tokenizer'],
+            lowercase=preprocessing_parameters['lowercase'],
+            vocab_file=preprocessing_parameters[f'{level}_vocab_file'],
+            pretrained_model_name_or_path=preprocessing_parameters[
+                'pretrained_model_name_or_path'],
+            processor=backend.df_engine,
+            num_processes=(preprocessing_parameters['num_processes']
+                           if backend.supports_multiprocessing else 1)
         )
-        return {
-            'char_idx2str': char_idx2str,
-            'char_str2idx': char_str2idx,
-            'char_str2freq': char_str2freq,
-            'char_vocab_size': len(char_idx2str),
-            'char_max_sequence_length': char_max_len,
-            'char_pad_idx': char_pad_idx,
-            'char_pad_symbol': char_pad_symbol,
-            'char_unk_symbol': char_unk_symbol,
-            'word_idx2str': word_idx2str,
-            'word_str2idx': word_str2idx,
-            'word_str2freq': word_str2freq,
-            'word_vocab_size': len(word_idx2str),
-            'word_max_sequence_length': word_max_len,
-            'word_pad_idx': word_pad_idx,
-            'word_pad_symbol': word_pad_symbol,
-            'word_unk_symbol': word_unk_symbol,
-        }
 
     @staticmethod
-    def feature_data(column, metadata, preprocessing_parameters, backend):
+    def feature_data(column, metadata, preprocessing_parameters, backend,
+                     char_tokens=None, word_tokens=None):
         char_data = build_sequence_matrix(
             sequences=column,
             inverse_vocabulary=metadata['char_str2idx'],
@@ -207,7 +222,10 @@ class TextFeatureMixin:
             pretrained_model_name_or_path=preprocessing_parameters[
                 'pretrained_model_name_or_path'
             ],
-            processor=backend.df_engine
+            processor=backend.df_engine,
+            num_processes=(preprocessing_parameters['num_processes']
+                           if backend.supports_multiprocessing else 1),
+            tokens=char_tokens
         )
         word_data = build_sequence_matrix(
             sequences=column,
@@ -224,7 +242,10 @@ class TextFeatureMixin:
             pretrained_model_name_or_path=preprocessing_parameters[
                 'pretrained_model_name_or_path'
             ],
-            processor=backend.df_engine
+            processor=backend.df_engine,
+            num_processes=(preprocessing_parameters['num_processes']
+                           if backend.supports_multiprocessing else 1),
+            tokens=word_tokens
         )
 
         return char_data, word_data
@@ -239,11 +260,14 @@ class TextFeatureMixin:
             backend,
             skip_save_processed_input
     ):
+        feature_metadata = metadata[feature[NAME]]
         chars_data, words_data = TextFeatureMixin.feature_data(
             input_df[feature[COLUMN]].astype(str),
-            metadata[feature[NAME]],
+            feature_metadata,
             preprocessing_parameters,
-            backend
+            backend,
+            char_tokens=feature_metadata.pop('char_tokens', None),
+            word_tokens=feature_metadata.pop('word_tokens', None)
         )
         proc_df['{}_char'.format(feature[PROC_COLUMN])] = chars_data
         proc_df['{}_word'.format(feature[PROC_COLUMN])] = words_data
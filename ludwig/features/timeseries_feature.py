@@ -15,14 +15,20 @@
 # limitations under the License.
 # ==============================================================================
 import logging
+from itertools import chain
 
 import numpy as np
+import pandas as pd
 import tensorflow as tf
+from pandas.api.types import infer_dtype
 
 from ludwig.constants import *
+from ludwig.data.dataframe.tensor import TensorArray, TensorDtype
 from ludwig.encoders.sequence_encoders import StackedCNN, ParallelCNN, \
     StackedParallelCNN, StackedRNN, StackedCNNRNN, SequencePassthroughEncoder, \
     StackedTransformer
+from ludwig.features.meta_accumulators import FeatureMetaAccumulator, \
+    MaxLengthAccumulator
 from ludwig.features.sequence_feature import SequenceInputFeature
 from ludwig.utils.misc_utils import get_from_registry, set_default_values
 from ludwig.utils.strings_utils import tokenizer_registry
@@ -57,22 +63,93 @@ class TimeseriesFeatureMixin(object):
         return column
 
     @staticmethod
-    def get_feature_meta(column, preprocessing_parameters, backend):
-        column = column.astype(str)
+    def tokenize(column, tokenizer_name):
+        """Returns the list of the values of each timeseries in `column`,
+        either strings to tokenize or lists / arrays of numbers."""
+        if (tokenizer_name == 'space' and
+                infer_dtype(column, skipna=False) == 'string'):
+            # splits all the strings at once, empty strings have no values
+            return column.str.split().tolist()
+
         tokenizer = get_from_registry(
-            preprocessing_parameters['tokenizer'],
+            tokenizer_name,
             tokenizer_registry
         )()
-        max_length = 0
-        for timeseries in column:
-            processed_line = tokenizer(timeseries)
-            max_length = max(max_length, len(processed_line))
-        max_length = min(
-            preprocessing_parameters['timeseries_length_limit'],
-            max_length
+        return [
+            tokenizer(timeseries) if isinstance(timeseries, str)
+            else np.ravel(timeseries)
+            for timeseries in column
+        ]
+
+    @staticmethod
+    def get_feature_meta(column, preprocessing_parameters, backend):
+        accumulator = TimeseriesFeatureMixin.get_meta_accumulator(
+            preprocessing_parameters, backend
         )
+        accumulator.update(column)
+        return accumulator.finalize()
 
-        return {'max_timeseries_length': max_length}
+    @staticmethod
+    def get_meta_accumulator(preprocessing_parameters, backend):
+        tokenizer_name = preprocessing_parameters['tokenizer']
+
+        def lengths_partition(column, partition_info=None):
+            tokens = TimeseriesFeatureMixin.tokenize(column, tokenizer_name)
+            return pd.Series(list(map(len, tokens)), index=column.index,
+                             name=column.name, dtype=np.int64)
+
+        def lengths(column):
+            return backend.df_engine.map_partitions(
+                column, lengths_partition, meta=(column.name, 'int64')
+            )
+
+        def build_meta(max_length):
+            return {
+                'max_timeseries_length': min(
+                    preprocessing_parameters['timeseries_length_limit'],
+                    max_length
+                )
+            }
+
+        return FeatureMetaAccumulator(
+            build_meta,
+            max_length=MaxLengthAccumulator(lengths, backend.df_engine)
+        )
+
+    @staticmethod
+    def timeseries_to_matrix(
+            column,
+            tokenizer_name,
+            max_length,
+            padding_value,
+            padding
+    ):
+        """Returns the [len(column) x max_length] float32 matrix of the
+        timeseries in `column`, truncated and padded to max_length."""
+        tokens = TimeseriesFeatureMixin.tokenize(column, tokenizer_name)
+        lengths = np.fromiter(map(len, tokens), dtype=np.int64,
+                              count=len(tokens))
+        # the values of all the timeseries are converted at once
+        values = np.array(
+            list(chain.from_iterable(tokens)), dtype=np.float32
+        )
+
+        matrix = np.full(
+            (len(tokens), max_length),
+            padding_value,
+            dtype=np.float32
+        )
+        limits = np.minimum(lengths, max_length)[:, np.newaxis]
+        positions = np.arange(max_length)
+        if padding == 'right':
+            mask = positions < limits
+            value_positions = positions
+        else:  # if padding == 'left
+            mask = positions >= max_length - limits
+            value_positions = positions - (max_length - limits)
+        offsets = (np.cumsum(lengths) - lengths)[:, np.newaxis]
+        matrix[mask] = values[(offsets + value_positions)[mask]]
+        return matrix
 
     @staticmethod
     def build_matrix(
@@ -83,42 +160,19 @@ class TimeseriesFeatureMixin(object):
             padding,
             backend
     ):
-        tokenizer = get_from_registry(
-            tokenizer_name,
-            tokenizer_registry
-        )()
+        def build_partition(column, partition_info=None):
+            matrix = TimeseriesFeatureMixin.timeseries_to_matrix(
+                column, tokenizer_name, length_limit, padding_value, padding
+            )
+            return pd.Series(TensorArray(matrix), index=column.index,
+                             name=column.name)
 
-        ts_vectors = backend.df_engine.map_objects(
+        return backend.df_engine.map_partitions(
             timeseries,
-            lambda ts: np.array(tokenizer(ts)).astype(np.float32)
+            build_partition,
+            meta=(timeseries.name, TensorDtype(np.float32))
         )
 
-        max_length = backend.df_engine.compute(ts_vectors.map(len).max())
-        if max_length < length_limit:
-            logger.debug(
-                'max length of {0}: {1} < limit: {2}'.format(
-                    tokenizer_name,
-                    max_length,
-                    length_limit
-                )
-            )
-        max_length = length_limit
-
-        def pad(vector):
-            padded = np.full(
-                (max_length,),
-                padding_value,
-                dtype=np.float32
-            )
-            limit = min(vector.shape[0], max_length)
-            if padding == 'right':
-                padded[:limit] = vector[:limit]
-            else:  # if padding == 'left
-                padded[max_length - limit:] = vector[:limit]
-            return padded
-
-        return backend.df_engine.map_objects(ts_vectors, pad)
-
     @staticmethod
     def feature_data(column, metadata, preprocessing_parameters, backend):
         timeseries_data = TimeseriesFeatureMixin.build_matrix(
@@ -141,7 +195,7 @@ class TimeseriesFeatureMixin(object):
             skip_save_processed_input
     ):
         proc_df[feature[PROC_COLUMN]] = TimeseriesFeatureMixin.feature_data(
-            input_df[feature[COLUMN]].astype(str),
+            input_df[feature[COLUMN]],
             metadata[feature[NAME]],
             preprocessing_parameters,
             backend
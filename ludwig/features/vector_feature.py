@@ -28,6 +28,8 @@ from ludwig.decoders.generic_decoders import Projector
 from ludwig.encoders.generic_encoders import PassthroughEncoder, \
     DenseEncoder
 from ludwig.features.base_feature import InputFeature
+from ludwig.features.meta_accumulators import (FeatureMetaAccumulator,
+                                               MaxLengthAccumulator)
 from ludwig.features.base_feature import OutputFeature
 from ludwig.modules.loss_modules import SoftmaxCrossEntropyLoss, MSELoss, \
     MAELoss
@@ -66,9 +68,43 @@ class VectorFeatureMixin:
 
     @staticmethod
     def get_feature_meta(column, preprocessing_parameters, backend):
-        return {
-            'preprocessing': preprocessing_parameters
-        }
+        accumulator = VectorFeatureMixin.get_meta_accumulator(
+            preprocessing_parameters, backend
+        )
+        accumulator.update(column)
+        return accumulator.finalize()
+
+    @staticmethod
+    def get_meta_accumulator(preprocessing_parameters, backend):
+        def build_meta(vector_size):
+            if vector_size == 0:
+                raise ValueError(
+                    "There are no vectors in the dataset provided"
+                )
+            if 'vector_size' in preprocessing_parameters:
+                if vector_size != preprocessing_parameters['vector_size']:
+                    raise ValueError(
+                        'The user provided value for vector size ({}) does '
+                        'not match the value observed in the data: {}'.format(
+                            preprocessing_parameters['vector_size'],
+                            vector_size
+                        )
+                    )
+            else:
+                logger.debug('Observed vector size: {}'.format(vector_size))
+            return {'vector_size': vector_size}
+
+        # the vector size is observed while scanning the dataset for the
+        # metadata, so that no further pass over the data is needed
+        return FeatureMetaAccumulator(
+            build_meta,
+            vector_size=MaxLengthAccumulator(
+                lambda column: backend.df_engine.map_objects(
+                    column, lambda x: len(x.split())
+                ),
+                backend.df_engine
+            )
+        )
 
     @staticmethod
     def add_feature_data(
@@ -84,9 +120,6 @@ class VectorFeatureMixin:
                 Expects all the vectors to be of the same size. The vectors need to be
                 whitespace delimited strings. Missing values are not handled.
                 """
-        if len(input_df[feature[COLUMN]]) == 0:
-            raise ValueError("There are no vectors in the dataset provided")
-
         # Convert the string of features into a numpy array
         try:
             proc_df[feature[PROC_COLUMN]] = backend.df_engine.map_objects(
@@ -100,21 +133,6 @@ class VectorFeatureMixin:
             )
             raise
 
-        # Determine vector size
-        vector_size = backend.df_engine.compute(
-            proc_df[feature[PROC_COLUMN]].map(len).max())
-        if 'vector_size' in preprocessing_parameters:
-            if vector_size != preprocessing_parameters['vector_size']:
-                raise ValueError(
-                    'The user provided value for vector size ({}) does not '
-                    'match the value observed in the data: {}'.format(
-                        preprocessing_parameters, vector_size
-                    )
-                )
-        else:
-            logger.debug('Observed vector size: {}'.format(vector_size))
-
-        metadata[feature[NAME]]['vector_size'] = vector_size
         return proc_df
 
 
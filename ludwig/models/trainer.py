@@ -32,6 +32,7 @@ from re import M
 import numpy as np
 import tensorflow as tf
 from ludwig.constants import COMBINED, LOSS, TEST, TRAINING, TYPE, VALIDATION
+from ludwig.data.batcher.prefetch import prefetch_batches
 from ludwig.globals import (MODEL_HYPERPARAMETERS_FILE_NAME,
                             MODEL_WEIGHTS_FILE_NAME,
                             TRAINING_CHECKPOINTS_DIR_PATH,
@@ -118,6 +119,8 @@ class Trainer(BaseTrainer):
             should_shuffle=True,
             shuffle_buffer_size=None,
             bucketing_field=None,
+            prefetch_batches=0,
+            prefetch_workers=1,
             validation_field='combined',
             validation_metric='loss',
             early_stop=20,
@@ -173,6 +176,13 @@ class Trainer(BaseTrainer):
                length of a field together. Bucketing on text length speeds up
                training of RNNs consistently, 30% in some cases
         :type bucketing_field:
+        :param prefetch_batches: number of training batches to assemble in
+               the background while the model is training on the current one.
+               0 disables prefetching.
+        :type prefetch_batches: Integer
+        :param prefetch_workers: number of threads used to assemble
+               prefetched batches.
+        :type prefetch_workers: Integer
         :param validation_field: The first output feature, by default it is set
                as the same field of the first output feature.
         :param validation_metric: metric used on the validation field, it is
@@ -249,6 +259,8 @@ class Trainer(BaseTrainer):
         self.should_shuffle = should_shuffle
         self.shuffle_buffer_size = shuffle_buffer_size
         self.bucketing_field = bucketing_field
+        self.prefetch_batches = prefetch_batches
+        self.prefetch_workers = prefetch_workers
         self._validation_field = validation_field
         self._validation_metric = validation_metric
         self.early_stop = early_stop
@@ -749,6 +761,10 @@ class Trainer(BaseTrainer):
             shuffle_buffer_size=self.shuffle_buffer_size,
             seed=self.random_seed,
             horovod=self.horovod,
+        ) as dataset_batcher, prefetch_batches(
+            dataset_batcher,
+            queue_size=self.prefetch_batches,
+            num_workers=self.prefetch_workers
         ) as batcher:
 
             # ================ Training Loop ================
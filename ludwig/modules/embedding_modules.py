@@ -24,6 +24,7 @@ from tensorflow.keras.layers import Embedding
 from ludwig.constants import TYPE
 from ludwig.modules.initializer_modules import get_initializer
 from ludwig.utils.data_utils import load_pretrained_embeddings
+from ludwig.utils.tf_utils import padded_indices_to_sparse
 
 logger = logging.getLogger(__name__)
 
@@ -206,7 +207,6 @@ class EmbedWeighted(Layer):
             embeddings_on_cpu=embeddings_on_cpu,
             embedding_initializer=embedding_initializer,
         )
-        self.vocab_length = len(vocab)
 
         if embedding_regularizer:
             embedding_regularizer_obj = tf.keras.regularizers.get(
@@ -219,21 +219,16 @@ class EmbedWeighted(Layer):
             self.dropout = None
 
     def call(self, inputs, training=None, mask=None):
-        signed_input = tf.cast(tf.sign(tf.abs(inputs)), tf.int32)
-        multiple_hot_indexes = tf.multiply(
-            signed_input,
-            tf.constant(np.array([range(self.vocab_length)], dtype=np.int32))
-        )
-        embedded = tf.nn.embedding_lookup(
-            self.embeddings, multiple_hot_indexes, name='embeddings_lookup'
+        # inputs are the indices of the units of each bag, repeated as many
+        # times as they appear and padded with 0, so summing their embeddings
+        # weights each embedding by the count of its unit
+        embedded_reduced = tf.nn.safe_embedding_lookup_sparse(
+            self.embeddings,
+            padded_indices_to_sparse(inputs),
+            sparse_weights=None,
+            combiner='sum'
         )
 
-        # Get the multipliers to embeddings
-        weights_mask = tf.expand_dims(inputs, -1)
-        weighted_embedded = tf.multiply(embedded, weights_mask)
-
-        embedded_reduced = tf.reduce_sum(weighted_embedded, 1)
-
         if self.dropout:
             embedded_reduced = self.dropout(embedded_reduced,
                                             training=training)
@@ -282,18 +277,11 @@ class EmbedSparse(Layer):
         self.reduce_output = reduce_output
 
     def call(self, inputs, training=None, mask=None):
-        idx = tf.where(tf.equal(inputs, True))
-
-        sparse_multiple_hot_indexes = tf.SparseTensor(
-            idx,
-            idx[:, 1],
-            tf.shape(inputs, out_type=tf.int64)
-        )
-
-        embedded_reduced = tf.nn.embedding_lookup_sparse(
+        # inputs are the indices of the elements of each set padded with 0
+        embedded_reduced = tf.nn.safe_embedding_lookup_sparse(
             self.embeddings,
-            sparse_multiple_hot_indexes,
-            sp_weights=None,
+            padded_indices_to_sparse(inputs),
+            sparse_weights=None,
             combiner=self.reduce_output
         )
 
@@ -25,9 +25,11 @@ import pandas as pd
 from imageio import imread
 
 from ludwig.api import LudwigModel
-from ludwig.constants import COLUMN, AUDIO
+from ludwig.constants import COLUMN, AUDIO, HEIGHT, IMAGE, INTERPOLATE, \
+    NAME, PREPROCESSING, TYPE, WIDTH
 from ludwig.contrib import add_contrib_callback_args
 from ludwig.globals import LUDWIG_VERSION
+from ludwig.utils.image_utils import read_jpeg_draft
 from ludwig.utils.print_utils import logging_level_registry, print_ludwig
 
 logger = logging.getLogger(__name__)
@@ -65,6 +67,7 @@ def server(model, allowed_origins=None):
     input_features = {
         f[COLUMN] for f in model.config['input_features']
     }
+    image_sizes = get_image_draft_sizes(model)
 
     @app.get('/')
     def check_health():
@@ -76,7 +79,8 @@ def server(model, allowed_origins=None):
             form = await request.form()
             entry, files = convert_input(
                 form,
-                model.model.input_features
+                model.model.input_features,
+                image_sizes
             )
         except Exception:
             logger.exception("Failed to parse predict form")
@@ -107,7 +111,8 @@ def server(model, allowed_origins=None):
             form = await request.form()
             data, files = convert_batch_input(
                 form,
-                model.model.input_features
+                model.model.input_features,
+                image_sizes
             )
             data_df = pd.DataFrame.from_records(data['data'],
                                                 index=data.get('index'),
@@ -143,16 +148,45 @@ def _write_file(v, files):
     return named_file.name
 
 
-def _read_image_buffer(v):
+def _read_image_buffer(v, size=None):
+    buffer = v.file.read()
+
+    # JPEG images that are going to be shrunk to size
+    # can be decoded at a reduced scale
+    if size is not None:
+        img = read_jpeg_draft(buffer, size)
+        if img is not None:
+            return img
+
     # get image format type, e.g., 'jpg', 'png', etc.
     image_type_suffix = os.path.splitext(v.filename)[1][1:]
 
     # read in file buffer to obtain ndarray of image
-    return imread(v.file.read(), image_type_suffix)
+    return imread(buffer, image_type_suffix)
+
+
+def get_image_draft_sizes(model):
+    """Returns the (height, width) the images of each image input feature
+    are interpolated to during preprocessing, so that they can be decoded
+    at a reduced scale"""
+    sizes = {}
+    for feature in model.config['input_features']:
+        if feature[TYPE] != IMAGE:
+            continue
+        preprocessing = model.training_set_metadata.get(
+            feature[NAME], {}
+        ).get(PREPROCESSING, {})
+        if (preprocessing.get('resize_method') == INTERPOLATE and
+                HEIGHT in preprocessing and WIDTH in preprocessing):
+            sizes[feature[COLUMN]] = (
+                preprocessing[HEIGHT], preprocessing[WIDTH]
+            )
+    return sizes
 
 
-def convert_input(form, input_features):
+def convert_input(form, input_features, image_sizes=None):
     """Returns a new input and a list of files to be cleaned up"""
+    image_sizes = image_sizes or {}
     new_input = {}
     files = []
     for k, v in form.multi_items():
@@ -161,15 +195,16 @@ def convert_input(form, input_features):
             if input_features[k].type == AUDIO:
                 new_input[k] = _write_file(v, files)
             else:
-                new_input[k] = _read_image_buffer(v)
+                new_input[k] = _read_image_buffer(v, image_sizes.get(k))
         else:
             new_input[k] = v
 
     return new_input, files
 
 
-def convert_batch_input(form, input_features):
+def convert_batch_input(form, input_features, image_sizes=None):
     """Returns a new input and a list of files to be cleaned up"""
+    image_sizes = image_sizes or {}
     file_index = {}
     files = []
     for k, v in form.multi_items():
@@ -184,7 +219,10 @@ def convert_batch_input(form, input_features):
                 if input_features[feature_name].type == AUDIO:
                     row[i] = _write_file(file_index[row[i]], files)
                 else:
-                    row[i] = _read_image_buffer(file_index[row[i]])
+                    row[i] = _read_image_buffer(
+                        file_index[row[i]],
+                        image_sizes.get(feature_name)
+                    )
 
     return data, files
 
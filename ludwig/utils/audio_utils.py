@@ -14,7 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+from functools import lru_cache
+
 import numpy as np
+from numpy.lib.stride_tricks import as_strided
 from scipy.signal import lfilter
 from scipy.signal.windows import get_window
 
@@ -31,45 +34,116 @@ def get_length_in_samp(sampling_rate_in_hz, length_in_s):
 
 def get_group_delay(raw_data, sampling_rate_in_hz, window_length_in_s,
                     window_shift_in_s, num_fft_points, window_type):
-    X_stft_transform = _get_stft(raw_data, sampling_rate_in_hz,
-                                 window_length_in_s, window_shift_in_s,
-                                 num_fft_points, window_type=window_type)
-    Y_stft_transform = _get_stft(raw_data, sampling_rate_in_hz,
-                                 window_length_in_s, window_shift_in_s,
-                                 num_fft_points, window_type=window_type,
-                                 data_transformation='group_delay')
-    X_stft_transform_real = np.real(X_stft_transform)
-    X_stft_transform_imag = np.imag(X_stft_transform)
-    Y_stft_transform_real = np.real(Y_stft_transform)
-    Y_stft_transform_imag = np.imag(Y_stft_transform)
-    nominator = np.multiply(X_stft_transform_real,
-                            Y_stft_transform_real) + np.multiply(
-        X_stft_transform_imag, Y_stft_transform_imag)
-    denominator = np.square(np.abs(X_stft_transform))
-    group_delay = np.divide(nominator, denominator + 1e-10)
-    assert not np.isnan(
-        group_delay).any(), 'There are NaN values in group delay'
-    return np.transpose(group_delay)
+    return np.transpose(_get_features(
+        [raw_data], 'group_delay', sampling_rate_in_hz, window_length_in_s,
+        window_shift_in_s, num_fft_points, window_type
+    )[0])
 
 
 def get_phase_stft_magnitude(raw_data, sampling_rate_in_hz, window_length_in_s,
                              window_shift_in_s, num_fft_points, window_type):
-    stft = _get_stft(raw_data, sampling_rate_in_hz, window_length_in_s,
-                     window_shift_in_s, num_fft_points,
-                     window_type=window_type)
-    abs_stft = np.abs(stft)
-    phase = np.angle(stft)
-    stft_phase = np.concatenate((phase, abs_stft), axis=1)
-    return np.transpose(stft_phase)
+    return np.transpose(_get_features(
+        [raw_data], 'stft_phase', sampling_rate_in_hz, window_length_in_s,
+        window_shift_in_s, num_fft_points, window_type
+    )[0])
 
 
 def get_stft_magnitude(raw_data, sampling_rate_in_hz, window_length_in_s,
                        window_shift_in_s, num_fft_points, window_type):
-    stft = _get_stft(raw_data, sampling_rate_in_hz, window_length_in_s,
-                     window_shift_in_s, num_fft_points,
-                     window_type=window_type)
-    stft_magnitude = np.abs(stft)
-    return np.transpose(stft_magnitude)
+    return np.transpose(_get_features(
+        [raw_data], 'stft', sampling_rate_in_hz, window_length_in_s,
+        window_shift_in_s, num_fft_points, window_type
+    )[0])
+
+
+def get_fbank(raw_data, sampling_rate_in_hz, window_length_in_s,
+              window_shift_in_s, num_fft_points, window_type,
+              num_filter_bands):
+    return np.transpose(_get_features(
+        [raw_data], 'fbank', sampling_rate_in_hz, window_length_in_s,
+        window_shift_in_s, num_fft_points, window_type,
+        num_filter_bands=num_filter_bands
+    )[0])
+
+
+def get_batch_features(raw_data_list, feature_type, sampling_rate_in_hz,
+                       window_length_in_s, window_shift_in_s, num_fft_points,
+                       window_type, num_filter_bands=None, max_length=None,
+                       padding_value=0):
+    """Computes the 2D features of many utterances sampled at the same rate
+    at once: the frames of all the utterances are weighted and transformed
+    together, with windows and mel filter banks built once.
+
+    Returns the [len(raw_data_list) x max_length x feature_dim] float32
+    array of the features of each utterance, truncated or padded with
+    padding_value to max_length (the longest utterance by default), like
+    the inputs of AudioInputFeature, and the number of frames of each
+    utterance before truncation.
+    """
+    features, lengths = _get_features(
+        raw_data_list, feature_type, sampling_rate_in_hz, window_length_in_s,
+        window_shift_in_s, num_fft_points, window_type,
+        num_filter_bands=num_filter_bands, concatenate=True
+    )
+    if max_length is None:
+        max_length = int(lengths.max()) if len(lengths) else 0
+
+    padded_features = np.full(
+        (len(lengths), max_length, features.shape[1]),
+        padding_value,
+        dtype=np.float32
+    )
+    positions = np.arange(max_length)
+    mask = positions < np.minimum(lengths, max_length)[:, np.newaxis]
+    offsets = (np.cumsum(lengths) - lengths)[:, np.newaxis]
+    padded_features[mask] = features[(offsets + positions)[mask]]
+    return padded_features, lengths
+
+
+def _get_features(raw_data_list, feature_type, sampling_rate_in_hz,
+                  window_length_in_s, window_shift_in_s, num_fft_points,
+                  window_type, num_filter_bands=None, concatenate=False):
+    """Returns the [num_frames x feature_dim] features of each utterance,
+    or the features of all the utterances concatenated and their number of
+    frames if concatenate is True."""
+    window_length_in_samp = get_length_in_samp(window_length_in_s,
+                                               sampling_rate_in_hz)
+    window_shift_in_samp = get_length_in_samp(window_shift_in_s,
+                                              sampling_rate_in_hz)
+    frames, lengths = _preprocess_to_padded_matrix(
+        [_pre_emphasize_data(raw_data) for raw_data in raw_data_list],
+        window_length_in_samp,
+        window_shift_in_samp,
+        zero_mean_offset=feature_type == 'fbank'
+    )
+
+    stft = _get_stft(frames, num_fft_points, window_type)
+    if feature_type == 'stft':
+        features = np.abs(stft)
+    elif feature_type == 'stft_phase':
+        features = np.concatenate((np.angle(stft), np.abs(stft)), axis=1)
+    elif feature_type == 'group_delay':
+        group_delay_stft = _get_stft(frames, num_fft_points, window_type,
+                                     data_transformation='group_delay')
+        nominator = np.multiply(np.real(stft), np.real(group_delay_stft)) + \
+            np.multiply(np.imag(stft), np.imag(group_delay_stft))
+        denominator = np.square(np.abs(stft))
+        features = np.divide(nominator, denominator + 1e-10)
+        assert not np.isnan(
+            features).any(), 'There are NaN values in group delay'
+    elif feature_type == 'fbank':
+        stft_power = np.abs(stft) ** 2
+        mel_fbank_matrix = _get_cached_mel_fbank_matrix(
+            num_filter_bands, num_fft_points, sampling_rate_in_hz
+        )
+        mel_fbank_feature = np.dot(stft_power, np.transpose(mel_fbank_matrix))
+        features = np.log(mel_fbank_feature + 1.0e-10)
+    else:
+        raise ValueError('{} is not recognized.'.format(feature_type))
+
+    if concatenate:
+        return features, lengths
+    return np.split(features, np.cumsum(lengths)[:-1])
 
 
 ################################################################################
@@ -77,14 +151,9 @@ def get_stft_magnitude(raw_data, sampling_rate_in_hz, window_length_in_s,
 # MIT licensed implementation
 # https://github.com/jameslyons/python_speech_features/blob/40c590269b57c64a8c1f1ddaaff2162008d1850c/python_speech_features/base.py#L84################################################################################
 ################################################################################
-def get_fbank(raw_data, sampling_rate_in_hz, window_length_in_s,
-              window_shift_in_s, num_fft_points, window_type,
-              num_filter_bands):
-    stft = _get_stft(raw_data, sampling_rate_in_hz, window_length_in_s,
-                     window_shift_in_s, num_fft_points,
-                     window_type=window_type,
-                     zero_mean_offset=True)
-    stft_power = np.abs(stft) ** 2
+@lru_cache(maxsize=32)
+def _get_cached_mel_fbank_matrix(num_filter_bands, num_fft_points,
+                                 sampling_rate_in_hz):
     upper_limit_freq = int(sampling_rate_in_hz / 2)
     upper_limit_mel = _convert_hz_to_mel(upper_limit_freq)
     lower_limit_mel = 0
@@ -93,9 +162,9 @@ def get_fbank(raw_data, sampling_rate_in_hz, window_length_in_s,
     mel_fbank_matrix = _get_mel_fbank_matrix(list_mel_points, num_filter_bands,
                                              num_fft_points,
                                              sampling_rate_in_hz)
-    mel_fbank_feature = np.dot(stft_power, np.transpose(mel_fbank_matrix))
-    log_mel_fbank_feature = np.log(mel_fbank_feature + 1.0e-10)
-    return np.transpose(log_mel_fbank_feature)
+    # shared by all the callers
+    mel_fbank_matrix.flags.writeable = False
+    return mel_fbank_matrix
 
 
 def _get_mel_fbank_matrix(list_mel_points, num_filter_bands, num_fft_points,
@@ -137,59 +206,59 @@ def _convert_mel_to_hz(mel):
     return 700.0 * (10 ** (mel / 2595.0) - 1)
 
 
-def _get_stft(raw_data, sampling_rate_in_hz, window_length_in_s,
-              window_shift_in_s, num_fft_points, window_type,
-              data_transformation=None, zero_mean_offset=False):
-    pre_emphasized_data = _pre_emphasize_data(raw_data)
-    stft = _short_time_fourier_transform(pre_emphasized_data,
-                                         sampling_rate_in_hz,
-                                         window_length_in_s, window_shift_in_s,
-                                         num_fft_points, window_type,
-                                         data_transformation, zero_mean_offset)
-    non_symmetric_stft = get_non_symmetric_data(stft)
-    return non_symmetric_stft
-
-
-def _short_time_fourier_transform(data, sampling_rate_in_hz,
-                                  window_length_in_s,
-                                  window_shift_in_s, num_fft_points,
-                                  window_type, data_transformation=None,
-                                  zero_mean_offset=False):
-    window_length_in_samp = get_length_in_samp(window_length_in_s,
-                                               sampling_rate_in_hz)
-    window_shift_in_samp = get_length_in_samp(window_shift_in_s,
-                                              sampling_rate_in_hz)
-    preprocessed_data_matrix = _preprocess_to_padded_matrix(data,
-                                                            window_length_in_samp,
-                                                            window_shift_in_samp,
-                                                            zero_mean_offset=zero_mean_offset)
-    weighted_data_matrix = _weight_data_matrix(
-        preprocessed_data_matrix,
-        window_type,
-        data_transformation=data_transformation
-    )
-    fft = np.fft.fft(weighted_data_matrix, n=num_fft_points)
-    return fft
+def _get_stft(frames, num_fft_points, window_type, data_transformation=None):
+    window = _get_window(window_type, frames.shape[1], data_transformation)
+    # the first half of the fft of real signals, as get_non_symmetric_data
+    return np.fft.rfft(frames * window, n=num_fft_points)
 
 
-def _preprocess_to_padded_matrix(data, window_length_in_samp,
+def _preprocess_to_padded_matrix(data_list, window_length_in_samp,
                                  window_shift_in_samp, zero_mean_offset=False):
-    num_input = data.shape[0]
-    num_output = get_num_output_padded_to_fit_input(num_input,
-                                                    window_length_in_samp,
-                                                    window_shift_in_samp)
-    zero_padded_matrix = np.zeros((num_output, window_length_in_samp),
-                                  dtype=np.float)
-    for num_output_idx in range(num_output):
-        start_idx = window_shift_in_samp * num_output_idx
-        is_last_output = num_output_idx == num_output - 1
-        end_idx = start_idx + window_length_in_samp if not is_last_output else num_input
-        end_padded_idx = window_length_in_samp if not is_last_output else end_idx - start_idx
-        window_data = data[start_idx:end_idx]
+    """Returns the [num_frames x window_length_in_samp] matrix of the frames
+    of all the utterances in data_list, the last frame of each being padded
+    with zeros, and the number of frames of each utterance."""
+    lengths = np.array([
+        max(0, get_num_output_padded_to_fit_input(data.shape[0],
+                                                  window_length_in_samp,
+                                                  window_shift_in_samp))
+        for data in data_list
+    ], dtype=np.int64)
+
+    frames_list = []
+    valid_lengths_list = []
+    for data, num_output in zip(data_list, lengths):
+        num_input = data.shape[0]
+        padded_length = max(
+            num_input,
+            (num_output - 1) * window_shift_in_samp + window_length_in_samp
+        )
+        padded_data = np.zeros(padded_length, dtype=np.float64)
+        padded_data[:num_input] = data
+        frames_list.append(as_strided(
+            padded_data,
+            shape=(num_output, window_length_in_samp),
+            strides=(window_shift_in_samp * padded_data.strides[0],
+                     padded_data.strides[0]),
+            writeable=False
+        ))
         if zero_mean_offset:
-            window_data = window_data - np.mean(window_data)
-        zero_padded_matrix[num_output_idx, :end_padded_idx] = window_data
-    return zero_padded_matrix
+            starts = np.arange(num_output) * window_shift_in_samp
+            valid_lengths_list.append(
+                np.minimum(window_length_in_samp, num_input - starts)
+            )
+
+    if frames_list:
+        frames = np.concatenate(frames_list)
+    else:
+        frames = np.zeros((0, window_length_in_samp), dtype=np.float64)
+
+    if zero_mean_offset and len(frames):
+        # the mean is computed and subtracted only over the data of each
+        # frame, not over the zeros padding the last one
+        valid_lengths = np.concatenate(valid_lengths_list)[:, np.newaxis]
+        means = frames.sum(axis=1, keepdims=True) / valid_lengths
+        frames -= means * (np.arange(window_length_in_samp) < valid_lengths)
+    return frames, lengths
 
 
 def get_num_output_padded_to_fit_input(num_input, window_length_in_samp,
@@ -199,12 +268,14 @@ def get_num_output_padded_to_fit_input(num_input, window_length_in_samp,
     return int(np.ceil(num_output_valid))
 
 
-def _weight_data_matrix(data_matrix, window_type, data_transformation=None):
-    window_length_in_samp = data_matrix[0].shape[0]
+@lru_cache(maxsize=32)
+def _get_window(window_type, window_length_in_samp, data_transformation=None):
     window = get_window(window_type, window_length_in_samp, fftbins=False)
     if (data_transformation == 'group_delay'):
         window *= np.arange(window_length_in_samp)
-    return data_matrix * window
+    # shared by all the callers
+    window.flags.writeable = False
+    return window
 
 
 def get_non_symmetric_length(symmetric_length):
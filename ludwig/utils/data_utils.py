@@ -15,6 +15,7 @@
 # limitations under the License.
 # ==============================================================================
 import collections
+import contextlib
 import csv
 import functools
 import json
@@ -23,13 +24,21 @@ import os.path
 import pickle
 import random
 import re
+import shutil
+import struct
+import tempfile
 from itertools import islice
 
 import numpy as np
 import pandas as pd
 import yaml
 
-from ludwig.utils.fs_utils import open_file, download_h5, upload_h5
+from fsspec.core import split_protocol
+
+from ludwig.data.dataframe.tensor import (TensorArray, column_to_numpy,
+                                          flatten_rows)
+from ludwig.utils.fs_utils import (open_file, download_h5, get_fs_and_path,
+                                   upload_h5)
 from ludwig.utils.misc_utils import get_from_registry
 from pandas.errors import ParserError
 from sklearn.model_selection import KFold
@@ -52,6 +61,8 @@ DATASET_SPLIT_URL = 'dataset_{}_fp'
 DATA_PROCESSED_CACHE_DIR = 'data_processed_cache_dir'
 DATA_TRAIN_HDF5_FP = 'data_train_hdf5_fp'
 HDF5_COLUMNS_KEY = 'columns'
+NPY_COLUMNS_FILE_NAME = 'columns.json'
+EMBEDDINGS_WORDS_FILE_NAME = 'words.json'
 DICT_FORMATS = {'dict', 'dictionary', dict}
 DATAFRAME_FORMATS = {'dataframe', 'df', pd.DataFrame} | DASK_DF_FORMATS
 CSV_FORMATS = {'csv'}
@@ -69,6 +80,7 @@ SAS_FORMATS = {'sas'}
 SPSS_FORMATS = {'spss'}
 STATA_FORMATS = {'stata'}
 HDF5_FORMATS = {'hdf5', 'h5'}
+NPY_FORMATS = {'npy'}
 TFRECORD_FORMATS = {'tfrecord', 'tfrecords'}
 CACHEABLE_FORMATS = set.union(*(CSV_FORMATS, TSV_FORMATS,
                                 JSON_FORMATS, JSONL_FORMATS,
@@ -97,7 +109,8 @@ def load_csv(data_fp):
     return data
 
 
-def read_xsv(data_fp, df_lib=PANDAS_DF, separator=',', header=0, nrows=None, skiprows=None):
+def read_xsv(data_fp, df_lib=PANDAS_DF, separator=',', header=0, nrows=None, skiprows=None,
+             chunksize=None):
     """
     Helper method to read a csv file. Wraps around pd.read_csv to handle some
     exceptions. Can extend to cover cases as necessary
@@ -107,6 +120,8 @@ def read_xsv(data_fp, df_lib=PANDAS_DF, separator=',', header=0, nrows=None, ski
     :param header: header argument for pandas to read the csv
     :param nrows: number of rows to read from the csv, None means all
     :param skiprows: number of rows to skip from the csv, None means no skips
+    :param chunksize: if not None, the number of rows of the DataFrames
+           returned by an iterator over the csv
     :return: Pandas dataframe with the data
     """
     with open_file(data_fp, 'r', encoding="utf8") as csvfile:
@@ -126,6 +141,8 @@ def read_xsv(data_fp, df_lib=PANDAS_DF, separator=',', header=0, nrows=None, ski
 
     if nrows is not None:
         kwargs['nrows'] = nrows
+    if chunksize is not None:
+        kwargs['chunksize'] = chunksize
 
     try:
         df = df_lib.read_csv(data_fp, **kwargs)
@@ -148,7 +165,9 @@ def read_json(data_fp, df_lib, normalize=False):
         return df_lib.read_json(data_fp)
 
 
-def read_jsonl(data_fp, df_lib):
+def read_jsonl(data_fp, df_lib, chunksize=None):
+    if chunksize is not None:
+        return df_lib.read_json(data_fp, lines=True, chunksize=chunksize)
     return df_lib.read_json(data_fp, lines=True)
 
 
@@ -276,22 +295,33 @@ def flatten_dict(d, parent_key='', sep='.'):
 def flatten_df(df, backend):
     # Workaround for: https://issues.apache.org/jira/browse/ARROW-5645
     column_shapes = {}
-    for c in df.columns:
-        df = backend.df_engine.persist(df)
-        shape = backend.df_engine.compute(backend.df_engine.map_objects(
-            df[c],
-            lambda x: np.array(x).shape,
-        ).max())
-
+    df = backend.df_engine.persist(df)
+    # the shapes of all the columns are computed together
+    shapes = backend.df_engine.compute_all(*(
+        _max_row_shape(df[c], backend) for c in df.columns
+    ))
+    for c, shape in zip(df.columns, shapes):
         if len(shape) > 1:
             column_shapes[c] = shape
-            df[c] = backend.df_engine.map_objects(
+            df[c] = backend.df_engine.map_partitions(
                 df[c],
-                lambda x: np.array(x).reshape(-1)
+                flatten_rows,
+                meta=(c, df[c].dtype)
             )
     return df, column_shapes
 
 
+def _max_row_shape(column, backend):
+    values = getattr(column, 'array', None)
+    if isinstance(values, TensorArray):
+        # all the rows of a tensor column have the same shape
+        return values.row_shape
+    return backend.df_engine.map_objects(
+        column,
+        lambda x: np.array(x).shape,
+    ).max()
+
+
 def unflatten_df(df, column_shapes, backend):
     for c in df.columns:
         shape = column_shapes.get(c)
@@ -306,7 +336,7 @@ def unflatten_df(df, column_shapes, backend):
 def to_numpy_dataset(df):
     dataset = {}
     for col in df.columns:
-        dataset[col] = np.stack(df[col].to_numpy())
+        dataset[col] = column_to_numpy(df[col])
     return dataset
 
 
@@ -314,8 +344,9 @@ def from_numpy_dataset(dataset):
     col_mapping = {}
     for k, v in dataset.items():
         if len(v.shape) > 1:
-            # unstacking, needed for ndarrays of dimension 2 and more
-            *vals, = v
+            # ndarrays of dimension 2 and more are kept whole in a tensor
+            # column, instead of being unstacked
+            vals = TensorArray(v)
         else:
             # not unstacking. Needed because otherwise pandas casts types
             # the way it wants, like converting a list of float32 scalats
@@ -344,6 +375,152 @@ def load_hdf5(data_fp):
     return from_numpy_dataset(numpy_dataset)
 
 
+def save_npy(data_dir, data):
+    """Saves each column of the DataFrame as a raw .npy file in `data_dir`,
+    so that they can be memory mapped by `load_npy`."""
+    os.makedirs(data_dir, exist_ok=True)
+    columns = list(data.columns)
+    for i, column in enumerate(columns):
+        # column names are not guaranteed to be valid file names
+        np.save(os.path.join(data_dir, '{}.npy'.format(i)),
+                column_to_numpy(data[column]),
+                allow_pickle=False)
+    save_json(os.path.join(data_dir, NPY_COLUMNS_FILE_NAME), columns)
+
+
+class HDF5Writer:
+    """Appends DataFrames to an HDF5 file in the format read by `load_hdf5`,
+    so that a dataset can be saved without holding all of it in memory.
+    The file is only created by the first call to `write`."""
+
+    def __init__(self, data_fp):
+        self.data_fp = data_fp
+        self._exit_stack = None
+        self._h5_file = None
+
+    def write(self, data):
+        numpy_dataset = to_numpy_dataset(data)
+        if self._h5_file is None:
+            self._exit_stack = contextlib.ExitStack()
+            self._h5_file = self._exit_stack.enter_context(
+                upload_h5(self.data_fp)
+            )
+            self._h5_file.create_dataset(
+                HDF5_COLUMNS_KEY,
+                data=np.array(data.columns.values, dtype='S')
+            )
+            for column in data.columns:
+                values = numpy_dataset[column]
+                self._h5_file.create_dataset(
+                    column,
+                    data=values,
+                    maxshape=(None,) + values.shape[1:],
+                    chunks=True
+                )
+            return
+
+        for column in data.columns:
+            dataset = self._h5_file[column]
+            size = len(dataset)
+            dataset.resize(size + len(data), axis=0)
+            dataset[size:] = numpy_dataset[column]
+
+    def close(self):
+        if self._exit_stack is not None:
+            self._exit_stack.close()
+            self._exit_stack = None
+            self._h5_file = None
+
+
+class NpyWriter:
+    """Appends DataFrames to the columns of an npy cache directory in the
+    format read by `load_npy`, so that a dataset can be saved without holding
+    all of it in memory. The header of every .npy file is rewritten with the
+    final number of rows when the writer is closed."""
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self.columns = None
+        self._files = []
+        self._shapes = []
+        self._dtypes = []
+        self._header_sizes = []
+
+    def write(self, data):
+        if self.columns is None:
+            os.makedirs(self.data_dir, exist_ok=True)
+            self.columns = list(data.columns)
+            for i, column in enumerate(self.columns):
+                values = column_to_numpy(data[column])
+                if values.dtype == object:
+                    raise ValueError(
+                        'Column {} cannot be saved as npy'.format(column)
+                    )
+                f = open(os.path.join(self.data_dir, '{}.npy'.format(i)),
+                         'wb')
+                # reserve the space of the header of the largest array
+                header = _npy_header(
+                    values.dtype,
+                    (np.iinfo(np.int64).max,) + values.shape[1:]
+                )
+                f.write(header)
+                self._files.append(f)
+                self._shapes.append((0,) + values.shape[1:])
+                self._dtypes.append(values.dtype)
+                self._header_sizes.append(len(header))
+
+        for i, column in enumerate(self.columns):
+            values = np.asarray(
+                column_to_numpy(data[column]), dtype=self._dtypes[i]
+            )
+            if values.shape[1:] != self._shapes[i][1:]:
+                raise ValueError(
+                    'Rows of column {} have inconsistent shapes {} and {}'
+                    .format(column, self._shapes[i][1:], values.shape[1:])
+                )
+            self._files[i].write(np.ascontiguousarray(values).tobytes())
+            self._shapes[i] = (self._shapes[i][0] + len(values),) + \
+                self._shapes[i][1:]
+
+    def close(self):
+        if self.columns is None:
+            return
+        for f, shape, dtype, header_size in zip(
+                self._files, self._shapes, self._dtypes, self._header_sizes
+        ):
+            f.seek(0)
+            f.write(_npy_header(dtype, shape, header_size))
+            f.close()
+        save_json(os.path.join(self.data_dir, NPY_COLUMNS_FILE_NAME),
+                  self.columns)
+        self._files = []
+
+
+def _npy_header(dtype, shape, size=None):
+    """Returns the header of a version 1.0 .npy file, padded with spaces to
+    `size` bytes, or to the next multiple of 64 bytes if `size` is None."""
+    magic = np.lib.format.magic(1, 0)
+    header = "{{'descr': {!r}, 'fortran_order': False, 'shape': {!r}, }}".format(
+        np.lib.format.dtype_to_descr(np.dtype(dtype)), tuple(shape)
+    )
+    # the magic string is followed by the length of the header as uint16
+    prefix_size = len(magic) + 2
+    if size is None:
+        size = -(-(prefix_size + len(header) + 1) // 64) * 64
+    header = header.ljust(size - prefix_size - 1) + '\n'
+    return magic + struct.pack('<H', len(header)) + header.encode('latin1')
+
+
+def load_npy(data_dir, mmap_mode='r'):
+    columns = load_json(os.path.join(data_dir, NPY_COLUMNS_FILE_NAME))
+    return {
+        column: np.load(os.path.join(data_dir, '{}.npy'.format(i)),
+                        mmap_mode=mmap_mode,
+                        allow_pickle=False)
+        for i, column in enumerate(columns)
+    }
+
+
 def load_object(object_fp):
     with open_file(object_fp, 'rb') as f:
         return pickle.load(f)
@@ -377,75 +554,172 @@ def save_array(data_fp, array):
 
 
 def load_pretrained_embeddings(embeddings_path, vocab):
-    embeddings = load_glove(embeddings_path)
+    word_index, vectors = load_embeddings_store(embeddings_path)
+    rows = [word_index.get(word) for word in vocab]
+    found = [i for i, row in enumerate(rows) if row is not None]
+    # only the rows of the words in the vocabulary are read from the store
+    found_vectors = np.asarray(
+        vectors[[rows[i] for i in found]], dtype=np.float64
+    )
 
     # find out the size of the embeddings
-    embeddings_size = len(next(iter(embeddings.values())))
+    embeddings_size = vectors.shape[1]
 
     # calculate an average embedding, to use for initializing missing words
     avg_embedding = np.zeros(embeddings_size)
-    count = 0
-    for word in vocab:
-        if word in embeddings:
-            avg_embedding += embeddings[word]
-            count += 1
-    if count > 0:
-        avg_embedding /= count
+    if found:
+        avg_embedding = found_vectors.mean(axis=0)
 
     # create the embedding matrix
-    embeddings_vectors = []
-    for word in vocab:
-        if word in embeddings:
-            embeddings_vectors.append(embeddings[word])
-        else:
-            embeddings_vectors.append(
+    embeddings_matrix = np.empty((len(vocab), embeddings_size))
+    embeddings_matrix[found] = found_vectors
+    for i, row in enumerate(rows):
+        if row is None:
+            embeddings_matrix[i] = \
                 avg_embedding + np.random.uniform(-0.01, 0.01, embeddings_size)
-            )
-    embeddings_matrix = np.stack(embeddings_vectors)
-
-    # let's help the garbage collector free some memory
-    embeddings = None
 
     return embeddings_matrix
 
 
 @functools.lru_cache(1)
 def load_glove(file_path):
+    word_index, vectors = load_embeddings_store(file_path)
+    return {word: vectors[row] for word, row in word_index.items()}
+
+
+@functools.lru_cache(1)
+def load_embeddings_store(file_path):
+    """Returns the index of the words of a GloVe format file and the matrix
+    of their embeddings, memory mapped from a binary store created the first
+    time the file is loaded and reused by every later process."""
     logger.info('  Loading Glove format file {}'.format(file_path))
-    embeddings = {}
+    store_dir = get_embeddings_store_dir(file_path)
+    source_info = _get_source_info(file_path)
+    store = _load_embeddings_store(store_dir, source_info)
+    if store is None:
+        _save_embeddings_store(store_dir, file_path, source_info)
+        store = _load_embeddings_store(store_dir, source_info)
+    words, vectors = store
+    logger.info('  {0} embeddings loaded'.format(len(words)))
+    # the last embedding of a word appearing several times is kept
+    return {word: row for row, word in enumerate(words)}, vectors
+
+
+def get_embeddings_store_dir(file_path):
+    """The store of a local file is saved next to it, while the stores of
+    remote files and of files in read only directories are saved in the
+    temporary directory."""
+    if split_protocol(file_path)[0] is None and os.access(
+            os.path.dirname(os.path.abspath(file_path)), os.W_OK
+    ):
+        return '{}.npy'.format(file_path)
+    return os.path.join(
+        tempfile.gettempdir(),
+        'ludwig_embeddings',
+        '{}.npy'.format(re.sub(r'\W+', '_', file_path))
+    )
+
+
+def _get_source_info(file_path):
+    fs, path = get_fs_and_path(file_path)
+    info = fs.info(path)
+    return {'path': file_path, 'size': info['size'],
+            'mtime': str(info.get('mtime', info.get('LastModified')))}
+
+
+def _get_embeddings_store_version_dir(store_dir, source_info):
+    # each version of the source file has its own store, so that a store is
+    # never modified once it exists
+    return os.path.join(store_dir, re.sub(
+        r'\W+', '_', '{size}_{mtime}'.format(**source_info)
+    ))
+
+
+def _load_embeddings_store(store_dir, source_info):
+    version_dir = _get_embeddings_store_version_dir(store_dir, source_info)
+    try:
+        store = load_json(os.path.join(version_dir,
+                                       EMBEDDINGS_WORDS_FILE_NAME))
+        vectors = load_npy(version_dir)['embeddings']
+    except FileNotFoundError:
+        # not converted yet, or removed as a previous version of the file
+        return None
+    return store['words'], vectors
+
+
+def _save_embeddings_store(store_dir, file_path, source_info,
+                           batch_size=10000):
+    version_dir = _get_embeddings_store_version_dir(store_dir, source_info)
+    logger.info('  Converting Glove format file {} to {}'.format(
+        file_path, version_dir
+    ))
     embedding_size = 0
 
     # collect embeddings size assuming the first line is correct
     with open_file(file_path, 'r', encoding='utf-8') as f:
-        found_line = False
-        while not found_line:
-            line = f.readline()
-            if line:
+        for line in f:
+            if line.strip():
                 embedding_size = len(line.split()) - 1
-                found_line = True
+                break
 
-    # collect embeddings
-    with open_file(file_path, 'r', encoding='utf-8') as f:
-        for line_number, line in enumerate(f):
-            if line:
-                try:
-                    split = line.split()
-                    if len(split) != embedding_size + 1:
-                        raise ValueError
-                    word = split[0]
-                    embedding = np.array(
-                        [float(val) for val in split[-embedding_size:]]
-                    )
-                    embeddings[word] = embedding
-                except ValueError:
-                    logger.warning(
-                        'Line {} in the GloVe file {} is malformed, '
-                        'skipping it'.format(
-                            line_number, file_path
-                        )
-                    )
-    logger.info('  {0} embeddings loaded'.format(len(embeddings)))
-    return embeddings
+    # the store is written to a hidden temporary directory first and renamed
+    # in a single step, so that readers and processes converting the same
+    # file at the same time never see partial stores
+    os.makedirs(store_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix='.', dir=store_dir)
+    try:
+        words = []
+        batch = []
+        writer = NpyWriter(tmp_dir)
+        try:
+            with open_file(file_path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f):
+                    if line:
+                        try:
+                            split = line.split()
+                            if len(split) != embedding_size + 1:
+                                raise ValueError
+                            batch.append(np.array(
+                                split[-embedding_size:], dtype=np.float32
+                            ))
+                            words.append(split[0])
+                        except ValueError:
+                            logger.warning(
+                                'Line {} in the GloVe file {} is malformed, '
+                                'skipping it'.format(
+                                    line_number, file_path
+                                )
+                            )
+                    if len(batch) == batch_size:
+                        writer.write(pd.DataFrame({'embeddings': batch}))
+                        batch = []
+            if batch:
+                writer.write(pd.DataFrame({'embeddings': batch}))
+        finally:
+            writer.close()
+        if not words:
+            raise ValueError(
+                'The GloVe file {} does not contain any valid embedding '
+                'line: each line must be a word followed by the values of '
+                'its embedding, separated by spaces'.format(file_path)
+            )
+        save_json(os.path.join(tmp_dir, EMBEDDINGS_WORDS_FILE_NAME),
+                  {'source': source_info, 'words': words})
+
+        try:
+            os.rename(tmp_dir, version_dir)
+        except OSError:
+            if not os.path.exists(version_dir):
+                raise
+            # another process has created the store in the meantime
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    # the stores of previous versions of the file are not used anymore
+    for name in os.listdir(store_dir):
+        path = os.path.join(store_dir, name)
+        if not name.startswith('.') and path != version_dir:
+            shutil.rmtree(path, ignore_errors=True)
 
 
 def split_data(split, data):
@@ -667,6 +941,7 @@ def get_path_size(
 def clear_data_cache():
     """Clears any cached data objects (e.g., embeddings)"""
     load_glove.cache_clear()
+    load_embeddings_store.cache_clear()
 
 
 def figure_data_format_dataset(dataset):
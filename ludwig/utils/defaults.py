@@ -31,11 +31,13 @@ default_random_seed = 42
 default_preprocessing_force_split = False
 default_preprocessing_split_probabilities = (0.7, 0.1, 0.2)
 default_preprocessing_stratify = None
+default_preprocessing_chunk_size = None
 
 default_preprocessing_parameters = {
     'force_split': default_preprocessing_force_split,
     'split_probabilities': default_preprocessing_split_probabilities,
-    'stratify': default_preprocessing_stratify
+    'stratify': default_preprocessing_stratify,
+    'chunk_size': default_preprocessing_chunk_size
 }
 default_preprocessing_parameters.update({
     name: base_type.preprocessing_defaults for name, base_type in
@@ -67,6 +69,8 @@ default_training_params = {
     'validation_field': COMBINED,
     'validation_metric': LOSS,
     'bucketing_field': None,
+    'prefetch_batches': 0,
+    'prefetch_workers': 1,
     'learning_rate_warmup_epochs': 1
 }
 
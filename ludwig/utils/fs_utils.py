@@ -57,7 +57,8 @@ def rename(src, tgt):
         fs = fsspec.filesystem(protocol)
         fs.mv(src, tgt, recursive=True)
     else:
-        os.rename(src, tgt)
+        # replaces tgt atomically when it already exists
+        os.replace(src, tgt)
 
 
 def makedirs(url, exist_ok=False):
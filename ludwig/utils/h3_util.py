@@ -14,6 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import numpy as np
+
+
 def set_bit(v, index, x):
     """Set the index:th bit of v to 1 if x is truthy, else to 0, and return the new value."""
     mask = 1 << index  # Compute mask, an integer with just bit 'index' set.
@@ -95,6 +98,37 @@ def h3_to_components(h3_value):
     }
 
 
+def h3_to_components_matrix(h3_values, max_resolution=15, padding_value=7):
+    """
+    Vectorized version of h3_to_components.
+    Returns a [len(h3_values) x (4 + max_resolution)] uint8 matrix with the
+    mode, edge, resolution and base cell of each H3 value, followed by its
+    cells padded with padding_value.
+    """
+    h3_values = np.asarray(h3_values, dtype=np.uint64)
+
+    def _bitslice(start_bit, slice_length):
+        return (h3_values >> np.uint64(start_bit)) & \
+               np.uint64(2 ** slice_length - 1)
+
+    resolution = _bitslice(64 - 12, 4)
+    header = [
+        _bitslice(64 - 5, 4),
+        _bitslice(64 - 8, 3),
+        resolution,
+        _bitslice(64 - 19, 7),
+    ]
+    cells = [
+        np.where(
+            resolution >= np.uint64(i),
+            _bitslice(64 - 19 - 3 * i, 3),
+            np.uint64(padding_value)
+        )
+        for i in range(1, max_resolution + 1)
+    ]
+    return np.stack(header + cells, axis=-1).astype(np.uint8)
+
+
 if __name__ == '__main__':
     value = 622236723497533439
     components = h3_to_components(value)
@@ -14,9 +14,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import io
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from math import ceil, floor
 
 import numpy as np
@@ -62,7 +64,13 @@ def is_image(src_path, img_entry):
         return False
 
 
-def read_image(img):
+def read_image(img, size=None):
+    """
+    Reads the image at path img, arrays are returned as they are.
+    If size (height, width) is provided, JPEG images are decoded at the
+    smallest scale that is still at least as large as size, which is much
+    faster than decoding them at full resolution when they will be shrunk.
+    """
     try:
         from skimage.io import imread
     except ImportError:
@@ -73,10 +81,60 @@ def read_image(img):
         )
         sys.exit(-1)
     if isinstance(img, str):
+        if size is not None:
+            draft_img = read_jpeg_draft(img, size)
+            if draft_img is not None:
+                return draft_img
         return imread(img)
     return img
 
 
+def read_jpeg_draft(img, size):
+    """
+    Returns the JPEG image img (path, file object or bytes) decoded at the
+    smallest scale (1, 1/2, 1/4 or 1/8) that is still at least as large as
+    size (height, width), or None if img is not a greyscale or RGB JPEG image.
+    """
+    from PIL import Image
+
+    if isinstance(img, bytes):
+        img = io.BytesIO(img)
+    try:
+        with Image.open(img) as pil_img:
+            if pil_img.format != 'JPEG' or pil_img.mode not in {'L', 'RGB'}:
+                return None
+            pil_img.draft(pil_img.mode, (size[1], size[0]))
+            return np.asarray(pil_img)
+    except Exception:
+        # left to the regular decoding, which raises meaningful errors
+        return None
+
+
+def read_images(img_entries, read_fn, shape, num_threads=1):
+    """
+    Returns the uint8 [len(img_entries) x height x width x num_channels]
+    array of the images returned by read_fn(img_entry), with shape
+    (height, width, num_channels).
+    The images are read by a pool of num_threads threads, as decoding and
+    resizing mostly release the GIL, and written directly into the array,
+    so that they never need to be pickled.
+    """
+    images = np.empty((len(img_entries),) + tuple(shape), dtype=np.uint8)
+
+    def read_into(i):
+        images[i] = read_fn(img_entries[i])
+
+    if num_threads > 1 and len(img_entries) > 1:
+        with ThreadPoolExecutor(num_threads) as executor:
+            # consumes the results to raise the exceptions of the threads
+            for _ in executor.map(read_into, range(len(img_entries))):
+                pass
+    else:
+        for i in range(len(img_entries)):
+            read_into(i)
+    return images
+
+
 def pad(img, size, axis):
     old_size = img.shape[axis]
     pad_size = float(size - old_size) / 2
@@ -19,19 +19,26 @@ import re
 import unicodedata
 from abc import abstractmethod
 from collections import Counter
+from multiprocessing import Pool
 
 import numpy as np
+import pandas as pd
 
 from ludwig.data.dataframe.pandas import PANDAS
+from ludwig.data.dataframe.tensor import TensorArray, TensorDtype
 from ludwig.utils.fs_utils import open_file
 from ludwig.utils.math_utils import int_type
 from ludwig.utils.misc_utils import get_from_registry
 from ludwig.utils.nlp_utils import load_nlp_pipeline, process_text
 
+logger = logging.getLogger(__name__)
+
 UNKNOWN_SYMBOL = '<UNK>'
 PADDING_SYMBOL = '<PAD>'
 PADDING_IDX = 0
 
+TOKENIZE_CHUNKS_PER_PROCESS = 4
+
 SPLIT_REGEX = re.compile(r'\s+')
 SPACE_PUNCTUATION_REGEX = re.compile(r'\w+|[^\w\s]')
 COMMA_REGEX = re.compile(r'\s*,\s*')
@@ -100,6 +107,75 @@ def load_vocabulary(vocab_file):
         # return [line.strip() for line in f]
 
 
+def tokenize(
+        data,
+        tokenizer_type='space',
+        lowercase=True,
+        vocab_file=None,
+        pretrained_model_name_or_path=None,
+        processor=PANDAS,
+        num_processes=1,
+):
+    """Returns the list of units of every line of `data`.
+
+    The result can be passed as `tokens` to both `create_vocabulary` and
+    `build_sequence_matrix` so that the lines are only tokenized once.
+
+    When `num_processes` is greater than 1, the lines of a non partitioned
+    `data` are tokenized by a pool of processes, each one instantiating the
+    tokenizer once.
+    """
+    tokenizer_kwargs = dict(
+        vocab_file=vocab_file,
+        pretrained_model_name_or_path=pretrained_model_name_or_path,
+    )
+
+    if num_processes > 1 and not processor.partitioned and len(data) > 1:
+        logger.debug(
+            'Using {} processes for tokenizing'.format(num_processes)
+        )
+        lines = data.to_numpy()
+        # a few chunks per process balance the load between the processes
+        chunks = np.array_split(
+            lines, min(len(lines), num_processes * TOKENIZE_CHUNKS_PER_PROCESS)
+        )
+        with Pool(
+                num_processes,
+                initializer=_init_tokenizer_process,
+                initargs=(tokenizer_type, tokenizer_kwargs, lowercase)
+        ) as pool:
+            tokens = [units for chunk_units in pool.map(_tokenize_chunk, chunks)
+                      for units in chunk_units]
+        return pd.Series(tokens, index=data.index, name=data.name)
+
+    tokenizer = get_from_registry(
+        tokenizer_type,
+        tokenizer_registry
+    )(**tokenizer_kwargs)
+    return processor.map_objects(
+        data,
+        lambda line: tokenizer(line.lower() if lowercase else line)
+    )
+
+
+# tokenizer used by the processes of the pool of tokenize()
+_process_tokenizer = None
+
+
+def _init_tokenizer_process(tokenizer_type, tokenizer_kwargs, lowercase):
+    global _process_tokenizer
+    tokenizer = get_from_registry(
+        tokenizer_type,
+        tokenizer_registry
+    )(**tokenizer_kwargs)
+    _process_tokenizer = (tokenizer, lowercase)
+
+
+def _tokenize_chunk(lines):
+    tokenizer, lowercase = _process_tokenizer
+    return [tokenizer(line.lower() if lowercase else line) for line in lines]
+
+
 def create_vocabulary(
         data,
         tokenizer_type='space',
@@ -112,18 +188,76 @@ def create_vocabulary(
         padding_symbol=PADDING_SYMBOL,
         pretrained_model_name_or_path=None,
         processor=PANDAS,
+        tokens=None,
 ):
-    vocab = None
-
-    tokenizer = get_from_registry(
-        tokenizer_type,
-        tokenizer_registry
-    )(
+    tokenizer = None
+    if tokens is None or tokenizer_type == 'hf_tokenizer':
+        tokenizer = get_from_registry(
+            tokenizer_type,
+            tokenizer_registry
+        )(
+            vocab_file=vocab_file,
+            pretrained_model_name_or_path=pretrained_model_name_or_path,
+        )
+
+    if tokens is None:
+        tokens = data.map(
+            lambda line: tokenizer(line.lower() if lowercase else line)
+        )
+    unit_counts, max_line_length = count_units(tokens, processor)
+
+    return build_vocabulary(
+        unit_counts,
+        max_line_length,
+        tokenizer_type=tokenizer_type,
+        add_unknown=add_unknown,
+        add_padding=add_padding,
+        num_most_frequent=num_most_frequent,
         vocab_file=vocab_file,
+        unknown_symbol=unknown_symbol,
+        padding_symbol=padding_symbol,
         pretrained_model_name_or_path=pretrained_model_name_or_path,
+        tokenizer=tokenizer,
     )
 
+
+def count_units(tokens, processor=PANDAS):
+    """Returns a Counter of the units of the tokenized lines and the length
+    of the longest line."""
+    processed_counts = tokens.explode().value_counts(sort=False)
+    processed_counts = processor.compute(processed_counts)
+    unit_counts = Counter(dict(processed_counts))
+    max_line_length = processor.compute(tokens.map(len).max())
+    return unit_counts, max_line_length
+
+
+def build_vocabulary(
+        unit_counts,
+        max_line_length,
+        tokenizer_type='space',
+        add_unknown=True,
+        add_padding=True,
+        num_most_frequent=None,
+        vocab_file=None,
+        unknown_symbol=UNKNOWN_SYMBOL,
+        padding_symbol=PADDING_SYMBOL,
+        pretrained_model_name_or_path=None,
+        tokenizer=None,
+):
+    """Builds the vocabulary returned by `create_vocabulary` from the unit
+    counts of the data, which can also be summed over chunks of it."""
+    vocab = None
+
     if tokenizer_type == 'hf_tokenizer':
+        if tokenizer is None:
+            tokenizer = get_from_registry(
+                tokenizer_type,
+                tokenizer_registry
+            )(
+                vocab_file=vocab_file,
+                pretrained_model_name_or_path=pretrained_model_name_or_path,
+            )
+
         try:
             vocab = tokenizer.tokenizer.get_vocab()
             vocab = list(vocab.keys())
@@ -149,12 +283,6 @@ def create_vocabulary(
     elif vocab_file is not None:
         vocab = load_vocabulary(vocab_file)
 
-    processed_lines = data.map(lambda line: tokenizer(line.lower() if lowercase else line))
-    processed_counts = processed_lines.explode().value_counts(sort=False)
-    processed_counts = processor.compute(processed_counts)
-    unit_counts = Counter(dict(processed_counts))
-    max_line_length = processor.compute(processed_lines.map(len).max())
-
     if vocab is None:
         vocab = [unit for unit, count in
                  unit_counts.most_common(num_most_frequent)]
@@ -207,7 +335,22 @@ def _get_sequence_vector(
     unit_sequence = tokenizer(
         sequence.lower() if lowercase else sequence
     )
+    return _get_unit_indices_vector(
+        unit_sequence,
+        tokenizer_type,
+        format_dtype,
+        unit_to_id,
+        unknown_symbol=unknown_symbol
+    )
+
 
+def _get_unit_indices_vector(
+        unit_sequence,
+        tokenizer_type,
+        format_dtype,
+        unit_to_id,
+        unknown_symbol=UNKNOWN_SYMBOL
+):
     unit_indices_vector = np.empty(len(unit_sequence), dtype=format_dtype)
     for i in range(len(unit_sequence)):
         curr_unit = unit_sequence[i]
@@ -233,44 +376,120 @@ def build_sequence_matrix(
         tokenizer_vocab_file=None,
         pretrained_model_name_or_path=None,
         processor=PANDAS,
+        tokens=None,
+        num_processes=1,
 ):
-    tokenizer = get_from_registry(tokenizer_type, tokenizer_registry)(
-        vocab_file=tokenizer_vocab_file,
-        pretrained_model_name_or_path=pretrained_model_name_or_path,
-    )
+    """Returns the padded indices of the units of every line of `sequences`,
+    or of `tokens` when the lines were already tokenized by `tokenize`.
+
+    When `num_processes` is greater than 1, the lines of a non partitioned
+    `sequences` are both tokenized and converted to indices by a pool of
+    processes, each one receiving the vocabulary once.
+    """
+    if tokens is None:
+        tokens = tokenize(
+            sequences,
+            tokenizer_type,
+            lowercase=lowercase,
+            vocab_file=tokenizer_vocab_file,
+            pretrained_model_name_or_path=pretrained_model_name_or_path,
+            processor=processor,
+            num_processes=num_processes
+        )
 
     format_dtype = int_type(len(inverse_vocabulary) - 1)
 
-    unit_vectors = sequences.map(lambda sequence: _get_sequence_vector(
-        sequence,
-        tokenizer,
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        # only computed for the log, as it takes a pass over the data
+        max_length = processor.compute(tokens.map(len).max())
+        if max_length < length_limit:
+            logging.debug('max length of {0}: {1} < limit: {2}'.format(
+                format, max_length, length_limit
+            ))
+
+    matrix_kwargs = dict(
+        tokenizer_type=tokenizer_type,
+        format_dtype=format_dtype,
+        unit_to_id=inverse_vocabulary,
+        unknown_symbol=unknown_symbol,
+        length_limit=length_limit,
+        padding_idx=inverse_vocabulary[padding_symbol],
+        padding=padding,
+    )
+
+    if num_processes > 1 and not processor.partitioned and len(tokens) > 1:
+        logger.debug(
+            'Using {} processes for building the sequence matrix'.format(
+                num_processes
+            )
+        )
+        chunks = np.array_split(
+            tokens.to_numpy(),
+            min(len(tokens), num_processes * TOKENIZE_CHUNKS_PER_PROCESS)
+        )
+        with Pool(
+                num_processes,
+                initializer=_init_sequence_matrix_process,
+                initargs=(matrix_kwargs,)
+        ) as pool:
+            matrix = np.concatenate(pool.map(_sequence_matrix_chunk, chunks))
+        return pd.Series(TensorArray(matrix), index=tokens.index,
+                         name=tokens.name)
+
+    def pad_partition(unit_sequences, partition_info=None):
+        # the padded sequences are the rows of a single matrix
+        return pd.Series(
+            TensorArray(_sequence_matrix(unit_sequences, **matrix_kwargs)),
+            index=unit_sequences.index,
+            name=unit_sequences.name
+        )
+
+    return processor.map_partitions(
+        tokens,
+        pad_partition,
+        meta=(tokens.name, TensorDtype(format_dtype))
+    )
+
+
+def _sequence_matrix(
+        unit_sequences,
         tokenizer_type,
         format_dtype,
-        inverse_vocabulary,
-        lowercase=lowercase,
-        unknown_symbol=unknown_symbol
-    ))
-
-    max_length = processor.compute(unit_vectors.map(len).max())
-    if max_length < length_limit:
-        logging.debug('max length of {0}: {1} < limit: {2}'.format(
-            format, max_length, length_limit
-        ))
-    max_length = length_limit
-
-    def pad(vector):
-        sequence = np.full((max_length,),
-                           inverse_vocabulary[padding_symbol],
-                           dtype=format_dtype)
-        limit = min(vector.shape[0], max_length)
+        unit_to_id,
+        unknown_symbol,
+        length_limit,
+        padding_idx,
+        padding
+):
+    matrix = np.full((len(unit_sequences), length_limit), padding_idx,
+                     dtype=format_dtype)
+    for i, unit_sequence in enumerate(unit_sequences):
+        vector = _get_unit_indices_vector(
+            unit_sequence[:length_limit],
+            tokenizer_type,
+            format_dtype,
+            unit_to_id,
+            unknown_symbol=unknown_symbol
+        )
         if padding == 'right':
-            sequence[:limit] = vector[:limit]
+            matrix[i, :len(vector)] = vector
         else:  # if padding == 'left
-            sequence[max_length - limit:] = vector[:limit]
-        return sequence
+            matrix[i, length_limit - len(vector):] = vector
+    return matrix
+
+
+# arguments of _sequence_matrix used by the processes of the pool of
+# build_sequence_matrix()
+_process_sequence_matrix_kwargs = None
+
+
+def _init_sequence_matrix_process(matrix_kwargs):
+    global _process_sequence_matrix_kwargs
+    _process_sequence_matrix_kwargs = matrix_kwargs
+
 
-    padded = processor.map_objects(unit_vectors, pad)
-    return padded
+def _sequence_matrix_chunk(unit_sequences):
+    return _sequence_matrix(unit_sequences, **_process_sequence_matrix_kwargs)
 
 
 class BaseTokenizer:
@@ -51,6 +51,30 @@ def to_sparse(tensor, lengths, max_length):
     return tf.SparseTensor(indices, values, shape)
 
 
+# Convert a matrix of indices padded with 0 (like the set and bag features)
+# into a sparse matrix of the same shape without the padding
+def padded_indices_to_sparse(padded_indices):
+    padded_indices = tf.cast(padded_indices, tf.int64)
+    indices = tf.where(tf.not_equal(padded_indices, 0))
+    values = tf.gather_nd(padded_indices, indices)
+    shape = tf.shape(padded_indices, out_type=tf.int64)
+    return tf.SparseTensor(indices, values, shape)
+
+
+# Convert a matrix of indices padded with 0 into a [batch x depth]
+# multi-hot boolean matrix
+def padded_indices_to_multi_hot(padded_indices, depth):
+    sparse_indices = padded_indices_to_sparse(padded_indices)
+    indices = tf.stack(
+        [sparse_indices.indices[:, 0], sparse_indices.values], axis=1
+    )
+    shape = tf.stack([sparse_indices.dense_shape[0], depth])
+    counts = tf.scatter_nd(
+        indices, tf.ones_like(sparse_indices.values, dtype=tf.int32), shape
+    )
+    return tf.greater(counts, 0)
+
+
 def initialize_tensorflow(gpus=None,
                           gpu_memory_limit=None,
                           allow_parallel_threads=True,
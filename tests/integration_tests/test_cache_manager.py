@@ -1,14 +1,27 @@
+import copy
 import os
 from pathlib import Path
+from unittest import mock
 
+import dask.dataframe as dd
+import numpy as np
 import pandas as pd
 import pytest
+from pandas.testing import assert_frame_equal
 
-from ludwig.constants import META, TRAINING, VALIDATION, TEST, CHECKSUM
-from ludwig.data.cache.manager import CacheManager, alphanum
+from ludwig.api import LudwigModel
+from ludwig.constants import META, TRAINING, VALIDATION, TEST, CHECKSUM, NPY, \
+    PREPROCESSING, PROC_COLUMN
+from ludwig.data.cache.manager import CacheManager, alphanum, FEATURE_CACHE_DIR, \
+    FeatureCache
 from ludwig.data.dataset import PandasDatasetManager
+from ludwig.data.dataset.npy import NpyDataset
+from ludwig.data.preprocessing import build_dataset
+from ludwig.features.feature_utils import compute_feature_hash
+from ludwig.features.numerical_feature import NumericalFeatureMixin
 
-from tests.integration_tests.utils import sequence_feature, category_feature, LocalTestBackend
+from tests.integration_tests.utils import sequence_feature, category_feature, LocalTestBackend, \
+    numerical_feature, text_feature, generate_data
 
 
 @pytest.mark.parametrize('use_split', [True, False], ids=['split', 'no_split'])
@@ -83,3 +96,182 @@ def test_cache_dataset(use_cache_dir, use_split, tmpdir):
 
     for cache_path in cache_map.values():
         assert not os.path.exists(cache_path)
+
+
+def test_npy_cache_format(tmpdir):
+    input_features = [sequence_feature(reduce_output='sum'),
+                      numerical_feature()]
+    output_features = [category_feature(vocab_size=2, reduce_input='sum')]
+    config = {
+        'input_features': input_features,
+        'output_features': output_features,
+        'combiner': {'type': 'concat', 'fc_size': 14},
+        'training': {'epochs': 2},
+    }
+    data_csv = generate_data(input_features, output_features,
+                             os.path.join(tmpdir, 'dataset.csv'))
+
+    backend = LocalTestBackend(cache_format=NPY)
+    model = LudwigModel(config, backend=backend)
+    training_set, validation_set, test_set, _ = model.preprocess(
+        data_csv, skip_save_processed_input=False)
+    assert isinstance(training_set, NpyDataset)
+    assert os.path.isdir(training_set.data_dir)
+    for column in training_set.dataset.values():
+        assert isinstance(column, np.memmap)
+
+    # the second run reads the columns back from the cache
+    model = LudwigModel(config, backend=backend)
+    _, (training_set, _, _, _), _ = model.train(
+        dataset=data_csv, output_directory=os.path.join(tmpdir, 'results'))
+    assert isinstance(training_set, NpyDataset)
+
+    cache = backend.cache.get_dataset_cache(model.config, data_csv)
+    cache.delete()
+    for cache_path in cache.cache_map.values():
+        assert not os.path.exists(cache_path)
+
+
+@pytest.mark.parametrize('use_dask', [False, True], ids=['pandas', 'dask'])
+def test_cache_key_dataframe(use_dask, tmpdir):
+    cache_dir = os.path.join(tmpdir, 'cache')
+    manager = CacheManager(PandasDatasetManager(backend=LocalTestBackend()),
+                           cache_dir=cache_dir)
+    config = {
+        'input_features': [sequence_feature(reduce_output='sum')],
+        'output_features': [category_feature(vocab_size=2, reduce_input='sum')],
+        'preprocessing': {},
+    }
+
+    def make_df(values, array_value=0):
+        # arrays longer than 1000 values are truncated when printed
+        array = np.zeros(2000)
+        array[1500] = array_value
+        df = pd.DataFrame({
+            'a': values,
+            'b': [str(v) for v in values],
+            'c': [[v, v] for v in values],
+            'd': [array for _ in values],
+        })
+        if use_dask:
+            df = dd.from_pandas(df, npartitions=2)
+        return df
+
+    key = manager.get_cache_key(make_df(range(10)), config)
+    assert key == manager.get_cache_key(make_df(range(10)), config)
+    assert key != manager.get_cache_key(make_df(range(1, 11)), config)
+    assert key != manager.get_cache_key(make_df(range(10), 1), config)
+
+    cache = manager.get_dataset_cache(config, make_df(range(10)))
+    assert cache.cache_map[TRAINING] == os.path.join(
+        cache_dir, f'{alphanum(key)}.training.hdf5'
+    )
+
+    # without a cache_dir, the caches of in-memory datasets are not reused
+    manager = CacheManager(PandasDatasetManager(backend=LocalTestBackend()))
+    assert manager.get_cache_key(make_df(range(10)), config) != \
+        manager.get_cache_key(make_df(range(10)), config)
+    assert manager.get_feature_cache() is None
+
+
+def test_feature_cache(tmpdir):
+    input_features = [text_feature(), numerical_feature()]
+    output_features = [category_feature(vocab_size=3)]
+    features = input_features + output_features
+    data_csv = generate_data(input_features, output_features,
+                             os.path.join(tmpdir, 'dataset.csv'))
+    dataset_df = pd.read_csv(data_csv)
+    backend = LocalTestBackend(cache_dir=os.path.join(tmpdir, 'cache'))
+
+    def build(features, use_cache=True):
+        features = copy.deepcopy(features)
+        for feature in features:
+            feature[PROC_COLUMN] = compute_feature_hash(feature)
+        return build_dataset(dataset_df, features, {}, metadata={},
+                             backend=backend,
+                             skip_save_processed_input=not use_cache)
+
+    expected, expected_metadata = build(features, use_cache=False)
+    dataset, metadata = build(features)
+    assert_frame_equal(dataset, expected)
+    assert metadata.keys() == expected_metadata.keys()
+    feature_cache_dir = os.path.join(tmpdir, 'cache', FEATURE_CACHE_DIR)
+    assert len(os.listdir(feature_cache_dir)) == 2 * len(features)
+
+    # only the feature whose preprocessing changed is processed again
+    features[0][PREPROCESSING] = {'lowercase': False}
+    expected, _ = build(features, use_cache=False)
+    with mock.patch.object(NumericalFeatureMixin, 'add_feature_data') as add:
+        dataset, _ = build(features)
+    add.assert_not_called()
+    for column in expected.columns:
+        assert np.array_equal(np.stack(dataset[column]),
+                              np.stack(expected[column]))
+    assert len(os.listdir(feature_cache_dir)) == 2 * (len(features) + 1)
+
+
+def test_feature_cache_eviction(tmpdir):
+    feature_cache = FeatureCache(os.path.join(tmpdir, 'cache'), max_entries=2)
+    for i, key in enumerate(['a', 'b']):
+        feature_cache.put(key, {'key': key}, {key: np.full(3, i)})
+        # entries used a while ago
+        metadata_fp, _ = feature_cache.get_cache_paths(key)
+        os.utime(metadata_fp, (1000 * (i + 1), 1000 * (i + 1)))
+
+    # using an entry keeps it in the cache
+    metadata, proc_cols = feature_cache.get('a')
+    assert metadata == {'key': 'a'}
+    assert proc_cols['a'].tolist() == [0, 0, 0]
+
+    feature_cache.put('c', {'key': 'c'}, {'c': np.full(3, 2)})
+    assert feature_cache.get('b') is None
+    assert feature_cache.get('a') is not None
+    assert feature_cache.get('c') is not None
+    assert sorted(os.listdir(feature_cache.cache_dir)) == [
+        'a.meta.json', 'a.npz', 'c.meta.json', 'c.npz'
+    ]
+
+
+@pytest.mark.parametrize('cache_format', [None, NPY], ids=['hdf5', 'npy'])
+def test_chunked_preprocessing(cache_format, tmpdir):
+    input_features = [
+        category_feature(vocab_size=3, preprocessing={'most_common': 1000}),
+        numerical_feature(preprocessing={'missing_value_strategy': 'fill_with_mean'}),
+        sequence_feature(reduce_output='sum', preprocessing={'most_common': 1000}),
+    ]
+    output_features = [category_feature(vocab_size=2, reduce_input='sum')]
+    data_csv = generate_data(input_features, output_features,
+                             os.path.join(tmpdir, 'dataset.csv'))
+    df = pd.read_csv(data_csv)
+    df.loc[::5, input_features[1]['name']] = np.nan
+    df.to_csv(data_csv, index=False)
+
+    def preprocess(chunk_size, name):
+        config = {
+            'input_features': copy.deepcopy(input_features),
+            'output_features': copy.deepcopy(output_features),
+            'preprocessing': {'chunk_size': chunk_size},
+        }
+        backend = LocalTestBackend(
+            cache_dir=os.path.join(tmpdir, name),
+            **({'cache_format': cache_format} if cache_format else {}))
+        model = LudwigModel(config, backend=backend)
+        return model.preprocess(data_csv, skip_save_processed_input=False)
+
+    *expected_sets, expected_metadata = preprocess(None, 'full')
+    *datasets, metadata = preprocess(17, 'chunked')
+
+    expected_size = sum(ds.size for ds in expected_sets if ds is not None)
+    assert sum(ds.size for ds in datasets if ds is not None) == expected_size
+    for feature in input_features + output_features:
+        name = feature['name']
+        expected_meta = dict(expected_metadata[name])
+        meta = dict(metadata[name])
+        expected_fill = expected_meta[PREPROCESSING].pop('computed_fill_value')
+        fill = meta[PREPROCESSING].pop('computed_fill_value')
+        assert fill == pytest.approx(expected_fill, rel=1e-5)
+        assert meta == expected_meta
+    # the chunks are written to the cache the datasets are read from
+    for dataset, expected_dataset in zip(datasets, expected_sets):
+        assert type(dataset) is type(expected_dataset)
+    assert len(os.listdir(os.path.join(tmpdir, 'chunked'))) == 4
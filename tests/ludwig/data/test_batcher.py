@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import pytest
+
+from ludwig.data.batcher.prefetch import PrefetchBatcher, prefetch_batches
+from ludwig.data.batcher.random_access import RandomAccessBatcher
+from ludwig.data.sampler import DistributedSampler
+
+
+class InMemoryDataset:
+    def __init__(self, size):
+        self.features = ['x']
+        self.data = np.arange(size)
+
+    def get(self, proc_column, idx=None):
+        return self.data[idx]
+
+    def __len__(self):
+        return len(self.data)
+
+
+def epoch_batches(batcher, epoch):
+    batcher.set_epoch(epoch)
+    batches = []
+    while not batcher.last_batch():
+        batches.append(batcher.next_batch()['x'].tolist())
+    return batches
+
+
+def random_access_batcher(size, batch_size, ignore_last=False):
+    sampler = DistributedSampler(size, shuffle=True, seed=0)
+    return RandomAccessBatcher(InMemoryDataset(size), sampler,
+                               batch_size=batch_size,
+                               ignore_last=ignore_last)
+
+
+@pytest.mark.parametrize('num_workers', [1, 4])
+@pytest.mark.parametrize('queue_size', [1, 3])
+@pytest.mark.parametrize('ignore_last', [False, True])
+def test_prefetch_batcher_matches_wrapped_batcher(
+        queue_size, num_workers, ignore_last
+):
+    expected = random_access_batcher(103, 10, ignore_last=ignore_last)
+    with prefetch_batches(
+            random_access_batcher(103, 10, ignore_last=ignore_last),
+            queue_size=queue_size,
+            num_workers=num_workers
+    ) as batcher:
+        assert isinstance(batcher, PrefetchBatcher)
+        assert batcher.steps_per_epoch == expected.steps_per_epoch
+        for epoch in range(3):
+            assert epoch_batches(batcher, epoch) == \
+                   epoch_batches(expected, epoch)
+            assert batcher.step == expected.step
+
+        with pytest.raises(StopIteration):
+            batcher.next_batch()
+
+
+def test_prefetch_batcher_batch_size_change():
+    with prefetch_batches(random_access_batcher(50, 10),
+                          queue_size=2) as batcher:
+        batcher.set_epoch(0)
+        batcher.batch_size = 25
+        assert [len(b) for b in epoch_batches(batcher, 1)] == [25, 25]
+
+
+def test_prefetch_disabled():
+    inner = random_access_batcher(10, 5)
+    with prefetch_batches(inner, queue_size=0) as batcher:
+        assert batcher is inner
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from unittest import mock
+
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.backend import LOCAL_BACKEND
+from ludwig.backend.dask import DaskBackend
+from ludwig.constants import (CATEGORY, COLUMN, DROP_ROW, FILL_WITH_CONST,
+                              FILL_WITH_MEAN, FILL_WITH_MODE, NAME, NUMERICAL,
+                              PREPROCESSING, PROC_COLUMN, SEQUENCE, TYPE,
+                              VECTOR)
+from ludwig.data.preprocessing import (build_dataset, build_metadata,
+                                      cast_columns)
+from ludwig.features.numerical_feature import numeric_transformation_registry
+from ludwig.features.sequence_feature import SequenceFeatureMixin
+from ludwig.utils.defaults import default_preprocessing_parameters
+
+FEATURES = [
+    {NAME: 'category', COLUMN: 'category', PROC_COLUMN: 'category',
+     TYPE: CATEGORY,
+     PREPROCESSING: {'missing_value_strategy': FILL_WITH_MODE}},
+    {NAME: 'numerical', COLUMN: 'numerical', PROC_COLUMN: 'numerical',
+     TYPE: NUMERICAL,
+     PREPROCESSING: {'missing_value_strategy': FILL_WITH_MEAN,
+                     'normalization': 'zscore'}},
+    {NAME: 'sequence', COLUMN: 'sequence', PROC_COLUMN: 'sequence',
+     TYPE: SEQUENCE},
+    {NAME: 'vector', COLUMN: 'vector', PROC_COLUMN: 'vector', TYPE: VECTOR},
+]
+
+
+def _build_metadata(df, backend):
+    dataset_cols = cast_columns(
+        df, FEATURES, default_preprocessing_parameters, backend
+    )
+    metadata = build_metadata(
+        {}, dataset_cols, FEATURES, default_preprocessing_parameters, backend
+    )
+    for feature_meta in metadata.values():
+        feature_meta.pop('tokens', None)
+    return metadata
+
+
+@pytest.mark.parametrize('npartitions', [1, 3, 7])
+def test_build_metadata_partitioned(npartitions):
+    # distinct counts, so that the order of the vocabularies has no ties
+    df = pd.DataFrame({
+        'category': ['a'] * 8 + ['b'] * 5 + [None] * 2 + ['c'] * 3,
+        'numerical': np.arange(18, dtype=float),
+        'sequence': ['x y'] * 8 + ['y w'] * 4 + ['x z w'] * 6,
+        'vector': ['1 2 3'] * 18,
+    })
+    df.loc[::4, 'numerical'] = np.nan
+    df = df.sample(frac=1, random_state=1)
+
+    expected = _build_metadata(df, LOCAL_BACKEND)
+    metadata = _build_metadata(
+        dd.from_pandas(df, npartitions=npartitions), DaskBackend()
+    )
+
+    assert metadata.keys() == expected.keys()
+    assert metadata['vector']['vector_size'] == 3
+    for name, feature_meta in metadata.items():
+        expected_meta = expected[name]
+        preprocessing = dict(feature_meta.pop(PREPROCESSING))
+        expected_preprocessing = dict(expected_meta.pop(PREPROCESSING))
+        assert preprocessing.pop('computed_fill_value') == pytest.approx(
+            expected_preprocessing.pop('computed_fill_value')
+        )
+        assert preprocessing == expected_preprocessing
+        assert feature_meta.keys() == expected_meta.keys()
+        for key, value in feature_meta.items():
+            if isinstance(value, (float, np.floating)):
+                assert value == pytest.approx(expected_meta[key])
+            else:
+                assert value == expected_meta[key]
+
+
+@pytest.mark.parametrize('missing_value_strategy',
+                         [FILL_WITH_CONST, FILL_WITH_MEAN, DROP_ROW])
+@pytest.mark.parametrize('normalization', ['zscore', 'minmax'])
+def test_build_metadata_numerical(missing_value_strategy, normalization):
+    df = pd.DataFrame({
+        'a': np.random.RandomState(0).normal(10, 2, size=20),
+        'b': np.arange(20, dtype=float),
+    })
+    df.loc[::3] = np.nan
+    features = [
+        {NAME: name, COLUMN: name, PROC_COLUMN: name, TYPE: NUMERICAL,
+         PREPROCESSING: {'missing_value_strategy': missing_value_strategy,
+                         'normalization': normalization,
+                         'fill_value': 100}}
+        for name in df.columns
+    ]
+    dataset_cols = cast_columns(
+        df, features, default_preprocessing_parameters, LOCAL_BACKEND
+    )
+    metadata = build_metadata(
+        {}, dataset_cols, features, default_preprocessing_parameters,
+        LOCAL_BACKEND
+    )
+
+    for name in df.columns:
+        column = df[name].astype(np.float32)
+        if missing_value_strategy == FILL_WITH_CONST:
+            column = column.fillna(100)
+        elif missing_value_strategy == FILL_WITH_MEAN:
+            assert metadata[name][PREPROCESSING][
+                'computed_fill_value'
+            ] == pytest.approx(column.mean())
+            column = column.fillna(column.mean())
+        else:
+            column = column.dropna()
+        # the missing values have been handled in the column
+        assert dataset_cols[name].isna().sum() == 0
+
+        expected = numeric_transformation_registry[
+            normalization
+        ].fit_transform_params(column, LOCAL_BACKEND)
+        for key, value in expected.items():
+            assert metadata[name][key] == pytest.approx(value, rel=1e-5)
+
+
+def test_build_dataset_frees_tokens():
+    df = pd.DataFrame({
+        'a': ['x y', 'y z', 'z'] * 4,
+        'b': ['u v w', 'w', 'v u'] * 4,
+    })
+    features = [
+        {NAME: name, COLUMN: name, PROC_COLUMN: name, TYPE: SEQUENCE}
+        for name in df.columns
+    ]
+
+    features_with_tokens = []
+    add_feature_data = SequenceFeatureMixin.add_feature_data
+
+    def record_tokens(feature, input_df, proc_df, metadata, *args):
+        features_with_tokens.append(sorted(
+            name for name, feature_meta in metadata.items()
+            if 'tokens' in feature_meta
+        ))
+        return add_feature_data(feature, input_df, proc_df, metadata, *args)
+
+    with mock.patch.object(SequenceFeatureMixin, 'add_feature_data',
+                           side_effect=record_tokens):
+        dataset, metadata = build_dataset(df, features, {}, metadata={})
+
+    # the tokens of a feature are freed before the next one is tokenized
+    assert features_with_tokens == [['a'], ['b']]
+    assert not any('tokens' in metadata[name] for name in df.columns)
+    assert dataset['a'][1].tolist()[:2] == [
+        metadata['a']['str2idx']['y'], metadata['a']['str2idx']['z']
+    ]
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.data.dataframe.dask import DaskEngine
+from ludwig.data.dataframe.pandas import PandasEngine
+
+
+@pytest.mark.parametrize('npartitions', [None, 1, 3])
+def test_df_like(npartitions):
+    df = pd.DataFrame({
+        'dropped': [1.0, np.nan, 3.0, 4.0, np.nan, 6.0, 7.0],
+        'missing': [1.0, 2.0, np.nan, 4.0, 5.0, 6.0, 7.0],
+        'vector': [np.full(3, i) for i in range(7)],
+    }, index=np.arange(10, 17))
+    engine = PandasEngine()
+    if npartitions is not None:
+        df = dd.from_pandas(df, npartitions=npartitions)
+        engine = DaskEngine()
+
+    proc_cols = {
+        # the rows with missing values are dropped from the column, like
+        # with the DROP_ROW missing value strategy
+        'dropped': df['dropped'].dropna() * 2,
+        'missing': df['missing'],
+        'vector': df['vector'],
+        'split': df['missing'].isna().astype(np.int8),
+        'binary': (~df['missing'].isna()).values,
+    }
+    dataset = engine.compute(
+        engine.df_like(df, proc_cols, drop_row_cols=['dropped'])
+    )
+
+    assert list(dataset.columns) == [
+        'dropped', 'missing', 'vector', 'split', 'binary'
+    ]
+    # only the rows missing from the columns of drop_row_cols are dropped
+    assert dataset.index.tolist() == [10, 12, 13, 15, 16]
+    assert dataset['dropped'].tolist() == [2.0, 6.0, 8.0, 12.0, 14.0]
+    assert dataset['missing'].isna().tolist() == [
+        False, True, False, False, False
+    ]
+    assert dataset['split'].tolist() == [0, 1, 0, 0, 0]
+    assert dataset['binary'].tolist() == [True, False, True, True, True]
+    assert [v.tolist() for v in dataset['vector']] == [
+        [i] * 3 for i in [0, 2, 3, 5, 6]
+    ]
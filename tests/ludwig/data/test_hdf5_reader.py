@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import pickle
+
+import h5py
+import numpy as np
+import pytest
+
+from ludwig.data.dataset.hdf5_reader import HDF5ChunkReader
+
+
+@pytest.mark.parametrize('chunks', [None, (16, 4, 4, 3)])
+@pytest.mark.parametrize('cache_size_mb', [0, 0.01, 10])
+def test_hdf5_chunk_reader(tmpdir, chunks, cache_size_mb):
+    data = np.random.randint(0, 255, (500, 4, 4, 3)).astype(np.uint8)
+    h5_fp = os.path.join(tmpdir, 'data.hdf5')
+    with h5py.File(h5_fp, 'w') as h5_file:
+        h5_file.create_dataset('x_data', data=data, chunks=chunks)
+
+    reader = HDF5ChunkReader(h5_fp, cache_size_mb=cache_size_mb)
+    for _ in range(10):
+        idx = np.random.randint(0, len(data), 64)
+        assert np.array_equal(reader.read('x_data', idx), data[idx])
+        assert reader._cache_bytes <= reader.cache_size
+
+    reader = pickle.loads(pickle.dumps(reader))
+    assert np.array_equal(reader.read('x_data', [499, 0, 7]),
+                          data[[499, 0, 7]])
+    reader.close()
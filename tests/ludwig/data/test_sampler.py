@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import pytest
+
+from ludwig.data.sampler import DistributedSampler
+
+
+class FakeHorovod:
+    def __init__(self, rank, size):
+        self._rank = rank
+        self._size = size
+
+    def rank(self):
+        return self._rank
+
+    def size(self):
+        return self._size
+
+
+@pytest.mark.parametrize('shuffle', [False, True])
+@pytest.mark.parametrize('dataset_size', [1, 7, 100])
+@pytest.mark.parametrize('num_replicas', [1, 3, 4])
+def test_distributed_sampler(dataset_size, num_replicas, shuffle):
+    samplers = [
+        DistributedSampler(dataset_size,
+                           shuffle=shuffle,
+                           horovod=FakeHorovod(rank, num_replicas))
+        for rank in range(num_replicas)
+    ]
+
+    for epoch in range(2):
+        rank_indices = []
+        for sampler in samplers:
+            sampler.set_epoch(epoch)
+            indices = sampler.get_indices()
+            assert isinstance(indices, np.ndarray)
+            assert len(indices) == len(sampler)
+            assert list(sampler) == indices.tolist()
+            rank_indices.append(indices)
+
+        # every sample is assigned to at least one replica, and replicas
+        # only overlap on the samples used to pad the last round
+        all_indices = np.concatenate(rank_indices)
+        assert set(all_indices.tolist()) == set(range(dataset_size))
+        assert len(all_indices) - dataset_size < num_replicas
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.backend import LOCAL_BACKEND
+from ludwig.backend.dask import DaskBackend
+from ludwig.constants import SPLIT
+from ludwig.data.preprocessing import get_split
+
+
+@pytest.mark.parametrize('stratify', [None, 'label'])
+@pytest.mark.parametrize('use_dask', [False, True], ids=['pandas', 'dask'])
+def test_get_split(use_dask, stratify):
+    num_rows = 10000
+    df = pd.DataFrame({
+        'label': np.random.randint(0, 3, num_rows),
+        'value': np.random.random(num_rows),
+    }, index=np.arange(num_rows) * 2)
+    backend = LOCAL_BACKEND
+    if use_dask:
+        df = dd.from_pandas(df, npartitions=4)
+        backend = DaskBackend()
+
+    def split(random_seed):
+        return backend.df_engine.compute(get_split(
+            df,
+            split_probabilities=(0.7, 0.1, 0.2),
+            stratify=stratify,
+            backend=backend,
+            random_seed=random_seed
+        ))
+
+    split_values = split(42)
+    assert split_values.dtype == np.int8
+    assert split_values.index.equals(backend.df_engine.compute(df).index)
+    assert split_values.equals(split(42))
+    assert not split_values.equals(split(43))
+
+    fractions = np.bincount(split_values, minlength=3) / num_rows
+    assert np.allclose(fractions, (0.7, 0.1, 0.2), atol=0.02)
+
+    if stratify is not None:
+        labels = backend.df_engine.compute(df)['label']
+        for label in range(3):
+            label_split = split_values[labels == label]
+            fractions = np.bincount(label_split, minlength=3) / len(label_split)
+            # exact proportions up to rounding in every partition
+            assert np.allclose(fractions, (0.7, 0.1, 0.2), atol=0.002)
+
+
+@pytest.mark.parametrize('use_dask', [False, True], ids=['pandas', 'dask'])
+def test_get_split_rare_classes(use_dask):
+    # every class has a single row in every partition
+    num_rows = 3000
+    df = pd.DataFrame({'label': np.arange(num_rows)})
+    backend = LOCAL_BACKEND
+    if use_dask:
+        df = dd.from_pandas(df, npartitions=10)
+        backend = DaskBackend()
+
+    split_values = backend.df_engine.compute(get_split(
+        df,
+        split_probabilities=(0.7, 0.1, 0.2),
+        stratify='label',
+        backend=backend
+    ))
+    fractions = np.bincount(split_values, minlength=3) / num_rows
+    assert np.allclose(fractions, (0.7, 0.1, 0.2), atol=0.03)
+
+
+def test_get_split_existing_column():
+    df = pd.DataFrame({SPLIT: [0, 1, 2, 0]})
+    assert get_split(df).equals(df[SPLIT])
+    assert len(get_split(df, force_split=True)) == len(df)
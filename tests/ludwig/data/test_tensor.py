@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import pickle
+
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from ludwig.data.dataframe.tensor import (TensorArray, TensorDtype,
+                                          column_to_numpy, flatten_rows)
+
+
+def _tensor_df():
+    tensor = np.arange(24, dtype=np.int32).reshape(6, 2, 2)
+    return tensor, pd.DataFrame({
+        'tensor': TensorArray(tensor),
+        'split': [0, 1, 0, 2, 0, 1],
+    }, index=np.arange(10, 16))
+
+
+def test_tensor_column_rows():
+    tensor, df = _tensor_df()
+    assert df['tensor'].dtype == TensorDtype(np.int32)
+    assert pd.api.types.pandas_dtype('tensor[int32]') == TensorDtype(np.int32)
+
+    # selecting rows keeps the tensor, whose rows are gathered at the end
+    train = df[df['split'] == 0]
+    assert train['tensor'].array._tensor is tensor
+    assert np.array_equal(column_to_numpy(train['tensor']), tensor[[0, 2, 4]])
+    # all the rows in order are the tensor itself
+    assert column_to_numpy(df['tensor']) is tensor
+
+    # the rows can be mapped one at a time
+    assert df['tensor'].map(np.sum).tolist() == [
+        row.sum() for row in tensor
+    ]
+    assert np.array_equal(df['tensor'][12], tensor[2])
+
+    shuffled = pd.concat([train, df[df['split'] > 0]])
+    assert shuffled.index.tolist() == [10, 12, 14, 11, 13, 15]
+    assert np.array_equal(column_to_numpy(shuffled['tensor']),
+                          tensor[[0, 2, 4, 1, 3, 5]])
+
+    restored = pickle.loads(pickle.dumps(train))
+    assert np.array_equal(column_to_numpy(restored['tensor']),
+                          tensor[[0, 2, 4]])
+
+
+def test_tensor_column_missing_rows():
+    tensor, df = _tensor_df()
+    column = df['tensor'].reindex([11, 99, 13])
+    assert column.isna().tolist() == [False, True, False]
+    assert column[99] is None
+
+    column = column.dropna()
+    assert np.array_equal(column_to_numpy(column), tensor[[1, 3]])
+
+
+def test_tensor_column_dask():
+    tensor, df = _tensor_df()
+    ddf = dd.from_pandas(df, npartitions=3)
+    assert ddf['tensor'].dtype == TensorDtype(np.int32)
+
+    result = ddf[ddf['split'] == 0].compute()
+    assert np.array_equal(column_to_numpy(result['tensor']), tensor[[0, 2, 4]])
+
+
+def test_flatten_rows():
+    tensor, df = _tensor_df()
+    flattened = flatten_rows(df['tensor'])
+    assert flattened.index.equals(df.index)
+    assert np.array_equal(column_to_numpy(flattened), tensor.reshape(6, 4))
+
+    objects = pd.Series(list(tensor), index=df.index)
+    assert np.array_equal(column_to_numpy(flatten_rows(objects)),
+                          tensor.reshape(6, 4))
+
+    # flattened rows are stored as lists by arrow
+    array = pa.array(flattened)
+    assert array.type == pa.list_(pa.int32())
+    assert array.to_pylist() == tensor.reshape(6, 4).tolist()
+
+
+def test_tensor_column_comparison():
+    tensor, df = _tensor_df()
+    column = df['tensor']
+    assert column.equals(column.copy())
+    assert not column.equals(pd.Series(TensorArray(tensor + 1),
+                                       index=df.index))
+
+    # rows are compared one by one with another column, a list of rows, or
+    # a single row
+    other = TensorArray(np.concatenate([tensor[:3], tensor[:3]]))
+    assert (column.array == other).tolist() == [True] * 3 + [False] * 3
+    assert (column == pd.Series(other, index=df.index)).tolist() == \
+        [True] * 3 + [False] * 3
+    assert (column.array == list(tensor[::-1])).tolist() == [False] * 6
+    assert (column.array != tensor[1]).tolist() == \
+        [True, False, True, True, True, True]
+
+    # missing rows are never equal
+    missing = column.reindex([10, 99, 11])
+    assert (missing.array == missing.array).tolist() == [True, False, True]
+    assert missing.equals(missing.copy())
+
+
+def test_tensor_column_value_counts():
+    tensor = np.array([[0, 1], [2, 3], [0, 1], [0, 1]], dtype=np.int32)
+    column = pd.Series(TensorArray(tensor)).reindex([0, 1, 2, 3, 4])
+
+    codes, uniques = column.array.factorize()
+    assert codes.tolist() == [0, 1, 0, 0, -1]
+    assert uniques.dtype == TensorDtype(np.int32)
+    assert np.array_equal(column_to_numpy(uniques), tensor[:2])
+
+    counts = column.value_counts()
+    assert counts.tolist() == [3, 1]
+    assert [row.tolist() for row in counts.index] == [[0, 1], [2, 3]]
+    counts = column.value_counts(dropna=False)
+    assert counts.tolist() == [3, 1, 1]
+    assert counts.index[-1] is None
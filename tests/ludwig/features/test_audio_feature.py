@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.backend import LOCAL_BACKEND
+from ludwig.data.cache.manager import FileFeatureCache
+from ludwig.features.audio_feature import AudioFeatureMixin
+
+SAMPLING_RATE_IN_HZ = 16000
+AUDIO_FEATURE_DICT = {
+    'type': 'fbank',
+    'window_length_in_s': 0.04,
+    'window_shift_in_s': 0.02,
+    'num_filter_bands': 20
+}
+
+
+@pytest.fixture
+def audio_column(tmpdir):
+    import soundfile
+
+    paths = []
+    for i in range(6):
+        path = os.path.join(tmpdir, f'audio_{i}.wav')
+        audio = np.random.uniform(-1, 1, SAMPLING_RATE_IN_HZ * (i % 3 + 1))
+        soundfile.write(path, audio, SAMPLING_RATE_IN_HZ)
+        paths.append(path)
+    return pd.Series(paths)
+
+
+def _process(audio_column, num_processes=1, feature_cache=None):
+    return AudioFeatureMixin._process_in_memory(
+        audio_column,
+        None,
+        AUDIO_FEATURE_DICT,
+        feature_dim=20,
+        max_length=120,
+        padding_value=0,
+        normalization_type='per_file',
+        audio_file_length_limit_in_s=2.0,
+        backend=LOCAL_BACKEND,
+        num_processes=num_processes,
+        feature_cache=feature_cache
+    )
+
+
+def test_process_in_memory_cache(audio_column, tmpdir, monkeypatch):
+    expected_audio, expected_stats = _process(audio_column)
+    assert expected_stats['count'] == 6
+    assert expected_stats['cropped'] == 2
+
+    feature_cache = FileFeatureCache(os.path.join(tmpdir, 'cache'))
+    audio, stats = _process(
+        audio_column, num_processes=2, feature_cache=feature_cache
+    )
+    assert stats == expected_stats
+    assert np.array_equal(np.stack(audio), np.stack(expected_audio))
+    assert len(os.listdir(feature_cache.cache_dir)) == 6
+
+    # the cached features are used without reading the audio files
+    def read_audio(filepath):
+        raise AssertionError('the audio file should not be read')
+
+    monkeypatch.setattr(AudioFeatureMixin, '_read_audio', read_audio)
+    audio, stats = _process(audio_column, feature_cache=feature_cache)
+    assert stats == expected_stats
+    assert np.array_equal(np.stack(audio), np.stack(expected_audio))
+
+
+@pytest.mark.parametrize('feature_type', ['raw', 'stft', 'fbank'])
+def test_process_in_memory_batches(audio_column, feature_type):
+    import soundfile
+
+    audio_feature_dict = {**AUDIO_FEATURE_DICT, 'type': feature_type}
+    feature_dim = AudioFeatureMixin._get_feature_dim(audio_feature_dict,
+                                                     SAMPLING_RATE_IN_HZ)
+    max_length = AudioFeatureMixin._get_max_length_feature(
+        audio_feature_dict, SAMPLING_RATE_IN_HZ, 2.0
+    )
+    audio, _ = AudioFeatureMixin._process_in_memory(
+        audio_column,
+        None,
+        audio_feature_dict,
+        feature_dim=feature_dim,
+        max_length=max_length,
+        padding_value=0,
+        normalization_type=None,
+        audio_file_length_limit_in_s=2.0,
+        backend=LOCAL_BACKEND
+    )
+
+    # the files of different lengths featurized together match the files
+    # featurized one by one
+    for path, audio_feature in zip(audio_column, audio):
+        expected = AudioFeatureMixin._transform_to_feature(
+            *soundfile.read(path),
+            audio_feature_dict,
+            feature_dim,
+            max_length,
+            padding_value=0,
+            normalization_type=None
+        )
+        assert np.allclose(audio_feature, expected, rtol=1e-4, atol=1e-4)
+
+
+def test_file_feature_cache_key(audio_column, tmpdir):
+    feature_cache = FileFeatureCache(os.path.join(tmpdir, 'cache'))
+    path = audio_column[0]
+
+    key = feature_cache.get_key(path, AUDIO_FEATURE_DICT)
+    assert key == feature_cache.get_key(path, dict(AUDIO_FEATURE_DICT))
+    assert key != feature_cache.get_key(
+        path, {**AUDIO_FEATURE_DICT, 'num_filter_bands': 40}
+    )
+    assert feature_cache.get_key(
+        os.path.join(tmpdir, 'missing.wav'), AUDIO_FEATURE_DICT
+    ) is None
+
+    assert feature_cache.get(key) is None
+    feature_cache.put(key, {'audio_feature': np.ones((3, 2))})
+    assert np.array_equal(feature_cache.get(key)['audio_feature'],
+                          np.ones((3, 2)))
+
+    # modifying the file invalidates its entries
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert feature_cache.get_key(path, AUDIO_FEATURE_DICT) != key
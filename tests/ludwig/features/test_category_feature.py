@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from types import SimpleNamespace
+
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.backend import LOCAL_BACKEND
+from ludwig.backend.dask import DaskBackend
+from ludwig.features.category_feature import CategoryFeatureMixin, \
+    CategoryOutputFeature
+
+METADATA = {
+    'idx2str': ['<UNK>', 'a', 'b', 'c'],
+    'str2idx': {'<UNK>': 0, 'a': 1, 'b': 2, 'c': 3},
+    'vocab_size': 4,
+}
+
+
+def _get_backend(df, use_dask):
+    if use_dask:
+        return dd.from_pandas(df, npartitions=2), DaskBackend()
+    return df, LOCAL_BACKEND
+
+
+@pytest.mark.parametrize('use_dask', [False, True], ids=['pandas', 'dask'])
+def test_feature_data(use_dask):
+    df = pd.DataFrame({'cat': [' a', 'b ', 'c', 'd', '<UNK>', 'a']})
+    df, backend = _get_backend(df, use_dask)
+
+    encoded = backend.df_engine.compute(CategoryFeatureMixin.feature_data(
+        df['cat'], METADATA, backend
+    ))
+    assert encoded.dtype == np.int8
+    assert encoded.tolist() == [1, 2, 3, 0, 0, 1]
+
+
+@pytest.mark.parametrize('use_dask', [False, True], ids=['pandas', 'dask'])
+def test_postprocess_predictions(use_dask):
+    probabilities = np.random.dirichlet(np.ones(4), size=6)
+    df = pd.DataFrame({
+        'cat_predictions': probabilities.argmax(axis=1),
+        'cat_probabilities': list(probabilities),
+        'cat_predictions_top_k': list(np.argsort(-probabilities)[:, :2]),
+    })
+    df, backend = _get_backend(df, use_dask)
+
+    output_feature = SimpleNamespace(feature_name='cat')
+    predictions = backend.df_engine.compute(
+        CategoryOutputFeature.postprocess_predictions(
+            output_feature, df, METADATA, '', backend
+        )
+    )
+
+    idx2str = np.array(METADATA['idx2str'])
+    assert predictions['cat_predictions'].tolist() == \
+           idx2str[probabilities.argmax(axis=1)].tolist()
+    assert predictions['cat_probabilities'].tolist() == probabilities.tolist()
+    assert np.allclose(predictions['cat_probability'],
+                       probabilities.max(axis=1))
+    for i, label in enumerate(METADATA['idx2str']):
+        assert np.allclose(predictions[f'cat_probabilities_{label}'],
+                           probabilities[:, i])
+    assert predictions['cat_predictions_top_k'].tolist() == \
+           idx2str[np.argsort(-probabilities)[:, :2]].tolist()
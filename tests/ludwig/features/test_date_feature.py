@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.backend import LOCAL_BACKEND
+from ludwig.backend.dask import DaskBackend
+from ludwig.constants import COLUMN, PROC_COLUMN
+from ludwig.features.date_feature import DateFeatureMixin
+
+PREPROCESSING_PARAMETERS = {
+    'fill_value': '2000-01-01 00:30:00',
+    'datetime_format': None
+}
+
+
+@pytest.mark.parametrize('datetime_format', [
+    None, '%d/%m/%y %H:%M:%S', '%Y-%m-%dT%H:%M:%S%z'
+])
+def test_dates_to_matrix(datetime_format):
+    # dates with different timezone offsets cannot be parsed all at once
+    dates = pd.date_range('1990-01-01', periods=100, freq='37h13min7s',
+                          tz='Europe/Rome')
+    column = pd.Series(
+        dates.strftime(datetime_format or '%Y-%m-%d %H:%M:%S').tolist() +
+        ['not a date', None]
+    )
+
+    matrix = DateFeatureMixin.dates_to_matrix(
+        column, datetime_format, PREPROCESSING_PARAMETERS
+    )
+    expected = np.array([
+        DateFeatureMixin.date_to_list(
+            date_str, datetime_format, PREPROCESSING_PARAMETERS
+        )
+        for date_str in column
+    ], dtype=np.int16)
+    assert np.array_equal(matrix, expected)
+
+
+@pytest.mark.parametrize('datetime_format', [None, '%Y-%m-%d %H:%M:%S'])
+def test_dates_to_matrix_out_of_bounds(datetime_format):
+    # valid dates outside of the range of pandas timestamps
+    column = pd.Series([
+        '2500-03-10 07:35:11', '2021-03-04 05:06:07', '1500-01-02 00:00:00',
+        'not a date'
+    ])
+
+    matrix = DateFeatureMixin.dates_to_matrix(
+        column, datetime_format, PREPROCESSING_PARAMETERS
+    )
+    assert matrix.tolist() == [
+        [2500, 3, 10, 2, 69, 7, 35, 11, 27311],
+        [2021, 3, 4, 3, 63, 5, 6, 7, 18367],
+        [1500, 1, 2, 1, 2, 0, 0, 0, 0],
+        [2000, 1, 1, 5, 1, 0, 30, 0, 1800],
+    ]
+
+
+@pytest.mark.parametrize('use_dask', [False, True], ids=['pandas', 'dask'])
+def test_add_feature_data(use_dask):
+    df = pd.DataFrame({'date': ['2021-03-04 05:06:07', 'not a date'] * 5})
+    backend = LOCAL_BACKEND
+    if use_dask:
+        df = dd.from_pandas(df, npartitions=3)
+        backend = DaskBackend()
+
+    feature = {COLUMN: 'date', PROC_COLUMN: 'date_proc'}
+    proc_df = DateFeatureMixin.add_feature_data(
+        feature, df, {}, {}, PREPROCESSING_PARAMETERS, backend, True
+    )
+    dates = np.stack(backend.df_engine.compute(proc_df['date_proc']))
+    assert dates.tolist() == [
+        [2021, 3, 4, 3, 63, 5, 6, 7, 18367],
+        [2000, 1, 1, 5, 1, 0, 30, 0, 1800],
+    ] * 5
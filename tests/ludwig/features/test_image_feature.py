@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import h5py
+import numpy as np
+import pytest
+
+from ludwig.features import image_feature
+from ludwig.features.image_feature import ImageFeatureMixin
+
+
+@pytest.mark.parametrize('block_images', [1, 3, 10, 100])
+def test_write_images_to_h5(block_images, tmpdir, monkeypatch):
+    image_shape = (4, 5, 3)
+    monkeypatch.setattr(
+        image_feature,
+        'IMAGE_WRITE_BLOCK_BYTES',
+        block_images * int(np.prod(image_shape))
+    )
+    images = np.random.randint(
+        0, 256, size=(10,) + image_shape, dtype=np.uint8
+    )
+
+    with h5py.File(tmpdir.join('images.hdf5'), 'w') as h5_file:
+        image_dataset = h5_file.create_dataset(
+            'images', images.shape, dtype=np.uint8
+        )
+        ImageFeatureMixin._write_images_to_h5(image_dataset, iter(images))
+        assert np.array_equal(image_dataset[:], images)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.backend import LOCAL_BACKEND
+from ludwig.features.category_feature import CategoryFeatureMixin
+from ludwig.features.meta_accumulators import (NumericStatsAccumulator,
+                                               compute_numeric_stats)
+from ludwig.features.sequence_feature import SequenceFeatureMixin
+
+
+def _chunks(column, chunk_size):
+    return [column[i:i + chunk_size] for i in range(0, len(column), chunk_size)]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 100])
+def test_numeric_stats_accumulator(chunk_size):
+    column = pd.Series(np.random.RandomState(0).normal(1e6, 3, size=53))
+    accumulator = NumericStatsAccumulator()
+    for chunk in _chunks(column, chunk_size):
+        accumulator.update(chunk)
+
+    stats = accumulator.finalize()
+    assert stats['count'] == len(column)
+    assert np.isclose(stats['mean'], column.mean())
+    assert np.isclose(stats['std'], column.std())
+    assert stats['min'] == column.min()
+    assert stats['max'] == column.max()
+
+
+@pytest.mark.parametrize('mixin', [CategoryFeatureMixin, SequenceFeatureMixin])
+def test_vocabulary_accumulator_chunks(mixin):
+    # distinct counts, so that the order of the vocabulary has no ties
+    column = pd.Series(
+        ['a b'] * 9 + ['c'] * 5 + ['b c d'] * 2 + ['a'] * 3
+    ).sample(frac=1, random_state=1).reset_index(drop=True)
+    preprocessing_parameters = dict(mixin.preprocessing_defaults)
+
+    expected = mixin.get_feature_meta(
+        column, preprocessing_parameters, LOCAL_BACKEND
+    )
+    expected.pop('tokens', None)
+
+    accumulator = mixin.get_meta_accumulator(
+        preprocessing_parameters, LOCAL_BACKEND
+    )
+    for chunk in _chunks(column, 4):
+        accumulator.update(chunk)
+    assert accumulator.finalize() == expected
+
+
+@pytest.mark.parametrize('mixin', [CategoryFeatureMixin, SequenceFeatureMixin])
+def test_vocabulary_accumulator_merge(mixin):
+    column = pd.Series(['a b'] * 9 + ['c'] * 5 + ['b c d'] * 2 + ['a'] * 3)
+    preprocessing_parameters = dict(mixin.preprocessing_defaults)
+
+    def accumulate(chunks):
+        accumulator = mixin.get_meta_accumulator(
+            preprocessing_parameters, LOCAL_BACKEND
+        )
+        for chunk in chunks:
+            accumulator.update(chunk)
+        return accumulator
+
+    accumulator = accumulate([column[:6]])
+    accumulator.finalize()
+    # accumulators keep being updated after being finalized
+    accumulator.update(column[6:12])
+    accumulator.merge(accumulate([column[12:]]))
+    assert accumulator.finalize() == accumulate([column]).finalize()
+
+
+def test_numeric_stats_accumulator_merge():
+    column = pd.Series(np.random.RandomState(0).normal(5, 3, size=40))
+    accumulators = []
+    for chunk in _chunks(column, 9):
+        accumulators.append(NumericStatsAccumulator())
+        accumulators[-1].update(chunk)
+    # merging an empty accumulator leaves the statistics unchanged
+    accumulators.append(NumericStatsAccumulator())
+
+    accumulator = accumulators[0]
+    for other in accumulators[1:]:
+        accumulator.merge(other)
+
+    expected = NumericStatsAccumulator()
+    expected.update(column)
+    assert accumulator.finalize() == pytest.approx(expected.finalize())
+
+
+@pytest.mark.parametrize('block_size', [1, 2 ** 24])
+def test_compute_numeric_stats(block_size):
+    rs = np.random.RandomState(0)
+    columns = {
+        'normal': pd.Series(rs.normal(1e3, 3, size=50), dtype=np.float32),
+        'missing': pd.Series([np.nan, 1.0, np.nan, 4.0] * 12 + [2.0, 3.0]),
+        'empty': pd.Series([np.nan] * 50),
+    }
+
+    stats = compute_numeric_stats(columns, block_size=block_size)
+    for name, column in columns.items():
+        expected = NumericStatsAccumulator()
+        expected.update(column.dropna())
+        assert stats[name].finalize() == pytest.approx(
+            expected.finalize(), nan_ok=True, rel=1e-6
+        )
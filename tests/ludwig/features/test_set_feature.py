@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.backend import LOCAL_BACKEND
+from ludwig.backend.dask import DaskBackend
+from ludwig.features.bag_feature import BagFeatureMixin
+from ludwig.features.set_feature import SetFeatureMixin
+
+COLUMN = pd.Series(['a b', 'c a c', 'd'])
+
+
+def _feature_data(mixin):
+    preprocessing_parameters = dict(mixin.preprocessing_defaults)
+    metadata = mixin.get_feature_meta(
+        COLUMN, preprocessing_parameters, LOCAL_BACKEND
+    )
+    metadata.pop('tokens')
+    data = mixin.feature_data(
+        COLUMN, metadata, preprocessing_parameters, LOCAL_BACKEND
+    )
+    return metadata, np.stack(data.to_numpy())
+
+
+def test_set_feature_data():
+    metadata, data = _feature_data(SetFeatureMixin)
+    str2idx = metadata['str2idx']
+
+    assert metadata['max_set_size'] == 3
+    assert data.dtype == np.int8
+    # sorted unique indices of the elements, padded with 0
+    assert data.tolist() == [
+        sorted([str2idx['a'], str2idx['b']]) + [0],
+        sorted([str2idx['a'], str2idx['c']]) + [0],
+        [str2idx['d'], 0, 0],
+    ]
+
+
+def test_bag_feature_data():
+    metadata, data = _feature_data(BagFeatureMixin)
+    str2idx = metadata['str2idx']
+
+    assert data.dtype == np.int8
+    # sorted indices of the units repeated by their count, padded with 0
+    assert data.tolist() == [
+        sorted([str2idx['a'], str2idx['b']]) + [0],
+        sorted([str2idx['a'], str2idx['c'], str2idx['c']]),
+        [str2idx['d'], 0, 0],
+    ]
+
+
+@pytest.mark.parametrize('use_dask', [False, True], ids=['pandas', 'dask'])
+@pytest.mark.parametrize('mixin', [SetFeatureMixin, BagFeatureMixin])
+def test_feature_data_longer_rows(mixin, use_dask):
+    metadata, _ = _feature_data(mixin)
+    str2idx = metadata['str2idx']
+
+    # rows with more elements than the rows the metadata was built from
+    column = pd.Series(['a b c d e', 'd', 'b a'])
+    backend = LOCAL_BACKEND
+    if use_dask:
+        column = dd.from_pandas(column, npartitions=2)
+        backend = DaskBackend()
+    data = backend.df_engine.compute(mixin.feature_data(
+        column, metadata, dict(mixin.preprocessing_defaults), backend
+    ))
+    data = np.stack(data.to_numpy())
+
+    # none of the elements are dropped, the unknown one included
+    assert data.tolist() == [
+        sorted([str2idx[u] for u in ['a', 'b', 'c', 'd', '<UNK>']]),
+        [str2idx['d'], 0, 0, 0, 0],
+        sorted([str2idx['a'], str2idx['b']]) + [0, 0, 0],
+    ]
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.backend import LOCAL_BACKEND
+from ludwig.backend.dask import DaskBackend
+from ludwig.constants import COLUMN, NAME, PROC_COLUMN
+from ludwig.features.timeseries_feature import TimeseriesFeatureMixin
+
+TIMESERIES = ['1 2.5 3', '-4', '', '5 6 7 8 9', ' 0.5  1.5 ']
+
+
+@pytest.mark.parametrize('padding', ['right', 'left'])
+@pytest.mark.parametrize('tokenizer', ['space', 'comma'])
+def test_timeseries_to_matrix(tokenizer, padding):
+    column = pd.Series(TIMESERIES)
+    if tokenizer == 'comma':
+        column = column.str.strip().str.replace(' +', ',', regex=True)
+        # the comma tokenizer cannot parse empty strings
+        column[2] = '0'
+
+    matrix = TimeseriesFeatureMixin.timeseries_to_matrix(
+        column, tokenizer, 4, -1, padding
+    )
+    assert matrix.dtype == np.float32
+
+    expected = [[1, 2.5, 3], [-4], [], [5, 6, 7, 8], [0.5, 1.5]]
+    if tokenizer == 'comma':
+        expected[2] = [0]
+    for row, values in zip(matrix, expected):
+        padding_values = [-1] * (4 - len(values))
+        if padding == 'right':
+            assert row.tolist() == values + padding_values
+        else:
+            assert row.tolist() == padding_values + values
+
+
+def test_timeseries_to_matrix_lists():
+    column = pd.Series([[1.0, 2.0], np.array([3, 4, 5]), '6 7', 8.0])
+    matrix = TimeseriesFeatureMixin.timeseries_to_matrix(
+        column, 'space', 3, 0, 'right'
+    )
+    assert matrix.tolist() == [[1, 2, 0], [3, 4, 5], [6, 7, 0], [8, 0, 0]]
+
+
+@pytest.mark.parametrize('use_dask', [False, True], ids=['pandas', 'dask'])
+def test_add_feature_data(use_dask):
+    df = pd.DataFrame({'timeseries': TIMESERIES * 3})
+    backend = LOCAL_BACKEND
+    if use_dask:
+        df = dd.from_pandas(df, npartitions=3)
+        backend = DaskBackend()
+
+    feature = {
+        NAME: 'timeseries',
+        COLUMN: 'timeseries',
+        PROC_COLUMN: 'timeseries_proc'
+    }
+    preprocessing_parameters = dict(
+        TimeseriesFeatureMixin.preprocessing_defaults
+    )
+    metadata = TimeseriesFeatureMixin.get_feature_meta(
+        df['timeseries'], preprocessing_parameters, backend
+    )
+    assert metadata == {'max_timeseries_length': 5}
+
+    proc_df = TimeseriesFeatureMixin.add_feature_data(
+        feature, df, {}, {'timeseries': metadata}, preprocessing_parameters,
+        backend, True
+    )
+    matrix = np.stack(backend.df_engine.compute(proc_df['timeseries_proc']))
+    assert matrix.tolist() == [
+        [1, 2.5, 3, 0, 0],
+        [-4, 0, 0, 0, 0],
+        [0, 0, 0, 0, 0],
+        [5, 6, 7, 8, 9],
+        [0.5, 1.5, 0, 0, 0],
+    ] * 3
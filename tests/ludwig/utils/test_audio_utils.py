@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import pytest
+
+from ludwig.utils.audio_utils import get_batch_features, get_fbank, \
+    get_group_delay, get_phase_stft_magnitude, get_stft_magnitude, \
+    _preprocess_to_padded_matrix
+
+SAMPLING_RATE_IN_HZ = 16000
+
+
+def test_preprocess_to_padded_matrix():
+    data = np.arange(1, 11, dtype=np.float64)
+    frames, lengths = _preprocess_to_padded_matrix([data, data[:3]], 4, 3)
+    assert lengths.tolist() == [3, 1]
+    assert frames.tolist() == [
+        [1, 2, 3, 4],
+        [4, 5, 6, 7],
+        [7, 8, 9, 10],
+        [1, 2, 3, 0],
+    ]
+
+    frames, _ = _preprocess_to_padded_matrix([data[:9]], 4, 3,
+                                             zero_mean_offset=True)
+    # the last frame is padded after subtracting the mean of its data
+    assert frames.tolist() == [
+        [-1.5, -0.5, 0.5, 1.5],
+        [-1.5, -0.5, 0.5, 1.5],
+        [-1, 0, 1, 0],
+    ]
+
+
+@pytest.mark.parametrize('feature_type, get_feature', [
+    ('stft', get_stft_magnitude),
+    ('stft_phase', get_phase_stft_magnitude),
+    ('group_delay', get_group_delay),
+    ('fbank', lambda *args: get_fbank(*args, 20)),
+])
+def test_get_batch_features(feature_type, get_feature):
+    raw_data_list = [
+        np.random.uniform(-1, 1, length)
+        for length in [16000, 12345, 640, 100]
+    ]
+    features, lengths = get_batch_features(
+        raw_data_list, feature_type, SAMPLING_RATE_IN_HZ, 0.04, 0.02, 1024,
+        'hamming', num_filter_bands=20, max_length=40, padding_value=-1
+    )
+    assert features.dtype == np.float32
+    assert lengths.tolist() == [49, 38, 1, 0]
+
+    for raw_data, feature, length in zip(raw_data_list, features, lengths):
+        expected = np.transpose(get_feature(
+            raw_data, SAMPLING_RATE_IN_HZ, 0.04, 0.02, 1024, 'hamming'
+        ))
+        assert expected.shape[0] == length
+        length = min(length, 40)
+        assert features.shape[2] == expected.shape[1]
+        assert np.allclose(feature[:length], expected[:length], atol=1e-5)
+        assert (feature[length:] == -1).all()
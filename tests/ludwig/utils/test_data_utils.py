@@ -13,9 +13,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import os
+from unittest import mock
+
+import dask.dataframe as dd
+import numpy as np
 import pandas as pd
+import pytest
 
-from ludwig.utils.data_utils import add_sequence_feature_column
+from ludwig.backend import LOCAL_BACKEND
+from ludwig.backend.dask import DaskBackend
+from ludwig.data.dataframe.tensor import TensorArray, TensorDtype
+from ludwig.utils import data_utils
+from ludwig.utils.data_utils import (add_sequence_feature_column,
+                                     clear_data_cache, flatten_df,
+                                     from_numpy_dataset,
+                                     load_pretrained_embeddings,
+                                     to_numpy_dataset)
 
 
 def test_add_sequence_feature_column():
@@ -53,3 +67,96 @@ def test_add_sequence_feature_column():
 
     add_sequence_feature_column(df, 'y', 2)
     assert df.equals(pd.DataFrame([1, 2, 3, 4, 5], columns=['x']))
+
+
+def test_load_pretrained_embeddings(tmpdir):
+    embeddings_fp = os.path.join(tmpdir, 'glove.txt')
+    with open(embeddings_fp, 'w') as f:
+        f.write('a 1.0 2.0 3.0\n')
+        f.write('malformed 1.0\n')
+        f.write('b 4.0 5.0 6.0\n')
+        f.write('a 7.0 8.0 9.0\n')
+
+    clear_data_cache()
+    matrix = load_pretrained_embeddings(embeddings_fp, ['<UNK>', 'a', 'b'])
+    assert os.path.isdir(embeddings_fp + '.npy')
+    assert matrix[1:].tolist() == [[7.0, 8.0, 9.0], [4.0, 5.0, 6.0]]
+    # missing words are initialized close to the average embedding
+    assert np.allclose(matrix[0], [5.5, 6.5, 7.5], atol=0.01)
+
+    # later processes read the binary store instead of the text file
+    clear_data_cache()
+    with mock.patch.object(data_utils, '_save_embeddings_store') as save:
+        assert np.array_equal(
+            load_pretrained_embeddings(embeddings_fp, ['b', 'a']),
+            matrix[[2, 1]]
+        )
+    save.assert_not_called()
+
+    # a new store is created next to the previous one when the file changes,
+    # which is then removed
+    store_versions = os.listdir(embeddings_fp + '.npy')
+    assert len(store_versions) == 1
+    with open(embeddings_fp, 'a') as f:
+        f.write('c 0.0 0.0 0.0\n')
+    clear_data_cache()
+    assert load_pretrained_embeddings(embeddings_fp, ['c']).tolist() == [
+        [0.0, 0.0, 0.0]
+    ]
+    new_store_versions = os.listdir(embeddings_fp + '.npy')
+    assert len(new_store_versions) == 1
+    assert new_store_versions != store_versions
+    clear_data_cache()
+
+
+def test_load_pretrained_embeddings_no_valid_line(tmpdir):
+    embeddings_fp = os.path.join(tmpdir, 'glove.txt')
+    with open(embeddings_fp, 'w') as f:
+        f.write('\n')
+        f.write('a b c\n')
+        f.write('d 1.0\n')
+
+    clear_data_cache()
+    with pytest.raises(ValueError, match='does not contain any valid'):
+        load_pretrained_embeddings(embeddings_fp, ['a'])
+    # no partial store is left behind
+    assert os.listdir(embeddings_fp + '.npy') == []
+    clear_data_cache()
+
+
+@pytest.mark.parametrize('backend', [LOCAL_BACKEND, DaskBackend()])
+def test_flatten_df(backend):
+    df = pd.DataFrame({
+        'scalar': np.arange(4),
+        'vector': [np.ones(3)] * 4,
+        'matrix': [np.arange(6).reshape(2, 3)] * 4,
+        'tensor': TensorArray(np.arange(24).reshape(4, 2, 3)),
+    })
+    if backend.df_engine.partitioned:
+        df = dd.from_pandas(df, npartitions=2)
+
+    df, column_shapes = flatten_df(df, backend)
+    assert column_shapes == {'matrix': (2, 3), 'tensor': (2, 3)}
+    df = backend.df_engine.compute(df)
+    assert df['matrix'][0].tolist() == list(range(6))
+    assert df['tensor'][1].tolist() == list(range(6, 12))
+    assert df['vector'][0].tolist() == [1, 1, 1]
+
+
+def test_numpy_dataset_tensor_columns():
+    dataset = {
+        'scalar': np.arange(4, dtype=np.float32),
+        'matrix': np.arange(24, dtype=np.float32).reshape(4, 3, 2),
+    }
+    df = from_numpy_dataset(dataset)
+    assert df['scalar'].dtype == np.float32
+    # arrays of dimension 2 and more are not unstacked
+    assert df['matrix'].dtype == TensorDtype(np.float32)
+    assert np.array_equal(df['matrix'][1], dataset['matrix'][1])
+
+    numpy_dataset = to_numpy_dataset(df)
+    assert numpy_dataset['matrix'] is dataset['matrix']
+    assert np.array_equal(numpy_dataset['scalar'], dataset['scalar'])
+
+    numpy_dataset = to_numpy_dataset(df.iloc[[3, 1]])
+    assert np.array_equal(numpy_dataset['matrix'], dataset['matrix'][[3, 1]])
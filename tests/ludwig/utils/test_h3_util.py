@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+
+from ludwig.data.dataset_synthesizer import generate_h3
+from ludwig.utils.h3_util import h3_to_components, h3_to_components_matrix
+
+
+def test_h3_to_components_matrix():
+    h3_values = [generate_h3({}) for _ in range(100)] + [
+        576495936675512319,  # resolution 0
+        622236723497533439,
+    ]
+
+    matrix = h3_to_components_matrix(np.array(h3_values, dtype=np.int64))
+    assert matrix.shape == (len(h3_values), 19)
+    assert matrix.dtype == np.uint8
+
+    for h3_value, row in zip(h3_values, matrix):
+        components = h3_to_components(h3_value)
+        cells = components['cells'] + [7] * (15 - len(components['cells']))
+        assert row.tolist() == [
+            components['mode'],
+            components['edge'],
+            components['resolution'],
+            components['base_cell'],
+        ] + cells
@@ -17,7 +17,8 @@ import numpy as np
 import pytest
 
 from ludwig.utils.data_utils import get_abs_path
-from ludwig.utils.image_utils import num_channels_in_image
+from ludwig.utils.image_utils import num_channels_in_image, read_image, \
+    read_images, read_jpeg_draft
 
 image_2d = np.random.randint(0, 1, (10, 10))
 image_3d = np.random.randint(0, 1, (10, 10, 3))
@@ -35,3 +36,44 @@ def test_num_channels_in_image():
 def test_get_abs_path():
     assert get_abs_path('a', 'b.jpg') == 'a/b.jpg'
     assert get_abs_path(None, 'b.jpg') == 'b.jpg'
+
+
+@pytest.mark.parametrize('mode', ['L', 'RGB'])
+def test_read_jpeg_draft(mode, tmpdir):
+    from PIL import Image
+
+    img_path = str(tmpdir.join('image.jpg'))
+    Image.new(mode, (320, 240), color=128).save(img_path)
+
+    # the image is decoded at full scale if it is not larger than size
+    full_img = read_image(img_path)
+    assert np.array_equal(read_jpeg_draft(img_path, (240, 320)), full_img)
+    assert np.array_equal(read_image(img_path, (300, 400)), full_img)
+
+    # and at the smallest scale still larger than size otherwise
+    draft_img = read_image(img_path, (50, 70))
+    assert draft_img.shape[:2] == (60, 80)
+    assert draft_img.ndim == full_img.ndim
+    with open(img_path, 'rb') as f:
+        assert np.array_equal(read_jpeg_draft(f.read(), (50, 70)), draft_img)
+
+    png_path = str(tmpdir.join('image.png'))
+    Image.new(mode, (320, 240)).save(png_path)
+    assert read_jpeg_draft(png_path, (50, 70)) is None
+    assert read_image(png_path, (50, 70)).shape[:2] == (240, 320)
+
+
+@pytest.mark.parametrize('num_threads', [1, 4])
+def test_read_images(num_threads):
+    img_entries = [np.full((4, 5, 3), i, dtype=np.uint8) for i in range(10)]
+    images = read_images(
+        img_entries, lambda img: img + 1, (4, 5, 3), num_threads=num_threads
+    )
+    assert images.dtype == np.uint8
+    assert np.array_equal(images, np.stack(img_entries) + 1)
+
+    def fail(img):
+        raise ValueError('invalid image')
+
+    with pytest.raises(ValueError):
+        read_images(img_entries, fail, (4, 5, 3), num_threads=num_threads)
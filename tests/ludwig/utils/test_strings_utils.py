@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021 Uber Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.utils import strings_utils
+from ludwig.utils.strings_utils import (build_sequence_matrix,
+                                        create_vocabulary, tokenize)
+
+
+def test_shared_tokens():
+    column = pd.Series(['Hello world', 'hello there world', 'bye'])
+
+    expected_vocab = create_vocabulary(column, 'space')
+    expected_matrix = build_sequence_matrix(
+        column,
+        expected_vocab[1],
+        'space',
+        length_limit=4,
+        padding_symbol=expected_vocab[5],
+    )
+
+    tokens = tokenize(column, 'space')
+    assert tokens.tolist() == [['hello', 'world'],
+                               ['hello', 'there', 'world'],
+                               ['bye']]
+
+    # the tokens are not recomputed when they are provided
+    with mock.patch.object(strings_utils, 'tokenize') as tokenize_mock:
+        vocab = create_vocabulary(column, 'space', tokens=tokens)
+        matrix = build_sequence_matrix(
+            column,
+            vocab[1],
+            'space',
+            length_limit=4,
+            padding_symbol=vocab[5],
+            tokens=tokens
+        )
+    tokenize_mock.assert_not_called()
+
+    assert vocab == expected_vocab
+    assert np.array_equal(np.stack(matrix), np.stack(expected_matrix))
+
+
+def test_tokenize_num_processes():
+    column = pd.Series(
+        ['Hello world', 'hello there world', 'bye', 'Good Bye', ''] * 10,
+        index=range(100, 150),
+        name='text'
+    )
+
+    expected = tokenize(column, 'space_punct', lowercase=False)
+    tokens = tokenize(column, 'space_punct', lowercase=False, num_processes=2)
+
+    assert tokens.index.equals(column.index)
+    assert tokens.tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize('padding', ['right', 'left'])
+def test_build_sequence_matrix_num_processes(padding):
+    column = pd.Series(
+        ['Hello world', 'hello there world', 'bye', 'Good Bye', ''] * 10,
+        index=range(100, 150),
+        name='text'
+    )
+    vocab = create_vocabulary(column[:3], 'space')
+
+    def build(num_processes):
+        return build_sequence_matrix(
+            column,
+            vocab[1],
+            'space',
+            length_limit=2,
+            padding_symbol=vocab[5],
+            padding=padding,
+            num_processes=num_processes
+        )
+
+    expected = build(1)
+    matrix = build(2)
+    assert matrix.index.equals(column.index)
+    assert matrix.name == 'text'
+    assert np.array_equal(np.stack(matrix), np.stack(expected))
+    # the units are truncated to length_limit and the unknown ones mapped
+    unk = vocab[1][strings_utils.UNKNOWN_SYMBOL]
+    pad = vocab[1][vocab[5]]
+    hello, there = vocab[1]['hello'], vocab[1]['there']
+    assert matrix[101].tolist() == [hello, there]
+    assert matrix[103].tolist() == [unk, vocab[1]['bye']]
+    assert matrix[102].tolist() == (
+        [vocab[1]['bye'], pad] if padding == 'right' else [pad, vocab[1]['bye']]
+    )
@@ -17,8 +17,10 @@
 import contextlib
 from unittest.mock import Mock, patch
 
+import numpy as np
+
 from ludwig.utils.tf_utils import initialize_tensorflow, _get_tf_init_params, \
-    _set_tf_init_params
+    _set_tf_init_params, padded_indices_to_sparse, padded_indices_to_multi_hot
 
 
 @contextlib.contextmanager
@@ -141,3 +143,21 @@ def test_initialize_tensorflow_with_horovod_explicit_gpus(mock_tf_config):
         initialize_tensorflow(gpus='-1', horovod=mock_hvd)
 
     mock_tf_config.set_visible_devices.assert_called_with([], 'GPU')
+
+
+def test_padded_indices():
+    padded_indices = np.array([[3, 1, 1], [0, 0, 0], [2, 0, 0]],
+                              dtype=np.int16)
+
+    sparse_indices = padded_indices_to_sparse(padded_indices)
+    assert sparse_indices.indices.numpy().tolist() == [[0, 0], [0, 1], [0, 2],
+                                                       [2, 0]]
+    assert sparse_indices.values.numpy().tolist() == [3, 1, 1, 2]
+    assert sparse_indices.dense_shape.numpy().tolist() == [3, 3]
+
+    multi_hot = padded_indices_to_multi_hot(padded_indices, 5)
+    assert multi_hot.numpy().tolist() == [
+        [False, True, False, True, False],
+        [False, False, False, False, False],
+        [False, False, True, False, False],
+    ]